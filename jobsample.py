@@ -2,10 +2,11 @@
 import sys
 import random
 
-from   threading import Event
+from   itertools import count
 from   time      import sleep
 
 from   moxie.scheduler import JobQueue
+from   moxie.scheduler import FastSignal
 from   moxie.scheduler import JobSystem
 from   moxie.scheduler import JobContext
 from   moxie.scheduler import JobSubmitType
@@ -14,8 +15,20 @@ from   moxie.scheduler import JobSystemThread
 
 """
 Provides a simple example showing how to initialize a `JobSystem`, submit some work, and wait for it to complete.
+Run with `--bench` to skip the simulated work in `print_job`, so that the run time is dominated by the scheduler.
 """
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+BENCH      : bool = '--bench' in sys.argv
+DELAY_COUNT: int  = 1 << 16 # Must be a power of two
+# Simulated job durations between 0 and 1 seconds, drawn once up front so print_job doesn't pay for the RNG per call.
+DELAYS            = np.random.default_rng().random(DELAY_COUNT) if np is not None else [random.random() for _ in range(DELAY_COUNT)]
+DELAY_INDEX       = count() # next() on itertools.count is atomic under the GIL
+
 def print_job(job: int, jobctx: JobContext, name: str) -> int:
     """
     Print a simple message to stdout and return.
@@ -31,7 +44,8 @@ def print_job(job: int, jobctx: JobContext, name: str) -> int:
         Zero on success, or non-zero otherwise.
     """
     print(f'Running print_job {name} on thread {jobctx.thread_id}.')
-    sleep(random.random()) # Sleep between 0 and 1 seconds
+    if not BENCH:
+        sleep(DELAYS[next(DELAY_INDEX) & (DELAY_COUNT - 1)]) # Sleep between 0 and 1 seconds
     return 0
 
 def spawn_work_job(job: int, jobctx: JobContext) -> int:
@@ -51,27 +65,24 @@ def spawn_work_job(job: int, jobctx: JobContext) -> int:
         Zero on success, or non-zero otherwise.
     """
     print(f'Running spawn_work_job on thread {jobctx.thread_id}.')
-    a: int = jobctx.create_job(callable=print_job, parent=job, name='A')
-    b: int = jobctx.create_job(callable=print_job, parent=job, name='B')
-    c: int = jobctx.create_job(callable=print_job, parent=job, name='C')
-    # B and C must complete before A can run, but B and C can run in parallel.
-    res_a: JobSubmitResult = jobctx.submit_job(a, JobSubmitType.RUN, dependencies=[b, c])
-    res_b: JobSubmitResult = jobctx.submit_job(b, JobSubmitType.RUN)
-    res_c: JobSubmitResult = jobctx.submit_job(c, JobSubmitType.RUN)
-    assert res_a == JobSubmitResult.SUCCESS
-    assert res_b == JobSubmitResult.SUCCESS
-    assert res_c == JobSubmitResult.SUCCESS
+    # B and C (indices 1 and 2) must complete before A can run, but B and C can run in parallel.
+    jobs, result = jobctx.submit_batch([
+        (print_job, job, {'name': 'A'}, JobSubmitType.RUN, [1, 2]),
+        (print_job, job, {'name': 'B'}, JobSubmitType.RUN, None),
+        (print_job, job, {'name': 'C'}, JobSubmitType.RUN, None),
+    ])
+    assert result is JobSubmitResult.SUCCESS
     return 0
 
-def end_of_pipe_job(job: int, jobctx: JobContext, signal: Event) -> int:
+def end_of_pipe_job(job: int, jobctx: JobContext, signal: FastSignal) -> int:
     """
-    Indicate that the top-level work item has completed and signal the main thread, which is waiting on the `Event` `signal` to become signaled.
+    Indicate that the top-level work item has completed and signal the main thread, which is waiting on the `FastSignal` `signal` to become signaled.
 
     Parameters
     ----------
         job   : The identifier of the executing job.
         jobctx: The `JobContext` used to interact with the `JobSystem` from this thread.
-        signal: The `Event` being waited on to indicate that the top-level work item has completed.
+        signal: The `FastSignal` being waited on to indicate that the top-level work item has completed.
 
     Returns
     -------
@@ -83,7 +94,7 @@ def end_of_pipe_job(job: int, jobctx: JobContext, signal: Event) -> int:
 
 if __name__ == "__main__":
     # Initialization of the JobSystem with some worker threads.
-    sigeop   = Event()
+    sigeop   = FastSignal()
     system   = JobSystem()
     queue    = system.get_queue(queue_id=1) # Creates the queue with ID=1, or returns the existing queue with ID=1
     worker1  = JobSystemThread(name='Worker 1', wait_queue=queue, owner=system)
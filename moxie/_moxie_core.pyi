@@ -0,0 +1,50 @@
+"""
+Type declarations for the parts of the _moxie_core extension module used by the pure-Python wrapper modules.
+These let mypy (and mypyc, when `MOXIE_MYPYC=1`) resolve `moxie._moxie_core` to the extension rather than to the `moxie/_moxie_core/` C source directory.
+"""
+from typing import Any, List, Optional, Tuple
+
+MEM_ALLOCATION_FLAGS_NONE   : int
+MEM_ALLOCATION_FLAG_LOCAL   : int
+MEM_ALLOCATION_FLAG_SHARED  : int
+MEM_ALLOCATION_FLAG_HEAP    : int
+MEM_ALLOCATION_FLAG_VIRTUAL : int
+MEM_ALLOCATION_FLAG_EXTERNAL: int
+MEM_ALLOCATION_FLAG_PREFAULT: int
+MEM_ALLOCATION_FLAG_GROWABLE: int
+MEM_ACCESS_FLAGS_NONE       : int
+MEM_ACCESS_FLAG_READ        : int
+MEM_ACCESS_FLAG_WRITE       : int
+MEM_ACCESS_FLAG_RDWR        : int
+
+
+class MemoryMarker:
+    allocator_tag : int
+    allocator_name: Optional[str]
+
+
+class MemoryAllocation:
+    address       : int
+    length        : int
+    alignment     : int
+    readonly      : bool
+    allocator_tag : Optional[int]
+    allocator_name: Optional[str]
+
+
+class InternalAllocator:
+    name     : Optional[str]
+    tag      : int
+    page_size: int
+    growable : bool
+
+
+def create_memory_allocator(chunk_size: int, alignment: int, flags: int, access: int, name: Optional[str], tag: Optional[str], growth_factor: float=..., max_chunk_size: int=...) -> Tuple[InternalAllocator, int, bool, Optional[str], int]: ...
+def allocate_memory_default(arena: InternalAllocator, length: int, /) -> Optional[MemoryAllocation]: ...
+def allocate_memory(arena: InternalAllocator, length: int, alignment: int) -> Optional[MemoryAllocation]: ...
+def allocate_memory_bulk(arena: InternalAllocator, lengths: Any, alignment: int) -> Optional[List[MemoryAllocation]]: ...
+def release_allocation(arena: InternalAllocator, allocation: MemoryAllocation) -> None: ...
+def get_allocator_stats(arena: InternalAllocator, /) -> Tuple[int, int, int, int, int]: ...
+def create_allocator_marker(arena: InternalAllocator, /) -> MemoryMarker: ...
+def reset_memory_allocator(arena: InternalAllocator, threshold: int=..., /) -> None: ...
+def reset_memory_allocator_to_marker(arena: InternalAllocator, marker: MemoryMarker, threshold: int=...) -> None: ...
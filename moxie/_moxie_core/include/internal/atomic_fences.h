@@ -0,0 +1,127 @@
+/**
+ * atomic_fences.h: Defines the memory-ordering primitives used by the
+ * lock-free portions of the scheduler (the context-local Chase-Lev deques).
+ * Each macro expands to the cheapest sequence that is correct on the target
+ * architecture, following Le, Pop, Cohen and Zappa Nardelli, "Correct and
+ * Efficient Work-Stealing for Weak Memory Models" (PPoPP 2013). On x86 the
+ * acquire and release forms compile to plain loads and stores; on ARM64 and
+ * POWER they emit the ldar/stlr or lwsync sequences required for correctness.
+ * With GCC or Clang the macros use the __atomic builtins and accept any scalar
+ * type. With MSVC they use the ReadAcquire64/WriteRelease64 family from winnt.h
+ * and operate on 64-bit integers only (the deque top and bottom indices).
+ */
+#ifndef __MOXIE_CORE_ATOMIC_FENCES_H__
+#define __MOXIE_CORE_ATOMIC_FENCES_H__
+
+#pragma once
+
+#if defined(_MSC_VER) && !defined(__clang__)
+#include <stdint.h>
+#include <intrin.h>
+#include <Windows.h>
+
+#define ATOMIC_LOAD_RLX(_p)                                                    \
+    ReadNoFence64((LONG64 volatile*)(_p))
+
+#define ATOMIC_LOAD_ACQ(_p)                                                    \
+    ReadAcquire64((LONG64 volatile*)(_p))
+
+#define ATOMIC_STORE_RLX(_p, _v)                                               \
+    WriteNoFence64((LONG64 volatile*)(_p), (LONG64)(_v))
+
+#define ATOMIC_STORE_REL(_p, _v)                                               \
+    WriteRelease64((LONG64 volatile*)(_p), (LONG64)(_v))
+
+#define ATOMIC_CAS_SEQ_CST(_p, _e, _d)                                         \
+    atomic_cas_seq_cst_i64((LONG64 volatile*)(_p), (int64_t*)(_e), (int64_t)(_d))
+
+#define ATOMIC_FULL_FENCE()                                                    \
+    MemoryBarrier()
+
+#if defined(_M_X64) || defined(_M_IX86)
+#   define ATOMIC_STEAL_FENCE()                                                \
+    _ReadWriteBarrier()
+#else
+#   define ATOMIC_STEAL_FENCE()                                                \
+    MemoryBarrier()
+#endif
+
+/**
+ * Implement ATOMIC_CAS_SEQ_CST for MSVC, which has no builtin that writes back the observed value on failure.
+ */
+static __forceinline int
+atomic_cas_seq_cst_i64
+(
+    LONG64 volatile *p,
+    int64_t         *e,
+    int64_t          d
+)
+{
+    int64_t observed = (int64_t) InterlockedCompareExchange64(p, (LONG64) d, (LONG64) *e);
+    if (observed == *e) {
+        return 1;
+    } *e = observed;
+    return 0;
+}
+
+#elif defined(__GNUC__) || defined(__clang__)
+
+/**
+ * Load the value at address _p with relaxed ordering. No ordering is implied with respect to other memory operations.
+ */
+#define ATOMIC_LOAD_RLX(_p)                                                    \
+    __atomic_load_n((_p), __ATOMIC_RELAXED)
+
+/**
+ * Load the value at address _p with acquire ordering. Subsequent memory operations cannot be reordered before the load.
+ */
+#define ATOMIC_LOAD_ACQ(_p)                                                    \
+    __atomic_load_n((_p), __ATOMIC_ACQUIRE)
+
+/**
+ * Store the value _v at address _p with relaxed ordering. No ordering is implied with respect to other memory operations.
+ */
+#define ATOMIC_STORE_RLX(_p, _v)                                               \
+    __atomic_store_n((_p), (_v), __ATOMIC_RELAXED)
+
+/**
+ * Store the value _v at address _p with release ordering. Prior memory operations cannot be reordered after the store.
+ */
+#define ATOMIC_STORE_REL(_p, _v)                                               \
+    __atomic_store_n((_p), (_v), __ATOMIC_RELEASE)
+
+/**
+ * Compare the value at address _p with *_e and, if they match, replace it with _d.
+ * Evaluates to non-zero if the exchange was performed; otherwise, *_e receives the current value.
+ * The deque top index is a 64-bit counter that only increases, so it acts as its own ABA tag and a single-word
+ * CAS (lock cmpxchg on x86, casal on ARM64 with LSE) is sufficient; no double-width cmpxchg16b is required.
+ */
+#define ATOMIC_CAS_SEQ_CST(_p, _e, _d)                                         \
+    __atomic_compare_exchange_n((_p), (_e), (_d), 0, __ATOMIC_SEQ_CST, __ATOMIC_RELAXED)
+
+/**
+ * Issue a full (sequentially-consistent) memory fence, ordering prior stores before subsequent loads.
+ * This is required on every architecture, including x86 (mfence), where it is placed between the
+ * store to bottom and the load of top in the owner's pop operation.
+ */
+#define ATOMIC_FULL_FENCE()                                                    \
+    __atomic_thread_fence(__ATOMIC_SEQ_CST)
+
+/**
+ * Issue the fence required between the load of top and the load of bottom in a steal operation.
+ * x86 never reorders loads with other loads, so only a compiler barrier is required there.
+ * Weakly-ordered architectures (ARM64, POWER) require a full fence (dmb ish, sync).
+ */
+#if defined(__x86_64__) || defined(__i386__)
+#   define ATOMIC_STEAL_FENCE()                                                \
+    __atomic_signal_fence(__ATOMIC_SEQ_CST)
+#else
+#   define ATOMIC_STEAL_FENCE()                                                \
+    __atomic_thread_fence(__ATOMIC_SEQ_CST)
+#endif
+
+#else
+#   error atomic_fences.h: Unsupported compiler. GCC, Clang or MSVC is required.
+#endif
+
+#endif /* __MOXIE_CORE_ATOMIC_FENCES_H__ */
@@ -273,6 +273,7 @@ typedef enum  mem_allocation_flags_e {                                         /
     MEM_ALLOCATION_FLAG_HEAP                                    = (1UL <<  3), /* The memory comes from the process heap. */
     MEM_ALLOCATION_FLAG_VIRTUAL                                 = (1UL <<  4), /* The memory comes from the system virtual memory manager. */
     MEM_ALLOCATION_FLAG_EXTERNAL                                = (1UL <<  5), /* The memory is externally-owned. */
+    MEM_ALLOCATION_FLAG_PREFAULT                                = (1UL <<  6), /* Physical pages are mapped when virtual memory is allocated, rather than on first access. Ignored for heap memory. */
 
     MEM_ALLOCATION_FLAG_GROWABLE                                = (1UL << 31)  /* The memory chunk is growable. */
 } mem_allocation_flags_e;
@@ -297,7 +298,13 @@ typedef struct mem_allocator_t {                                               /
     struct mem_chunk_t    *tail;                                               /* A pointer to the chunk being allocated from. */
     struct mem_chunk_t    *head;                                               /* A pointer to the chunk used to initialize the allocator. May be the same as tail. */
     char const  *allocator_name;                                               /* A pointer to a nul-terminated, UTF-8 encoded string literal specifying a name for the allocator. */
-    uint64_t         chunk_size;                                               /* The actual capacity of each chunk, in bytes. All chunks have the same capacity. */
+    uint64_t         chunk_size;                                               /* The actual capacity of the initial chunk, in bytes. Subsequent chunks are sized according to growth_factor and max_chunk_size. */
+    uint64_t     max_chunk_size;                                               /* The maximum capacity of chunks appended when the allocator grows, in bytes, or zero if there is no limit. Larger requests still receive a chunk large enough to satisfy them. */
+    double        growth_factor;                                               /* The capacity of each appended chunk relative to the capacity of the previous chunk. A value of 1.0 keeps all chunks the same size. */
+    uint64_t       alloc_count;                                               /* The number of allocations successfully made from the allocator across the allocator lifetime. */
+    uint64_t       reset_count;                                               /* The number of times the allocator has been reset or rolled back to a marker. */
+    uint64_t        peak_bytes;                                               /* The largest number of bytes in use, across all chunks, observed at the time of a reset. */
+    uint64_t    aligned_allocs;                                               /* The number of allocations whose address was already suitably aligned, so no padding was inserted. Used for debugging. */
     uint64_t     high_watermark;                                               /* The maximum value of the total number of bytes allocated from this allocator across the allocator lifetime. */
     uint32_t  allocator_version;                                               /* An integer value incremented each time an allocation is successfully made from the allocator. */
     uint32_t    allocator_flags;                                               /* A combination of one or more bitwise-OR'd values of the mem_allocation_flags_e enumeration. */
@@ -432,6 +439,35 @@ mem_vmm_protect
     uint32_t access_flags 
 );
 
+/**
+ * Map physical pages for a range of committed, writable process address space so that the first access does not incur a page fault.
+ * The implementation of this function is platform-specific.
+ * @param address The page-aligned address representing the start of the range.
+ * @param region_size The number of bytes in the range.
+ * @return true if the pages were mapped, or false if an error occurred.
+ */
+extern bool
+mem_vmm_prefault
+(
+    void      *address, 
+    size_t region_size
+);
+
+/**
+ * Return the physical pages backing a range of process address space to the operating system, while keeping the address space reserved.
+ * The contents of the range are undefined after the call, but the range remains accessible with its current protection.
+ * The implementation of this function is platform-specific.
+ * @param address The page-aligned address representing the start of the range.
+ * @param region_size The number of bytes in the range. This value should be a multiple of the system page size.
+ * @return true if the physical pages were released, or false if an error occurred.
+ */
+extern bool
+mem_vmm_decommit
+(
+    void      *address, 
+    size_t region_size
+);
+
 /**
  * Decommit and release a range of process address space.
  * The implementation of this function is platform-specific.
@@ -541,6 +577,20 @@ mem_allocator_create
     mem_tag_t                 tag
 );
 
+/**
+ * Specify how the capacity of chunks appended to a growable memory allocator increases.
+ * @param alloc The memory allocator to configure.
+ * @param growth_factor The capacity of each appended chunk relative to the capacity of the previous chunk. Values less than 1.0 are treated as 1.0.
+ * @param max_chunk_size The maximum capacity of an appended chunk, in bytes, or zero to impose no limit. Requests larger than this value still receive a chunk large enough to satisfy them.
+ */
+extern void
+mem_allocator_set_growth_policy
+(
+    struct mem_allocator_t *alloc,
+    double          growth_factor,
+    size_t         max_chunk_size
+);
+
 /**
  * Initialize a memory allocator with externally-managed storage.
  * @param alloc The memory allocator structure to initialize.
@@ -641,6 +691,34 @@ mem_allocator_reset_to_marker
     struct mem_marker_t   *marker
 );
 
+/**
+ * Reset the state of a memory allocator, invalidating all allocations, and return unused physical pages to the operating system.
+ * Pages are returned only for allocators that use virtual memory, and only if the number of bytes released is at least threshold.
+ * @param alloc The memory allocator to reset.
+ * @param threshold The minimum number of bytes that must be released before physical pages are returned to the operating system.
+ */
+extern void
+mem_allocator_reset_and_decommit
+(
+    struct mem_allocator_t *alloc,
+    size_t              threshold
+);
+
+/**
+ * Roll back the state of a memory allocator to a marker, and return unused physical pages to the operating system.
+ * Pages are returned only for allocators that use virtual memory, and only if the number of bytes released is at least threshold.
+ * @param alloc The memory allocator to reset.
+ * @param marker A previously obtained marker representing the state of the allocator at a point in time. If this value is NULL, the call is equivalent to mem_allocator_reset_and_decommit.
+ * @param threshold The minimum number of bytes that must be released before physical pages are returned to the operating system.
+ */
+extern void
+mem_allocator_reset_to_marker_and_decommit
+(
+    struct mem_allocator_t *alloc,
+    struct mem_marker_t   *marker,
+    size_t              threshold
+);
+
 /**
  * Reserve a contiguous block of space, indicating that up to a maximum number of bytes will be allocated.
  * The mem_allocator_commit function can be used to commit the portion of the reservation actually needed.
@@ -11,6 +11,7 @@
 #   include <stddef.h>
 #   include <stdint.h>
 #   include <stdbool.h>
+#   include "internal/platform.h"
 #endif
 
 /**
@@ -51,6 +52,13 @@
  * JOB_COUNT_MAX             : The maximum number of jobs created at any one time. This value must be a power of two.
  * JOB_WAITER_COUNT_MAX      : The maximum number of jobs that can be waiting on a single job to complete before they can start.
  * JOB_CONTEXT_RTRQ_MAX      : The capacity of the context-local ready-to-run queue. This value must be a power of two.
+ * JOB_QUEUE_CONTEXT_MAX     : The maximum number of job contexts that can steal work from each other through a single waitable job queue.
+ * JOB_CONTEXT_STEAL_MAX     : The maximum number of jobs taken from a victim's ready deque by a single steal operation.
+ * JOB_CONTEXT_STEAL_TRIES   : The number of rounds of steal attempts (and shared queue polls) an idle stealing context makes before it parks.
+ * JOB_QUEUE_SPIN_COUNT      : The number of iterations a consumer spins watching for work on an empty queue before it parks in the kernel.
+ * JOB_WAIT_SPIN_COUNT       : The default number of failed polls for ready-to-run work before a thread waiting on a job parks.
+ * JOB_WAIT_PARK_MSEC        : The maximum number of milliseconds a parked waiting thread sleeps before polling for ready-to-run work again, if the job it waits on does not complete.
+ * JOB_WAIT_BANK_COUNT       : The number of wait banks across which threads waiting on a job are parked, keyed by job slot index. This value must be a power of two.
  * JOB_BUFFER_JOB_COUNT      : The maximum number of jobs that can be allocated from a single job buffer.
  * JOB_BUFFER_SIZE_BYTES     : The maximum number of bytes that can be allocated from a single job buffer.
  * JOB_WAITER_LIST_SIZE_BYTES: The number of bytes per-job allocated to the waiter list.
@@ -73,7 +81,14 @@
 #   define JOB_QUEUE_COUNT_MAX                                                  16
 #   define JOB_COUNT_MAX                                                        65536
 #   define JOB_WAITER_COUNT_MAX                                                 32
-#   define JOB_CONTEXT_RTRQ_MAX                                                 64
+#   define JOB_CONTEXT_RTRQ_MAX                                                 256
+#   define JOB_QUEUE_CONTEXT_MAX                                                64
+#   define JOB_CONTEXT_STEAL_MAX                                               (JOB_CONTEXT_RTRQ_MAX / 2)
+#   define JOB_CONTEXT_STEAL_TRIES                                              4
+#   define JOB_QUEUE_SPIN_COUNT                                                 200
+#   define JOB_WAIT_SPIN_COUNT                                                  64
+#   define JOB_WAIT_PARK_MSEC                                                   10
+#   define JOB_WAIT_BANK_COUNT                                                  64
 #   define JOB_BUFFER_JOB_COUNT                                                 64
 #   define JOB_BUFFER_SIZE_BYTES                                               (JOB_BUFFER_JOB_COUNT * 1024)
 #   define JOB_STATUS_WAITER_LIST_SIZE_BYTES                                   (JOB_WAITER_COUNT_MAX * sizeof(uint16_t))
@@ -132,6 +147,11 @@ typedef enum   job_queue_signal_e {                                            /
     JOB_QUEUE_SIGNAL_USER                                        =  2U,        /* The first signal value available for application use. */
 } job_queue_signal_e;
 
+typedef enum   job_queue_policy_e {                                            /* Define how ready-to-run jobs are distributed to the threads that wait on a job queue. */
+    JOB_QUEUE_POLICY_SHARED                                      =  0U,        /* All ready-to-run jobs are pushed to, and taken from, the shared job queue. */
+    JOB_QUEUE_POLICY_STEALING                                    =  1U,        /* Jobs targeting a context's own wait queue go to a context-local deque; idle contexts steal from other contexts on the same queue. */
+} job_queue_policy_e;
+
 typedef enum   job_submit_type_e {                                             /* The various job submission types. Typically, a job is submitted to run, but if an error has occurred the job should be submitted in a canceled state. */
     JOB_SUBMIT_RUN                                               =  0L,        /* Submit the job for execution. */
     JOB_SUBMIT_CANCEL                                            = -1L,        /* Cancel the job. */
@@ -167,7 +187,7 @@ typedef struct job_descriptor_t {                                              /
     void                          *data;                                       /* Pointer to the start of the data region allocated to the job. */
     uint32_t                       size;                                       /* The maximum number of bytes that can be written to the job data region. */
     job_id_t                         id;                                       /* The identifier of the job. May be JOB_ID_INVALID. */
-    job_id_t                     parent;                                       /* The identifier of the job's parent task. Set to JOB_ID_INVALID if the job has no parent. */
+    job_id_t                     parent;                                       /* The identifier of the job's parent task. Set to JOB_ID_INVALID if the job has no parent. Supplied to job_context_create_job; read-only thereafter. */
     int32_t                        exit;                                       /* The exit code returned by the job entry point. */
 } job_descriptor_t;
 
@@ -186,10 +206,19 @@ typedef struct job_context_t {                                                 /
     struct job_buffer_t         *jobbuf;                                       /* The job buffer from which the context allocates. */
     struct job_scheduler_t       *sched;                                       /* A pointer back to the scheduler instance that created the context. */
     thread_id_t                   thrid;                                       /* The identifier of the thread that owns the context. This is the only thread that can create, submit and execute jobs using this context. */
-    uintptr_t                     user1;                                       /* Application-defined data associated with the context. */
+    uintptr_t                     user1;                                       /* Application-defined data associated with the context. A job that sets this to a non-zero value ends any job_context_wait_job call that executed it. */
     uintptr_t                     user2;                                       /* Application-defined data associated with the context. */
     uint32_t                     jobcnt;                                       /* The number of jobs allocated from this context's current job buffer. */
+    uint32_t                     policy;                                       /* One of the values of the job_queue_policy_e enumeration. JOB_QUEUE_POLICY_STEALING enables the ready deque. */
+    uint32_t                       seed;                                       /* Random number generator state used to select steal victims. */
     uint32_t                       pad1;                                       /* Reserved for future use. Set to zero. */
+    uint32_t                     victim;                                       /* The index of the context most recently stolen from in the wait queue's context list. Tried first on the next steal. */
+    uint32_t                       pad2;                                       /* Reserved for future use. Set to zero. */
+    PLATFORM_STRUCT_ALIGN(CACHELINE_SIZE)
+    int64_t                         top;                                       /* The index of the oldest item in the ready deque. Advanced by the owner and by thieves using compare-and-swap. On its own cache line. */
+    PLATFORM_STRUCT_ALIGN(CACHELINE_SIZE)
+    int64_t                      bottom;                                       /* One past the index of the newest item in the ready deque. Only written by the owning thread. Shares a cache line with the start of ready. */
+    struct job_descriptor_t      *ready[JOB_CONTEXT_RTRQ_MAX];                 /* The context-local ready-to-run deque (a fixed-capacity Chase-Lev deque). */
 } job_context_t;
 
 #ifdef __cplusplus
@@ -214,6 +243,18 @@ current_thread_id
     void
 );
 
+/**
+ * Restrict the calling thread to run only on a single logical processor.
+ * Pinning a worker before it acquires its job context keeps the memory it touches first (its job buffers) local to the processor's NUMA node.
+ * @param cpu_index The zero-based index of the logical processor on which the calling thread should run.
+ * @return Non-zero if the thread affinity was updated, or zero if the processor index is invalid or thread affinity is not supported on the host.
+ */
+extern int
+thread_set_affinity
+(
+    uint32_t cpu_index
+);
+
 /**
  * Create and launch a new operating system thread with a user-specified entry point.
  * The thread runs until the supplied entry point routine returns. The thread is joinable.
@@ -244,6 +285,9 @@ thread_join
 /**
  * Allocate and initialize to empty a new fixed-length, waitable queue for storing ready-to-run jobs.
  * The queue capacity is always JOB_COUNT_MAX, and the elements stored are always pointers to `job_descriptor_t`.
+ * The queue is a single locked ring, and is not sharded by submitter. Under JOB_QUEUE_POLICY_STEALING the per-context ready deques are the per-submitter shards:
+ * a submitter pushes to its own deque without taking the queue lock, and the ring is only used when a deque is full or a job targets another queue.
+ * Sharding the ring as well would require blocking consumers to sleep across every shard, which the deque sleepers/wakegen protocol already provides.
  * @param queue_id An application-defined identifier for the queue.
  * @return The new, empty queue, or NULL of resource allocation failed.
  */
@@ -277,6 +321,7 @@ job_queue_flush
  * Signal all waiters on a queue to wake up for some event like process shutdown.
  * All waiting producer threads and all waiting consumer threads are woken up.
  * The signal remains set until it is cleared using `job_queue_clear_signal`.
+ * If the queue already has the same signal value set, no threads are woken.
  * @param queue The waitable queue to signal.
  * @param signal The signal value to set. A value of JOB_QUEUE_SIGNAL_CLEAR allows threads to park on the queue again.
  */
@@ -287,6 +332,21 @@ job_queue_signal
     uint32_t           signal
 );
 
+/**
+ * Set the signal value on a queue and wake at most one waiting consumer thread.
+ * Use this for transient application-defined signals that need only be observed by one thread; use `job_queue_signal` for JOB_QUEUE_SIGNAL_TERMINATE.
+ * The signal remains set until it is cleared using `job_queue_clear_signal`.
+ * If the queue already has the same signal value set, no threads are woken.
+ * @param queue The waitable queue to signal.
+ * @param signal The signal value to set. A value of JOB_QUEUE_SIGNAL_CLEAR allows threads to park on the queue again.
+ */
+extern void
+job_queue_signal_one
+(
+    struct job_queue_t *queue,
+    uint32_t           signal
+);
+
 /**
  * Check the signal status of a waitable job queue.
  * @param queue The waitable job queue to query.
@@ -323,6 +383,22 @@ job_queue_push
     struct job_descriptor_t *job
 );
 
+/**
+ * Push several ready-to-run jobs onto a job queue, acquiring the queue lock once for the whole batch.
+ * Jobs are enqueued in array order. Waiting consumers are woken once after the batch has been pushed.
+ * @param queue The target queue.
+ * @param jobs The array of jobs to enqueue. Each job must have a `wait` value of 0.
+ * @param count The number of jobs in the `jobs` array.
+ * @return The number of jobs pushed onto the queue, which is less than `count` if the queue became signaled.
+ */
+extern uint32_t
+job_queue_push_many
+(
+    struct job_queue_t     *queue,
+    struct job_descriptor_t **jobs,
+    size_t                   count
+);
+
 /**
  * Take a ready-to-run job from a job queue.
  * If the queue is empty, the calling thread is blocked until a job becomes ready-to-run or the queue is signaled.
@@ -338,12 +414,14 @@ job_queue_take
 /**
  * Allocate and initialize storage for a job scheduler instance.
  * @param context_count The number of job_context_t required by the application.
+ * @param queue_policy One of the values of the job_queue_policy_e enumeration, applied to all contexts acquired from the scheduler.
  * @return A pointer to the new scheduler instance, or NULL if an error occurred.
  */
 extern struct job_scheduler_t*
 job_scheduler_create
 (
-    size_t context_count
+    size_t context_count,
+    uint32_t queue_policy
 );
 
 /**
@@ -488,6 +566,8 @@ job_context_thread_id
  * Allocate storage for a job. The job cannot run until `job_context_submit_job` is called.
  * This function should only ever be called from the thread that owns the specified job context.
  * @param context The job context from which the job will be allocated.
+ * @param parent The identifier of the parent job, if any, or `JOB_ID_INVALID` if there is no parent job.
+ * The parent is recorded in the scheduler's per-job status array at creation time, and must not be changed afterwards.
  * @param data_size The number of bytes of data required to store job attributes.
  * @param data_align The required alignment of the job data. This must be a non-zero power of two.
  * @return A pointer to the job descriptor which can be used to write the job data, or `NULL` if the allocation request cannot be satisfied.
@@ -495,13 +575,13 @@ job_context_thread_id
  * - target: Set to the queue to which the job should be submitted. A value of `NULL` will submit to the queue bound to the context.
  * - main  : Set to the function to execute when the job runs.
  * - data  : A pointer to the start of the buffer where up to size bytes can be written.
- * - parent: The identifier of the parent job, if any, or `JOB_ID_INVALID` if there is no parent job.
- * The job creation process initializes all fields to their default values. The job identifier is returned in the `job_descriptor_t::id` field.
+ * The job creation process initializes all other fields to their default values. The job identifier is returned in the `job_descriptor_t::id` field.
  */
 extern struct job_descriptor_t*
 job_context_create_job
 (
     struct job_context_t   *context,
+    job_id_t                 parent,
     size_t                data_size,
     size_t               data_align
 );
@@ -526,6 +606,31 @@ job_context_submit_job
     int                 submit_type
 );
 
+/**
+ * Submit several jobs to execute or for cancellation.
+ * Ready-to-run jobs are pushed in batches to their target queues, preserving the order of the `jobs` array.
+ * This function should only ever be called from the thread that owns the specified job context.
+ * @param context The job context from which the jobs were allocated.
+ * @param jobs The array of job descriptors returned by prior calls to `job_context_create_job`.
+ * @param job_count The number of entries in `jobs`.
+ * @param dependency_list The concatenated dependency identifiers for all jobs. May be `NULL` if `dependency_counts` is `NULL`.
+ * @param dependency_counts An array of `job_count` values specifying the number of entries of `dependency_list` that belong to each job, or `NULL` if no job has dependencies.
+ * @param submit_type One of the values of the `job_submit_type_e` enumeration, applied to every job in the batch.
+ * @param results An optional array of `job_count` values that receives the `job_submit_result_e` for each job. May be `NULL`.
+ * @return The number of jobs for which submission returned `JOB_SUBMIT_SUCCESS`.
+ */
+extern size_t
+job_context_submit_jobs
+(
+    struct job_context_t     *context,
+    struct job_descriptor_t    **jobs,
+    size_t                  job_count,
+    job_id_t const   *dependency_list,
+    size_t const   *dependency_counts,
+    int                   submit_type,
+    int                      *results
+);
+
 /**
  * Attempt to cancel a previously submitted job.
  * This operation is not guaranteed to succeed; if the job has already started running it will not be stopped.
@@ -541,17 +646,22 @@ job_context_cancel_job
 );
 
 /**
- * Perform a busy wait for a job to complete.
+ * Wait for a job to complete.
  * While waiting, the calling thread will attempt to execute pending jobs from the context's wait queue.
+ * After `spin_count` consecutive polls find no ready-to-run work, the calling thread sleeps until the job completes, waking at least every JOB_WAIT_PARK_MSEC milliseconds to poll again.
+ * Completion wakes only the threads parked on the wait bank of the completed job's slot, rather than every waiting thread.
  * @param context The job context bound to the calling thread.
  * @param id The identifier of the job to wait for.
- * @return Non-zero if the specified job has completed, or zero if the wait queue is signaled or the job ID is invalid.
+ * @param spin_count The number of consecutive failed polls for ready-to-run work before the calling thread sleeps.
+ * If a job executed while waiting sets the context's user1 field to a non-zero value, the wait ends immediately so the application can handle the condition.
+ * @return Non-zero if the specified job has completed, or zero if the wait queue is signaled, the job ID is invalid or an executed job set the context's user1 field.
  */
 extern int
 job_context_wait_job
 (
     struct job_context_t *context,
-    job_id_t                   id
+    job_id_t                   id,
+    uint32_t           spin_count
 );
 
 /**
@@ -567,6 +677,19 @@ job_context_wait_ready_job
     struct job_context_t *context
 );
 
+/**
+ * Take a ready-to-run job for a context without blocking.
+ * With JOB_QUEUE_POLICY_STEALING, the context-local deque is checked first, then the deques of other contexts waiting on the same queue, then the wait queue itself.
+ * This function will never return a canceled job - a canceled job will be immediately completed and another job will be polled for.
+ * @param context The job context bound to the calling thread.
+ * @return The `job_descriptor_t` for the ready-to-run job, or NULL if no job is currently available.
+ */
+extern struct job_descriptor_t*
+job_context_poll_ready_job
+(
+    struct job_context_t *context
+);
+
 /**
  * Signal completion of a job after its entry point has returned. This may make additional jobs ready-to-run.
  * @param context The job context bound to the calling thread (the thread that executed the job).
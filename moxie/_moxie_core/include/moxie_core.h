@@ -47,6 +47,27 @@
 #define _MOXIE_CORE_DEFAULT_ALIGNMENT_BYTES                                    16
 #endif
 
+/**
+ * The default capacity of each chunk appended to a growable memory allocator, relative to the previous chunk.
+ */
+#ifndef _MOXIE_CORE_DEFAULT_GROWTH_FACTOR
+#define _MOXIE_CORE_DEFAULT_GROWTH_FACTOR                                      1.5
+#endif
+
+/**
+ * The default minimum number of bytes released by a reset before physical pages are returned to the operating system.
+ */
+#ifndef _MOXIE_CORE_DEFAULT_DECOMMIT_THRESHOLD
+#define _MOXIE_CORE_DEFAULT_DECOMMIT_THRESHOLD                                 (2 * 1024 * 1024)
+#endif
+
+/**
+ * The maximum number of released MemoryAllocation objects retained by each InternalAllocator for reuse.
+ */
+#ifndef _MOXIE_CORE_ALLOCATION_FREELIST_SIZE
+#define _MOXIE_CORE_ALLOCATION_FREELIST_SIZE                                   64
+#endif
+
 extern PyTypeObject PyMoxie_MemoryMarkerType;                                  /* Python type MemoryMarker         => PyMoxie_MemoryMarker.         */
 extern PyTypeObject PyMoxie_MemoryAllocationType;                              /* Python type MemoryAllocation     => PyMoxie_MemoryAllocation.     */
 extern PyTypeObject PyMoxie_InternalAllocatorType;                             /* Python type InternalAllocator    => PyMoxie_InternalAllocator.    */
@@ -67,6 +88,9 @@ typedef struct PyMoxie_InternalAllocator {                                     /
     PyObject                *allocator_tag_int;                                /* The four character code tag of the InternalAllocator, used for debugging. */
     PyObject                    *page_size_int;                                /* The operating system page size, in bytes. */
     PyObject                    *growable_bool;                                /* Specifies whether or not the memory allocator can grow. */
+    size_t                   default_alignment;                                /* The alignment supplied when the allocator was created, used by allocate_memory_default. */
+    size_t                      freelist_count;                                /* The number of valid entries in the freelist array. */
+    struct PyMoxie_MemoryAllocation *freelist[_MOXIE_CORE_ALLOCATION_FREELIST_SIZE]; /* Retained references to released MemoryAllocation objects available for reuse. */
     mem_allocator_t                  allocator;                                /* The internal allocator data. */
 } PyMoxie_InternalAllocator;
 
@@ -81,6 +105,7 @@ typedef struct PyMoxie_MemoryAllocation {                                      /
     void                         *base_address;                                /* The native address of the first byte of the memory allocation, or NULL if the allocation is invalid. */
     size_t                         byte_length;                                /* The total number of bytes allocated. */
     mem_tag_t                              tag;                                /* A copy of the allocator's four character code tag, used for debugging (allowing identification of the struct in a memory dump). */
+    struct PyMoxie_InternalAllocator    *arena;                                /* The InternalAllocator from which the memory was allocated, or NULL. Borrowed; used only to validate release_allocation. */
 } PyMoxie_MemoryAllocation;
 
 typedef struct PyMoxie_InternalJobQueue {                                      /* Python type wrapper for moxie's job_queue_t struct, providing a waitable job queue. */
@@ -98,6 +123,8 @@ typedef struct PyMoxie_InternalJobContext {                                    /
 typedef struct PyMoxie_InternalJobScheduler {                                  /* Python type wrapper for moxie's job_scheduler_t type, used to acquire and release job contexts. */
     PyObject_HEAD
     struct job_scheduler_t              *state;                                /* The native job_scheduler_t instance, allocated from process virtual address space. */
+    PyObject                        *id_to_ctx;                                /* The dictionary used to map thread identifiers to Python JobContext instances. Shared by all jobs created through the scheduler. */
+    PyObject                          *entries;                                /* The list of registered job entry point callables, indexed by entry identifier. */
 } PyMoxie_InternalJobScheduler;
 
 typedef struct PyMoxie_PythonJobState {                                        /* Internal job state data storing retained references for a job defined in Python code. */
@@ -198,13 +225,15 @@ PyMoxie_InternalJobContext_Create
 /**
  * Allocate and initialize a new job scheduler.
  * @param context_count The number of job_context_t expected to be required by the application (typically one per-thread that interacts with the job system).
+ * @param queue_policy One of the values of the job_queue_policy_e enumeration specifying how ready-to-run jobs are distributed.
  * @return The new instance of the internal job scheduler, or NULL if resource allocation failed or another error occurred.
  * The caller is responsible for incrementing the reference count of the returned object.
  */
 extern PyMoxie_InternalJobScheduler*
 PyMoxie_InternalJobScheduler_Create
 (
-    uint32_t context_count
+    uint32_t context_count,
+    uint32_t  queue_policy
 );
 
 /**
@@ -12,28 +12,6 @@ static const mem_tag_t UNTAGGED_ALLOCATOR = mem_tag('N','O','N','E');
     (((_value) & ((_value)-1)) == 0)
 #endif
 
-/**
- * Compute the next power of two value greater than or equal to a given value.
- * @param n The input value.
- * @return The next non-zero power of two greater than or equal to n.
- */
-static uint32_t
-mem_next_pow2_greater_or_equal
-(
-    uint32_t n
-)
-{
-    uint32_t v = 1;
-    do {
-        if (v < n) {
-            v <<= 1;
-        } else {
-            return v;
-        }
-    } while (v < UINT32_MAX);
-    return (1U << 31);
-}
-
 /**
  * Perform a consistency check and adjust chunk allocation attributes.
  * @param p_alignment : The address of the argument specifying the desired allocation alignment.
@@ -104,6 +82,37 @@ mem_sanitize_attributes
     *p_flags      = flags;
 }
 
+/**
+ * Compute the capacity of the next chunk to append to a growable allocator.
+ * @param alloc The memory allocator that needs to grow.
+ * @param length The number of bytes that must be available in the new chunk.
+ * @param alignment The alignment of the request that caused the allocator to grow.
+ * @return The capacity of the new chunk, in bytes.
+ */
+static size_t
+mem_allocator_next_chunk_size
+(
+    struct mem_allocator_t *alloc,
+    size_t                 length,
+    size_t              alignment
+)
+{
+    size_t  required = length + alignment;
+    size_t  previous =(size_t) alloc->tail->maximum_offset;
+    size_t chunk_size =(size_t)((double) previous * alloc->growth_factor);
+
+    if (chunk_size < alloc->chunk_size) {
+        chunk_size = alloc->chunk_size;
+    }
+    if (alloc->max_chunk_size != 0 && chunk_size > alloc->max_chunk_size) {
+        chunk_size =(size_t) alloc->max_chunk_size;
+    }
+    if (chunk_size < length) {
+        chunk_size = required;
+    }
+    return chunk_size;
+}
+
 void
 mem_chunk_init
 (
@@ -160,6 +169,9 @@ mem_chunk_allocate
             uint8_t *guard_base =(uint8_t*) memory + chunk_size;
             mem_vmm_protect(guard_base, guard_size, MEM_ACCESS_FLAGS_NONE);
         }
+        if (memory != NULL && (flags & MEM_ALLOCATION_FLAG_PREFAULT) != 0 && (access & MEM_ACCESS_FLAG_WRITE) != 0) {
+            (void) mem_vmm_prefault(memory, chunk_size);
+        }
     } else {
         memory = mem_heap_allocate(chunk_size, alignment);
     }
@@ -242,7 +254,13 @@ mem_allocator_create
         alloc->head              = chunk;
         alloc->allocator_name    = name;
         alloc->chunk_size        =(uint64_t) chunk_size;
+        alloc->max_chunk_size    = 0;
+        alloc->growth_factor     = 1.0;
         alloc->high_watermark    = 0;
+        alloc->aligned_allocs    = 0;
+        alloc->alloc_count       = 0;
+        alloc->reset_count       = 0;
+        alloc->peak_bytes        = 0;
         alloc->allocator_version = 0;
         alloc->allocator_flags   = flags;
         alloc->access_flags      = access;
@@ -255,7 +273,13 @@ mem_allocator_create
         alloc->head              = NULL;
         alloc->allocator_name    = NULL;
         alloc->chunk_size        = 0;
+        alloc->max_chunk_size    = 0;
+        alloc->growth_factor     = 1.0;
         alloc->high_watermark    = 0;
+        alloc->aligned_allocs    = 0;
+        alloc->alloc_count       = 0;
+        alloc->reset_count       = 0;
+        alloc->peak_bytes        = 0;
         alloc->allocator_version = 0;
         alloc->allocator_flags   = MEM_ALLOCATION_FLAGS_NONE;
         alloc->access_flags      = MEM_ACCESS_FLAGS_NONE;
@@ -266,6 +290,22 @@ mem_allocator_create
     }
 }
 
+void
+mem_allocator_set_growth_policy
+(
+    struct mem_allocator_t *alloc,
+    double          growth_factor,
+    size_t         max_chunk_size
+)
+{
+    assert(alloc != NULL && "Expected non-null alloc argument");
+    if (growth_factor < 1.0) {
+        growth_factor = 1.0;
+    }
+    alloc->growth_factor  = growth_factor;
+    alloc->max_chunk_size =(uint64_t) max_chunk_size;
+}
+
 struct mem_allocator_t*
 mem_allocator_create_with_memory
 (
@@ -307,7 +347,13 @@ mem_allocator_create_with_memory
         alloc->head              = chunk;
         alloc->allocator_name    = name;
         alloc->chunk_size        =(uint64_t) length;
+        alloc->max_chunk_size    = 0;
+        alloc->growth_factor     = 1.0;
         alloc->high_watermark    = 0;
+        alloc->aligned_allocs    = 0;
+        alloc->alloc_count       = 0;
+        alloc->reset_count       = 0;
+        alloc->peak_bytes        = 0;
         alloc->allocator_version = 0;
         alloc->allocator_flags   = flags;
         alloc->access_flags      = access;
@@ -322,7 +368,13 @@ return_invalid_allocator:
     alloc->head              = NULL;
     alloc->allocator_name    = NULL;
     alloc->chunk_size        = 0;
+    alloc->max_chunk_size    = 0;
+    alloc->growth_factor     = 1.0;
     alloc->high_watermark    = 0;
+    alloc->aligned_allocs    = 0;
+    alloc->alloc_count       = 0;
+    alloc->reset_count       = 0;
+    alloc->peak_bytes        = 0;
     alloc->allocator_version = 0;
     alloc->allocator_flags   = MEM_ALLOCATION_FLAGS_NONE;
     alloc->access_flags      = MEM_ACCESS_FLAGS_NONE;
@@ -363,7 +415,13 @@ return_invalid_allocator:
     alloc->head              = NULL;
     alloc->allocator_name    = NULL;
     alloc->chunk_size        = 0;
+    alloc->max_chunk_size    = 0;
+    alloc->growth_factor     = 1.0;
     alloc->high_watermark    = 0;
+    alloc->aligned_allocs    = 0;
+    alloc->alloc_count       = 0;
+    alloc->reset_count       = 0;
+    alloc->peak_bytes        = 0;
     alloc->allocator_version = 0;
     alloc->allocator_flags   = MEM_ALLOCATION_FLAGS_NONE;
     alloc->access_flags      = MEM_ACCESS_FLAGS_NONE;
@@ -401,6 +459,31 @@ mem_allocator_mark
     }; return marker;
 }
 
+/**
+ * Record the number of bytes in use across all chunks prior to resetting an allocator.
+ * @param alloc The memory allocator about to be reset.
+ */
+static void
+mem_allocator_record_reset
+(
+    struct mem_allocator_t *alloc
+)
+{
+    mem_chunk_t *iter = alloc->head;
+    uint64_t   nused = 0;
+
+    while (iter != NULL) {
+        nused += mem_chunk_bytes_used(iter);
+        if (iter == alloc->tail) {
+            break;
+        } iter  = iter->next;
+    }
+    if (nused > alloc->peak_bytes) {
+        alloc->peak_bytes = nused;
+    }
+    alloc->reset_count++;
+}
+
 void*
 mem_allocator_alloc
 (
@@ -413,14 +496,21 @@ mem_allocator_alloc
         mem_chunk_t      *source = alloc->tail;
         uint8_t    *base_address = source->memory_start + source->next_offset;
         uintptr_t   address_uint =(uintptr_t) base_address;
-        uint8_t *aligned_address =(uint8_t *) mem_align_up(address_uint, alignment);
-        size_t       align_bytes =(size_t   )(aligned_address - base_address);
-        size_t       alloc_bytes = length  +  align_bytes;
-        size_t        new_offset = source->next_offset + alloc_bytes;
+        uint8_t *aligned_address = base_address;
+        size_t        new_offset = source->next_offset + length;
 
+        if ((address_uint & (alignment - 1)) != 0) {
+            /* Insert padding to align the returned address */
+            aligned_address =(uint8_t *) mem_align_up(address_uint, alignment);
+            new_offset     +=(size_t   )(aligned_address - base_address);
+        }
         if (new_offset <= source->maximum_offset) {
             /* Bump the offset to account for the allocated space */
             source->next_offset = new_offset;
+            if (aligned_address == base_address) {
+                alloc->aligned_allocs++;
+            }
+            alloc->alloc_count++;
             /* Bump the high watermark if necessary */
             if (new_offset > alloc->high_watermark) {
                 alloc->high_watermark = new_offset;
@@ -432,14 +522,11 @@ mem_allocator_alloc
         if (alloc->allocator_flags & MEM_ALLOCATION_FLAG_GROWABLE) {
             /* Allocate and append a new chunk from which the allocation will be satisfied */
             mem_chunk_t *new_source  = NULL;
-            size_t       chunk_size  = alloc->chunk_size;
+            size_t       chunk_size  = mem_allocator_next_chunk_size(alloc, length, alignment);
             size_t       chunk_align = DEFAULT_ALIGNMENT;
             if (chunk_align < alignment) {
                 chunk_align = alignment;
             }
-            if (chunk_size < length) {
-                chunk_size = length  + alignment;
-            }
             if ((new_source  = mem_chunk_allocate(chunk_size, alloc->guard_size, chunk_align, alloc->allocator_flags, alloc->access_flags)) != NULL) {
                 source->next = new_source;
                 alloc->tail  = new_source;
@@ -459,6 +546,7 @@ mem_allocator_reset
 )
 {
     if (alloc != NULL && alloc->head != NULL) {
+        mem_allocator_record_reset(alloc);
         /* Keep the head chunk; release everything else */
         mem_chunk_release(alloc->head->next, alloc->allocator_flags);
         alloc->head->next_offset = 0;
@@ -476,6 +564,7 @@ mem_allocator_reset_to_marker
 )
 {
     if (marker != NULL && marker->tag == alloc->allocator_tag) {
+        mem_allocator_record_reset(alloc);
         /* Roll back the allocator state */
         mem_chunk_release(marker->chunk->next, alloc->allocator_flags);
         marker->chunk->next        = NULL;
@@ -494,6 +583,77 @@ mem_allocator_reset_to_marker
     }
 }
 
+/**
+ * Return the physical pages backing the unused portion of a chunk to the operating system.
+ * @param alloc The memory allocator that owns the chunk.
+ * @param chunk The chunk whose pages should be returned.
+ * @param used_offset The offset of the first unused byte in the chunk.
+ * @param prior_offset The offset of the first unused byte in the chunk before the allocator was reset.
+ * @param threshold The minimum number of bytes that must be released before pages are returned.
+ */
+static void
+mem_chunk_decommit_unused
+(
+    struct mem_allocator_t *alloc,
+    struct mem_chunk_t     *chunk,
+    uint64_t          used_offset,
+    uint64_t         prior_offset,
+    size_t              threshold
+)
+{
+    uint64_t page_size =(uint64_t) alloc->page_size;
+    uint64_t     start = mem_align_up(used_offset, page_size);
+    uint64_t       end = mem_align_up(prior_offset, page_size);
+
+    if ((alloc->allocator_flags & MEM_ALLOCATION_FLAG_VIRTUAL) == 0) {
+        return; /* Heap memory is not page-aligned and is owned by the C runtime */
+    }
+    if (prior_offset <= used_offset || (prior_offset - used_offset) < threshold) {
+        return;
+    }
+    if (end > chunk->maximum_offset) {
+        end = chunk->maximum_offset;
+    }
+    if (start < end) {
+        (void) mem_vmm_decommit(chunk->memory_start + start, (size_t)(end - start));
+    }
+}
+
+void
+mem_allocator_reset_and_decommit
+(
+    struct mem_allocator_t *alloc,
+    size_t              threshold
+)
+{
+    if (alloc != NULL && alloc->head != NULL) {
+        uint64_t prior_offset = alloc->head->next_offset;
+        mem_allocator_reset(alloc);
+        mem_chunk_decommit_unused(alloc, alloc->head, 0, prior_offset, threshold);
+    }
+}
+
+void
+mem_allocator_reset_to_marker_and_decommit
+(
+    struct mem_allocator_t *alloc,
+    struct mem_marker_t   *marker,
+    size_t              threshold
+)
+{
+    if (marker == NULL) {
+        mem_allocator_reset_and_decommit(alloc, threshold);
+        return;
+    }
+    if (marker->tag == alloc->allocator_tag) {
+        uint64_t prior_offset = marker->chunk->next_offset;
+        mem_allocator_reset_to_marker(alloc, marker);
+        mem_chunk_decommit_unused(alloc, marker->chunk, marker->offset, prior_offset, threshold);
+        return;
+    }
+    mem_allocator_reset_to_marker(alloc, marker);
+}
+
 void*
 mem_allocator_reserve
 (
@@ -535,14 +695,11 @@ mem_allocator_reserve
         if (alloc->allocator_flags & MEM_ALLOCATION_FLAG_GROWABLE) {
             /* Allocate and append a new chunk from which the reservation will be satisfied */
             mem_chunk_t *new_source  = NULL;
-            size_t       chunk_size  = alloc->chunk_size;
+            size_t       chunk_size  = mem_allocator_next_chunk_size(alloc, reserve_bytes, alignment);
             size_t       chunk_align = DEFAULT_ALIGNMENT;
             if (chunk_align < alignment) {
                 chunk_align = alignment;
             }
-            if (chunk_size < reserve_bytes) {
-                chunk_size = reserve_bytes  + alignment;
-            }
             if ((new_source  = mem_chunk_allocate(chunk_size, alloc->guard_size, chunk_align, alloc->allocator_flags, alloc->access_flags)) != NULL) {
                 source->next = new_source;
                 alloc->tail  = new_source;
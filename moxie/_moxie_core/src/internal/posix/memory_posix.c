@@ -124,6 +124,44 @@ mem_vmm_protect
     return mprotect(address, region_size, access) == 0;
 }
 
+bool
+mem_vmm_prefault
+(
+    void      *address, 
+    size_t region_size
+)
+{
+    size_t page_size;
+    size_t    offset;
+
+    if (address == NULL || region_size == 0) {
+        return true;
+    }
+#if defined(MADV_POPULATE_WRITE)
+    if (madvise(address, region_size, MADV_POPULATE_WRITE) == 0) {
+        return true;
+    } /* Else, the kernel does not support MADV_POPULATE_WRITE; touch each page instead */
+#endif
+    page_size = mem_page_size();
+    for (offset = 0; offset < region_size; offset += page_size) {
+        ((uint8_t volatile*) address)[offset] = 0; /* Memory is freshly allocated, so it is already zero */
+    }
+    return true;
+}
+
+bool
+mem_vmm_decommit
+(
+    void      *address, 
+    size_t region_size
+)
+{
+    if (address == NULL || region_size == 0) {
+        return true;
+    }
+    return madvise(address, region_size, MADV_DONTNEED) == 0;
+}
+
 bool
 mem_vmm_release
 (
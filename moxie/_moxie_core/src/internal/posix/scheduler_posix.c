@@ -2,6 +2,7 @@
 #include <stdio.h>
 #include <stdlib.h>
 #include <string.h>
+#include <time.h>
 #include <assert.h>
 
 #include <unistd.h>
@@ -9,6 +10,8 @@
 #include <execinfo.h>
 #include <sys/mman.h>
 
+#include "internal/atomic_fences.h"
+#include "internal/memory.h"
 #include "internal/scheduler.h"
 
 /**
@@ -22,15 +25,37 @@
     __alignof__(_type)
 #endif
 
+/**
+ * Hint to the processor that the calling thread is in a spin-wait loop.
+ */
+#if defined(__x86_64__) || defined(__i386__)
+#   define SCHEDULER_cpu_relax()                                               \
+    __builtin_ia32_pause()
+#elif defined(__aarch64__) || defined(__arm__)
+#   define SCHEDULER_cpu_relax()                                               \
+    __asm__ __volatile__("yield" ::: "memory")
+#else
+#   define SCHEDULER_cpu_relax()                                               \
+    __atomic_signal_fence(__ATOMIC_SEQ_CST)
+#endif
+
 typedef struct job_queue_posix_t {                                             /* Data associated with a waitable job queue. */
     struct job_descriptor_t **storage;                                         /* Storage for queue entries. Capacity is always JOB_COUNT_MAX. */
-    uint64_t               push_count;                                         /* The number of push operations that have occurred against the queue. */
-    uint64_t               take_count;                                         /* The number of take operations that have occurred against the queue. */
     uint32_t                   signal;                                         /* Set to non-zero if the queue is in a signaled state due to an external event. */
     uint32_t                 queue_id;                                         /* The application-defined identifier for the queue. */
+    PLATFORM_STRUCT_ALIGN(CACHELINE_SIZE)
+    uint64_t               push_count;                                         /* The number of push operations that have occurred against the queue. Written by producers, on its own cache line. */
+    PLATFORM_STRUCT_ALIGN(CACHELINE_SIZE)
+    uint64_t               take_count;                                         /* The number of take operations that have occurred against the queue. Written by consumers, on its own cache line. */
+    PLATFORM_STRUCT_ALIGN(CACHELINE_SIZE)
+    uint32_t                 sleepers;                                         /* The number of stealing consumers parked on consumer_cv. */
+    uint32_t                  wakegen;                                         /* Incremented to wake parked stealing consumers when work is pushed to a context-local deque. */
+    PLATFORM_STRUCT_ALIGN(CACHELINE_SIZE)
     pthread_mutex_t             mutex;                                         /* The mutex used to synchronize access to the queue. */
     pthread_cond_t        consumer_cv;                                         /* The condition variable used to park consumer threads when the queue is empty. */
     pthread_cond_t        producer_cv;                                         /* The condition variable used to park producer threads when the queue is full. */
+    uint32_t                 ctxcount;                                         /* The number of valid entries in the contexts array. */
+    struct job_context_t    *contexts[JOB_QUEUE_CONTEXT_MAX];                  /* The stealing contexts that wait on this queue, which are the candidate steal victims. */
 } job_queue_posix_t;
 
 typedef struct job_data_posix_t {                                              /* Internal data associated with each job. */
@@ -39,13 +64,25 @@ typedef struct job_data_posix_t {                                              /
     uint32_t                  waitcnt;                                         /* The number of valid entries in the waiters array (max JOB_WAITER_COUNT_MAX). */
     int32_t                      wait;                                         /* The number of jobs that must complete before this job becomes ready-to-run (number of uncompleted dependencies). */
     int32_t                      work;                                         /* The number of jobs that must complete before this job can complete (number of uncompleted children+1 for self). */
-    int32_t                     state;                                         /* One of the values of the job_state_e enumeration identifying the current state of the job. */
 } job_data_posix_t;
 
+typedef struct job_status_posix_t {                                            /* Hot per-job data read when deciding whether a job can run, stored apart from job_data_posix_t. */
+    int32_t                     state;                                         /* One of the values of the job_state_e enumeration identifying the current state of the job. Written with the job lock held. */
+    job_id_t                   parent;                                         /* The identifier of the parent job, written when the job is created. */
+} job_status_posix_t;
+
+typedef struct job_wait_bank_posix_t {                                         /* Parking state for threads waiting on jobs whose slot indices map to the same bank. */
+    PLATFORM_STRUCT_ALIGN(CACHELINE_SIZE)
+    pthread_mutex_t             mutex;                                         /* The mutex protecting the cv condition variable. */
+    pthread_cond_t                 cv;                                         /* The condition variable used to park threads waiting for a job in this bank to complete. */
+    uint32_t                    count;                                         /* The number of threads parked on cv. */
+} job_wait_bank_posix_t;
+
 typedef struct job_scheduler_posix_t {                                         /* Data maintained by a scheduler instance. Primarily book-keeping data. */
     uint64_t                  memsize;                                         /* The size of the allocated memory region, in bytes. */
     job_descriptor_t         *jobdesc;                                         /* Storage for common job book-keeping attributes. Capacity is JOB_COUNT_MAX, random access. */
     job_data_posix_t         *jobdata;                                         /* Internal data representing job execution state. Capacity is JOB_COUNT_MAX, random access. */
+    job_status_posix_t       *jobstat;                                         /* Dense job state and parent links scanned on the dispatch path. Capacity is JOB_COUNT_MAX, random access. */
     job_buffer_t             **jobbuf;                                         /* List of pointers to all currently allocated job buffers. Capacity is jobctx_limit, items in use jobctx_count. */
 
     pthread_rwlock_t     queue_rwlock;                                         /* Reader-writer lock to protect queue information. */
@@ -62,6 +99,8 @@ typedef struct job_scheduler_posix_t {                                         /
     job_buffer_t        *jobbuf_flist;                                         /* Head node of the free list of job buffers. */
     size_t               jobbuf_limit;                                         /* The capacity of the jobbuf array. */
     size_t               jobbuf_count;                                         /* The number of valid entries in the jobbuf array. */
+    uint32_t             queue_policy;                                         /* One of the values of the job_queue_policy_e enumeration applied to acquired contexts. */
+    job_wait_bank_posix_t     jobwait[JOB_WAIT_BANK_COUNT];                    /* Threads parked in job_context_wait_job, keyed by the slot index of the job they wait on, so completion wakes only waiters of that job. */
 } job_scheduler_posix_t;
 
 typedef struct thread_arg_posix_t {                                            /* Data supplied to pthread_wrapper_entry when a thread is launched via thread_create. */
@@ -74,7 +113,7 @@ typedef struct thread_arg_posix_t {                                            /
  * @param address The address of the value to increment.
  * @return The resulting incremented value.
  */
-static uint32_t
+static inline PLATFORM_FORCE_INLINE uint32_t
 atomic_increment_u32
 (
     uint32_t volatile *address
@@ -88,7 +127,7 @@ atomic_increment_u32
  * @param address The address of the value to decrement.
  * @return The resulting decremented value.
  */
-static uint32_t
+static inline PLATFORM_FORCE_INLINE uint32_t
 atomic_decrement_u32
 (
     uint32_t volatile *address
@@ -319,6 +358,26 @@ current_thread_id
     return (thread_id_t) pthread_self();
 }
 
+int
+thread_set_affinity
+(
+    uint32_t cpu_index
+)
+{
+#if defined(__linux__)
+    cpu_set_t cpu_set;
+    if (cpu_index >= CPU_SETSIZE) {
+        return 0;
+    }
+    CPU_ZERO(&cpu_set);
+    CPU_SET(cpu_index, &cpu_set);
+    return pthread_setaffinity_np(pthread_self(), sizeof(cpu_set), &cpu_set) == 0 ? 1 : 0;
+#else
+    (void) sizeof(cpu_index); /* macOS exposes affinity only as a scheduling hint */
+    return 0;
+#endif
+}
+
 thread_id_t
 thread_create
 (
@@ -395,6 +454,36 @@ thread_join
     }
 }
 
+/**
+ * Allocate memory aligned to a cache line boundary, for structures with members that must not share a cache line.
+ * @param size The number of bytes to allocate.
+ * @return A pointer to the allocated memory, which must be freed with cacheline_free, or NULL.
+ */
+static void*
+cacheline_alloc
+(
+    size_t size
+)
+{
+    void *p = NULL;
+    if (posix_memalign(&p, CACHELINE_SIZE, size) != 0) {
+        return NULL;
+    } return p;
+}
+
+/**
+ * Free memory allocated with cacheline_alloc.
+ * @param p The address returned by cacheline_alloc. May be NULL.
+ */
+static void
+cacheline_free
+(
+    void *p
+)
+{
+    free(p);
+}
+
 struct job_queue_t*
 job_queue_create
 (
@@ -407,7 +496,7 @@ job_queue_create
     int                 access = PROT_READ   | PROT_WRITE;
     int                  flags = MAP_PRIVATE | MAP_ANONYMOUS;
 
-    if ((queue =(job_queue_posix_t*) malloc(sizeof(job_queue_posix_t))) == NULL) {
+    if ((queue =(job_queue_posix_t*) cacheline_alloc(sizeof(job_queue_posix_t))) == NULL) {
         return NULL;                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                              
     }
     if ((storage = mmap(NULL, storage_bytes, access, flags, -1, 0)) != MAP_FAILED) {
@@ -416,12 +505,15 @@ job_queue_create
         queue->take_count   = 0;
         queue->signal       = 0;
         queue->queue_id     = queue_id;
+        queue->sleepers     = 0;
+        queue->wakegen      = 0;
+        queue->ctxcount     = 0;
         (void) pthread_mutex_init(&queue->mutex, NULL);
         (void) pthread_cond_init (&queue->consumer_cv, NULL);
         (void) pthread_cond_init (&queue->producer_cv, NULL);
         return (struct job_queue_t*) queue;
     } else { /* Storage allocation failed */
-        free(queue);
+        cacheline_free(queue);
         return NULL;
     }
 }
@@ -441,7 +533,7 @@ job_queue_delete
             (void) munmap(queue_->storage, JOB_COUNT_MAX * sizeof(job_descriptor_t*));
             queue_->storage  = NULL;
         }
-        free(queue_);
+        cacheline_free(queue_);
     }
 }
 
@@ -468,16 +560,39 @@ job_queue_signal
 )
 {
     job_queue_posix_t *queue_ =(job_queue_posix_t*) queue;
+    uint32_t          changed = 0;
     if (pthread_mutex_lock(&queue_->mutex) == 0) {
-        queue_->signal = signal;
-        (void) pthread_mutex_unlock(&queue_->mutex);
-        if (signal != JOB_QUEUE_SIGNAL_CLEAR) {
+        if (queue_->signal != signal) {
+            queue_->signal  = signal;
+            changed = 1;
+        } (void) pthread_mutex_unlock(&queue_->mutex);
+        if (changed && signal != JOB_QUEUE_SIGNAL_CLEAR) {
             (void) pthread_cond_broadcast(&queue_->consumer_cv);
             (void) pthread_cond_broadcast(&queue_->producer_cv);
         }
     }
 }
 
+void
+job_queue_signal_one
+(
+    struct job_queue_t *queue,
+    uint32_t           signal
+)
+{
+    job_queue_posix_t *queue_ =(job_queue_posix_t*) queue;
+    uint32_t          changed = 0;
+    if (pthread_mutex_lock(&queue_->mutex) == 0) {
+        if (queue_->signal != signal) {
+            queue_->signal  = signal;
+            changed = 1;
+        } (void) pthread_mutex_unlock(&queue_->mutex);
+        if (changed && signal != JOB_QUEUE_SIGNAL_CLEAR) {
+            (void) pthread_cond_signal(&queue_->consumer_cv);
+        }
+    }
+}
+
 uint32_t
 job_queue_check_signal
 (
@@ -485,12 +600,8 @@ job_queue_check_signal
 )
 {
     job_queue_posix_t *queue_ =(job_queue_posix_t*) queue;
-    uint32_t           signal = 0;
-
-    if (pthread_mutex_lock(&queue_->mutex) == 0) {
-        signal = queue_->signal;
-        (void) pthread_mutex_unlock(&queue_->mutex);
-    } return signal;
+    /* The signal is written under the queue mutex, but a single aligned word can be read without it. */
+    return __atomic_load_n(&queue_->signal, __ATOMIC_ACQUIRE);
 }
 
 uint32_t
@@ -538,6 +649,43 @@ job_queue_push
     } return 0;
 }
 
+uint32_t
+job_queue_push_many
+(
+    struct job_queue_t     *queue,
+    struct job_descriptor_t **jobs,
+    size_t                   count
+)
+{
+    job_queue_posix_t  *queue_ =(job_queue_posix_t*) queue;
+    job_descriptor_t **storage = queue_->storage;
+    uint32_t const        mask = JOB_COUNT_MAX - 1;
+    uint32_t            pushed = 0;
+
+    if (jobs == NULL || count == 0) {
+        return 0;
+    }
+    if (pthread_mutex_lock(&queue_->mutex) == 0) {
+        while (pushed < count) {
+            if ((queue_->take_count + JOB_COUNT_MAX) > queue_->push_count && queue_->signal == JOB_QUEUE_SIGNAL_CLEAR) {
+                storage[queue_->push_count & mask] = jobs[pushed++];
+                queue_->push_count++;
+            } else if (queue_->signal != JOB_QUEUE_SIGNAL_CLEAR) {
+                break;
+            } else { /* Queue is full; wake consumers for the items pushed so far and wait for space */
+                (void) pthread_cond_broadcast(&queue_->consumer_cv);
+                (void) pthread_cond_wait(&queue_->producer_cv, &queue_->mutex);
+            }
+        }
+        (void) pthread_mutex_unlock(&queue_->mutex);
+        if (pushed == 1) {
+            (void) pthread_cond_signal   (&queue_->consumer_cv);
+        } else if (pushed > 1) {
+            (void) pthread_cond_broadcast(&queue_->consumer_cv);
+        }
+    } return pushed;
+}
+
 struct job_descriptor_t*
 job_queue_take
 (
@@ -549,7 +697,15 @@ job_queue_take
     job_descriptor_t     *item = NULL;
     uint32_t const        mask = JOB_COUNT_MAX - 1;
     uint32_t             index;
-
+    uint32_t              spin;
+
+    /* Spin briefly before taking the lock, so that work arriving shortly does not require a trip through the kernel */
+    for (spin = 0; spin < JOB_QUEUE_SPIN_COUNT; ++spin) {
+        if (__atomic_load_n(&queue_->take_count, __ATOMIC_RELAXED) < __atomic_load_n(&queue_->push_count, __ATOMIC_RELAXED) ||
+            __atomic_load_n(&queue_->signal    , __ATOMIC_RELAXED) != JOB_QUEUE_SIGNAL_CLEAR) {
+            break;
+        } SCHEDULER_cpu_relax();
+    }
     if (pthread_mutex_lock(&queue_->mutex) == 0) {
         for ( ; ; ) {
             if (queue_->take_count < queue_->push_count || queue_->signal != JOB_QUEUE_SIGNAL_CLEAR) {
@@ -572,10 +728,492 @@ job_queue_take
     } return NULL;
 }
 
+/**
+ * Take a ready-to-run job from a job queue without blocking.
+ * @param queue The queue to take from.
+ * @return A pointer to the dequeued job descriptor, or NULL if the queue is empty or signaled.
+ */
+static struct job_descriptor_t*
+job_queue_try_take
+(
+    struct job_queue_t *queue
+)
+{
+    job_queue_posix_t  *queue_ =(job_queue_posix_t*) queue;
+    job_descriptor_t     *item = NULL;
+    uint32_t const        mask = JOB_COUNT_MAX - 1;
+
+    if (pthread_mutex_lock(&queue_->mutex) == 0) {
+        if (queue_->take_count < queue_->push_count && queue_->signal == JOB_QUEUE_SIGNAL_CLEAR) {
+            item = queue_->storage[queue_->take_count & mask];
+            queue_->take_count++;
+        }
+        (void) pthread_mutex_unlock(&queue_->mutex);
+        if (item != NULL) {
+            (void) pthread_cond_signal(&queue_->producer_cv);
+        }
+    } return item;
+}
+
+/**
+ * Wake one stealing consumer parked on a queue after work was pushed to a context-local deque.
+ * The caller must have published the deque item before calling this function.
+ * @param queue The queue on which stealing consumers may be parked.
+ */
+static void
+job_queue_notify
+(
+    struct job_queue_t *queue
+)
+{
+    job_queue_posix_t *queue_ =(job_queue_posix_t*) queue;
+
+    /* Pairs with the sleeper registration in job_queue_park; either the parking thread sees the new item or this thread sees the sleeper. */
+    __atomic_thread_fence(__ATOMIC_SEQ_CST);
+    if (__atomic_load_n(&queue_->sleepers, __ATOMIC_SEQ_CST) != 0) {
+        if (pthread_mutex_lock(&queue_->mutex) == 0) {
+            queue_->wakegen++;
+            (void) pthread_mutex_unlock(&queue_->mutex);
+            (void) pthread_cond_signal (&queue_->consumer_cv);
+        }
+    }
+}
+
+/**
+ * Register a stealing job context with the queue it waits on, making it visible to other contexts as a steal victim.
+ * @param queue The wait queue of the context.
+ * @param context The context to register.
+ * @return Non-zero if the context was registered, or zero if the queue already has JOB_QUEUE_CONTEXT_MAX registered contexts.
+ */
+static uint32_t
+job_queue_register_context
+(
+    struct job_queue_t     *queue,
+    struct job_context_t *context
+)
+{
+    job_queue_posix_t *queue_ =(job_queue_posix_t*) queue;
+    uint32_t       registered = 0;
+
+    if (pthread_mutex_lock(&queue_->mutex) == 0) {
+        if (queue_->ctxcount < JOB_QUEUE_CONTEXT_MAX) {
+            __atomic_store_n(&queue_->contexts[queue_->ctxcount], context, __ATOMIC_RELEASE);
+            __atomic_store_n(&queue_->ctxcount, queue_->ctxcount + 1, __ATOMIC_RELEASE);
+            registered = 1;
+        } (void) pthread_mutex_unlock(&queue_->mutex);
+    } return registered;
+}
+
+/**
+ * Remove a stealing job context from the set of steal victims for a queue.
+ * Thieves may still observe the context briefly; contexts are never freed while the scheduler is live, so this is safe.
+ * @param queue The wait queue of the context.
+ * @param context The context to unregister.
+ */
+static void
+job_queue_unregister_context
+(
+    struct job_queue_t     *queue,
+    struct job_context_t *context
+)
+{
+    job_queue_posix_t *queue_ =(job_queue_posix_t*) queue;
+    uint32_t                i, n;
+
+    if (pthread_mutex_lock(&queue_->mutex) == 0) {
+        for (i = 0, n = queue_->ctxcount; i < n; ++i) {
+            if (queue_->contexts[i] == context) {
+                __atomic_store_n(&queue_->contexts[i], queue_->contexts[n-1], __ATOMIC_RELEASE);
+                __atomic_store_n(&queue_->ctxcount, n - 1, __ATOMIC_RELEASE);
+                break;
+            }
+        } (void) pthread_mutex_unlock(&queue_->mutex);
+    }
+}
+
+/**
+ * Push a job onto the bottom of the ready deque of a job context. Only the owning thread may call this function.
+ * @param context The job context that owns the deque.
+ * @param job The ready-to-run job.
+ * @return Non-zero if the job was pushed, or zero if the deque is full.
+ */
+static inline PLATFORM_FORCE_INLINE uint32_t
+job_deque_push
+(
+    struct job_context_t *context,
+    struct job_descriptor_t  *job
+)
+{
+    int64_t b = ATOMIC_LOAD_RLX(&context->bottom);
+    int64_t t = ATOMIC_LOAD_ACQ(&context->top);
+
+    if ((b - t) >= JOB_CONTEXT_RTRQ_MAX) {
+        return 0;
+    }
+    ATOMIC_STORE_RLX(&context->ready[b & (JOB_CONTEXT_RTRQ_MAX - 1)], job);
+    ATOMIC_STORE_REL(&context->bottom, b + 1);
+    return 1;
+}
+
+/**
+ * Pop the most recently pushed job from the bottom of the ready deque of a job context. Only the owning thread may call this function.
+ * @param context The job context that owns the deque.
+ * @return The job descriptor, or NULL if the deque is empty or the last item was taken by a thief.
+ */
+static inline PLATFORM_FORCE_INLINE struct job_descriptor_t*
+job_deque_pop
+(
+    struct job_context_t *context
+)
+{
+    job_descriptor_t *job = NULL;
+    int64_t             b = ATOMIC_LOAD_RLX(&context->bottom) - 1;
+    int64_t             t;
+
+    ATOMIC_STORE_RLX(&context->bottom, b);
+    ATOMIC_FULL_FENCE();
+    t = ATOMIC_LOAD_RLX(&context->top);
+    if (t <= b) {
+        job = ATOMIC_LOAD_RLX(&context->ready[b & (JOB_CONTEXT_RTRQ_MAX - 1)]);
+        if (t == b) { /* Last item; race against thieves for it */
+            if (ATOMIC_CAS_SEQ_CST(&context->top, &t, t + 1) == 0) {
+                job = NULL;
+            }
+            ATOMIC_STORE_RLX(&context->bottom, b + 1);
+        }
+    } else { /* Empty */
+        ATOMIC_STORE_RLX(&context->bottom, b + 1);
+    }
+    return job;
+}
+
+/**
+ * Steal the oldest job from the top of the ready deque of another job context.
+ * @param victim The job context to steal from.
+ * @return The stolen job descriptor, or NULL if the deque was empty or another thread won the race for the item.
+ */
+static inline PLATFORM_FORCE_INLINE struct job_descriptor_t*
+job_deque_steal
+(
+    struct job_context_t *victim
+)
+{
+    job_descriptor_t *job = NULL;
+    int64_t             t = ATOMIC_LOAD_ACQ(&victim->top);
+    int64_t             b;
+
+    ATOMIC_STEAL_FENCE();
+    b = ATOMIC_LOAD_ACQ(&victim->bottom);
+    if (t < b) {
+        job = ATOMIC_LOAD_RLX(&victim->ready[t & (JOB_CONTEXT_RTRQ_MAX - 1)]);
+        if (ATOMIC_CAS_SEQ_CST(&victim->top, &t, t + 1) == 0) {
+            job = NULL; /* Lost the race with the owner or another thief */
+        }
+    } return job;
+}
+
+/**
+ * Steal up to half of the jobs in the ready deque of another job context, oldest first.
+ * Each job is claimed with its own compare-and-swap on the top index, since the owner pops from the bottom without synchronizing with thieves while more than one item remains.
+ * Claiming stops at the first lost race, so under contention this degrades to a single-item steal.
+ * @param victim The job context to steal from.
+ * @param jobs The array into which stolen job descriptors are written.
+ * @param max_count The maximum number of jobs to steal. This value must be at least one.
+ * @return The number of jobs written to the `jobs` array.
+ */
+static uint32_t
+job_deque_steal_n
+(
+    struct job_context_t   *victim,
+    struct job_descriptor_t **jobs,
+    uint32_t             max_count
+)
+{
+    int64_t     t = ATOMIC_LOAD_ACQ(&victim->top);
+    int64_t     b = ATOMIC_LOAD_ACQ(&victim->bottom);
+    uint32_t want = 1;
+    uint32_t    n = 0;
+
+    if (b - t > 3) {
+        want = (uint32_t)((b - t) / 2);
+    }
+    if (want > max_count) {
+        want = max_count;
+    }
+    while (n < want && (jobs[n] = job_deque_steal(victim)) != NULL) {
+        n++;
+    } return n;
+}
+
+/**
+ * Estimate the number of jobs in the ready deque of a job context. The result may be stale by the time it is used.
+ * @param victim The job context whose deque should be inspected.
+ * @return The approximate number of items in the deque, or zero if it appears empty.
+ */
+static inline PLATFORM_FORCE_INLINE int64_t
+job_deque_size
+(
+    struct job_context_t *victim
+)
+{
+    int64_t t = ATOMIC_LOAD_RLX(&victim->top);
+    int64_t b = ATOMIC_LOAD_RLX(&victim->bottom);
+    return (b > t) ? (b - t) : 0;
+}
+
+/**
+ * Attempt to steal jobs from the other stealing contexts that wait on the same queue as a given context.
+ * The victim with the most queued jobs is tried first, with ties going to the most recent successful victim or a randomly selected context.
+ * If that steal loses a race, victims are visited in order from the same starting point.
+ * Up to half of the victim's deque is taken; the first stolen job is returned and the remainder are pushed onto the thief's own deque.
+ * @param context The job context of the calling (thief) thread.
+ * @return The stolen job descriptor, or NULL if no job could be stolen.
+ */
+static struct job_descriptor_t*
+job_context_steal
+(
+    struct job_context_t *context
+)
+{
+    job_queue_posix_t *queue_ =(job_queue_posix_t*) context->queue;
+    job_context_t     *victim = NULL;
+    job_descriptor_t  *stolen[JOB_CONTEXT_STEAL_MAX];
+    uint32_t           nvictim= __atomic_load_n(&queue_->ctxcount, __ATOMIC_ACQUIRE);
+    int64_t          best_size = 0;
+    int64_t               size = 0;
+    uint32_t              best = JOB_QUEUE_CONTEXT_MAX;
+    uint32_t             count = 0;
+    uint32_t             start;
+    uint32_t             index;
+    uint32_t                 i;
+
+    if (nvictim == 0) {
+        return NULL;
+    }
+    /* xorshift32 */
+    context->seed ^= context->seed << 13;
+    context->seed ^= context->seed >> 17;
+    context->seed ^= context->seed << 5;
+    start = context->victim < nvictim ? context->victim : context->seed % nvictim;
+    for (i = 0; i < nvictim; ++i) { /* Target the fullest deque so each steal-half moves as many jobs as possible */
+        index  =(start + i) % nvictim;
+        victim = __atomic_load_n(&queue_->contexts[index], __ATOMIC_ACQUIRE);
+        if (victim != NULL && victim != context && (size = job_deque_size(victim)) > best_size) {
+            best_size = size;
+            best      = index;
+        }
+    }
+    if (best != JOB_QUEUE_CONTEXT_MAX) {
+        index  = best;
+        victim = __atomic_load_n(&queue_->contexts[index], __ATOMIC_ACQUIRE);
+        if ((count = job_deque_steal_n(victim, stolen, JOB_CONTEXT_STEAL_MAX)) != 0) {
+            context->victim = index;
+        }
+    }
+    for (i = 0; i < nvictim && count == 0; ++i) {
+        index  =(start + i) % nvictim;
+        victim = __atomic_load_n(&queue_->contexts[index], __ATOMIC_ACQUIRE);
+        if (victim != NULL && victim != context) {
+            if ((count = job_deque_steal_n(victim, stolen, JOB_CONTEXT_STEAL_MAX)) != 0) {
+                context->victim = index;
+            }
+        }
+    }
+    if (count == 0) {
+        context->victim = JOB_QUEUE_CONTEXT_MAX;
+        return NULL;
+    }
+    for (i = 1; i < count; ++i) {
+        if (job_deque_push(context, stolen[i]) == 0) {
+            job_queue_push(stolen[i]->target, stolen[i]);
+        }
+    }
+    if (count > 1) {
+        job_queue_notify(context->queue);
+    } return stolen[0];
+}
+
+/**
+ * Determine whether any stealing context registered with a queue has items in its ready deque.
+ * @param queue The queue whose registered contexts should be inspected.
+ * @return Non-zero if at least one deque appears to be non-empty.
+ */
+static uint32_t
+job_queue_has_stealable_work
+(
+    struct job_queue_t *queue
+)
+{
+    job_queue_posix_t *queue_ =(job_queue_posix_t*) queue;
+    job_context_t        *ctx = NULL;
+    uint32_t                n = __atomic_load_n(&queue_->ctxcount, __ATOMIC_ACQUIRE);
+    uint32_t                i;
+
+    for (i = 0; i < n; ++i) {
+        if ((ctx = __atomic_load_n(&queue_->contexts[i], __ATOMIC_ACQUIRE)) != NULL) {
+            if (__atomic_load_n(&ctx->bottom, __ATOMIC_SEQ_CST) > __atomic_load_n(&ctx->top, __ATOMIC_SEQ_CST)) {
+                return 1;
+            }
+        }
+    } return 0;
+}
+
+/**
+ * Park a stealing consumer on a queue until work is pushed to the queue or to a context-local deque, or the queue is signaled.
+ * @param queue The queue to park on.
+ */
+static void
+job_queue_park
+(
+    struct job_queue_t *queue
+)
+{
+    job_queue_posix_t *queue_ =(job_queue_posix_t*) queue;
+    uint32_t              gen = 0;
+    uint32_t             spin;
+
+    /* Spin briefly before registering as a sleeper; the caller polls again if work shows up */
+    for (spin = 0; spin < JOB_QUEUE_SPIN_COUNT; ++spin) {
+        if (__atomic_load_n(&queue_->take_count, __ATOMIC_RELAXED) < __atomic_load_n(&queue_->push_count, __ATOMIC_RELAXED) ||
+            __atomic_load_n(&queue_->signal    , __ATOMIC_RELAXED) != JOB_QUEUE_SIGNAL_CLEAR || job_queue_has_stealable_work(queue)) {
+            return;
+        } SCHEDULER_cpu_relax();
+    }
+    if (pthread_mutex_lock(&queue_->mutex) == 0) {
+        gen = queue_->wakegen;
+        __atomic_add_fetch(&queue_->sleepers, 1, __ATOMIC_SEQ_CST);
+        (void) pthread_mutex_unlock(&queue_->mutex);
+    } else {
+        return;
+    }
+    /* Re-check the deques after registering as a sleeper so that a concurrent push cannot be missed */
+    if (job_queue_has_stealable_work(queue) == 0 && pthread_mutex_lock(&queue_->mutex) == 0) {
+        while (gen == queue_->wakegen && queue_->take_count >= queue_->push_count && queue_->signal == JOB_QUEUE_SIGNAL_CLEAR) {
+            (void) pthread_cond_wait(&queue_->consumer_cv, &queue_->mutex);
+        }
+        (void) pthread_mutex_unlock(&queue_->mutex);
+    }
+    __atomic_sub_fetch(&queue_->sleepers, 1, __ATOMIC_SEQ_CST);
+}
+
+/**
+ * Retrieve the next ready-to-run job for a context, blocking if no work is available.
+ * With JOB_QUEUE_POLICY_STEALING, the context-local deque is checked first, then other contexts on the same queue, then the shared queue.
+ * @param context The job context bound to the calling thread.
+ * @return The job descriptor, or NULL if the wait queue was signaled.
+ */
+static struct job_descriptor_t*
+job_context_take_ready
+(
+    struct job_context_t *context
+)
+{
+    job_queue_posix_t *queue_ =(job_queue_posix_t*) context->queue;
+    job_descriptor_t     *job = NULL;
+    uint32_t          attempt;
+
+    if (context->policy != JOB_QUEUE_POLICY_STEALING) {
+        return job_queue_take(context->queue);
+    }
+    for ( ; ; ) {
+        if (__atomic_load_n(&queue_->signal, __ATOMIC_ACQUIRE) != JOB_QUEUE_SIGNAL_CLEAR) {
+            return NULL;
+        }
+        if ((job = job_deque_pop(context)) != NULL) {
+            return job;
+        }
+        for (attempt = 0; attempt < JOB_CONTEXT_STEAL_TRIES; ++attempt) {
+            if ((job = job_context_steal(context)) != NULL) {
+                return job;
+            }
+            if ((job = job_queue_try_take(context->queue)) != NULL) {
+                return job;
+            }
+        }
+        job_queue_park(context->queue);
+    }
+}
+
+/**
+ * Retrieve the next ready-to-run job for a context without blocking.
+ * @param context The job context bound to the calling thread.
+ * @return The job descriptor, or NULL if no work is currently available.
+ */
+static struct job_descriptor_t*
+job_context_poll_ready
+(
+    struct job_context_t *context
+)
+{
+    job_descriptor_t *job = NULL;
+
+    if (context->policy == JOB_QUEUE_POLICY_STEALING) {
+        if ((job = job_deque_pop(context)) != NULL) {
+            return job;
+        }
+        if ((job = job_context_steal(context)) != NULL) {
+            return job;
+        }
+    } return job_queue_try_take(context->queue);
+}
+
+/**
+ * Make a job available to run. Jobs targeting the wait queue of a stealing context are pushed to its local deque.
+ * @param context The job context bound to the calling thread.
+ * @param job The ready-to-run job.
+ */
+static void
+job_context_push_ready
+(
+    struct job_context_t *context,
+    struct job_descriptor_t  *job
+)
+{
+    if (context->policy == JOB_QUEUE_POLICY_STEALING && job->target == context->queue) {
+        if (job_deque_push(context, job)) {
+            job_queue_notify(context->queue);
+            return;
+        }
+    }
+    job_queue_push(job->target, job);
+}
+
+/**
+ * Make several jobs that share a target queue available to run.
+ * @param context The job context bound to the calling thread.
+ * @param queue The target queue shared by all of the jobs.
+ * @param jobs The ready-to-run jobs.
+ * @param count The number of jobs in the `jobs` array.
+ */
+static void
+job_context_push_ready_many
+(
+    struct job_context_t     *context,
+    struct job_queue_t         *queue,
+    struct job_descriptor_t    **jobs,
+    size_t                      count
+)
+{
+    size_t i = 0;
+
+    if (context->policy == JOB_QUEUE_POLICY_STEALING && queue == context->queue) {
+        while (i < count && job_deque_push(context, jobs[i])) {
+            i++;
+        }
+        if (i != 0) {
+            job_queue_notify(queue);
+        }
+    }
+    if (i < count) {
+        (void) job_queue_push_many(queue, &jobs[i], count - i);
+    }
+}
+
 struct job_scheduler_t*
 job_scheduler_create
 (
-    size_t context_count
+    size_t context_count,
+    uint32_t queue_policy
 )
 {
     job_scheduler_posix_t *scheduler = NULL;
@@ -601,7 +1239,8 @@ job_scheduler_create
     }
 
     /* Determine the amount of memory required, rounded up to the next multiple of page size */
-    bytes_needed     += sizeof(job_scheduler_posix_t );
+    bytes_needed     += mem_align_up(sizeof(job_scheduler_posix_t), CACHELINE_SIZE);
+    bytes_needed     += sizeof(job_status_posix_t    )  *   JOB_COUNT_MAX;    /* jobstat     */
     bytes_needed     += sizeof(job_descriptor_t      )  *   JOB_COUNT_MAX;    /* jobdesc     */
     bytes_needed     += sizeof(job_data_posix_t      )  *   JOB_COUNT_MAX;    /* jobdata     */
     bytes_needed     += sizeof(job_buffer_t         *)  *   jobbuf_capacity;  /* jobbuf      */
@@ -613,14 +1252,16 @@ job_scheduler_create
     } ptr = memory_base;
 
     /* Sub-allocate various arrays from the larger block */
-    scheduler          = (job_scheduler_posix_t*) ptr; ptr += sizeof(job_scheduler_posix_t);
+    /* The hot jobstat array comes first, starting on a cache line boundary, so that the status of adjacent job slots shares as few cache lines as possible. */
+    scheduler          = (job_scheduler_posix_t*) ptr; ptr += mem_align_up(sizeof(job_scheduler_posix_t), CACHELINE_SIZE);
+    scheduler->jobstat = (job_status_posix_t   *) ptr; ptr += sizeof(job_status_posix_t   ) * JOB_COUNT_MAX;
     scheduler->jobdesc = (job_descriptor_t     *) ptr; ptr += sizeof(job_descriptor_t     ) * JOB_COUNT_MAX;
     scheduler->jobdata = (job_data_posix_t     *) ptr; ptr += sizeof(job_data_posix_t     ) * JOB_COUNT_MAX;
     scheduler->jobbuf  = (job_buffer_t        **) ptr; ptr += sizeof(job_buffer_t        *) * jobbuf_capacity;
 
     /* Pre-allocate the specified number of job contexts */
     for (i = 0; i < context_count; ++i) {
-        if ((jobctx = (job_context_t*) malloc(sizeof(job_context_t))) == NULL) {
+        if ((jobctx = (job_context_t*) cacheline_alloc(sizeof(job_context_t))) == NULL) {
             goto cleanup_and_fail;
         } else {
             jobctx->next   = scheduler->jobctx_flist;
@@ -631,7 +1272,13 @@ job_scheduler_create
             jobctx->user1  = 0;
             jobctx->user2  = 0;
             jobctx->jobcnt = 0;
+            jobctx->policy = JOB_QUEUE_POLICY_SHARED;
+            jobctx->top    = 0;
+            jobctx->bottom = 0;
+            jobctx->seed   = 0;
             jobctx->pad1   = 0;
+            jobctx->victim = JOB_QUEUE_CONTEXT_MAX;
+            jobctx->pad2   = 0;
             scheduler->jobctx_flist = jobctx;
         }
     }
@@ -650,11 +1297,17 @@ job_scheduler_create
     (void) pthread_rwlock_init(&scheduler->queue_rwlock , NULL);
     (void) pthread_rwlock_init(&scheduler->jobctx_rwlock, NULL);
     (void) pthread_mutex_init (&scheduler->jobbuf_mutex , NULL);
+    for (i = 0; i < JOB_WAIT_BANK_COUNT; ++i) {
+        (void) pthread_mutex_init(&scheduler->jobwait[i].mutex, NULL);
+        (void) pthread_cond_init (&scheduler->jobwait[i].cv   , NULL);
+        scheduler->jobwait[i].count = 0;
+    }
     scheduler->queue_count  = 0;
     scheduler->memsize      = bytes_needed;
     scheduler->jobctx_count = context_count;
     scheduler->jobbuf_limit = jobbuf_capacity;
     scheduler->jobbuf_count = context_count;
+    scheduler->queue_policy = queue_policy;
     return (struct job_scheduler_t*) scheduler;
 
 cleanup_and_fail:
@@ -668,7 +1321,7 @@ cleanup_and_fail:
             while (scheduler->jobctx_flist != NULL) {
                 jobctx = scheduler->jobctx_flist;
                 scheduler->jobctx_flist = jobctx->next;
-                free(jobctx);
+                cacheline_free(jobctx);
             }
         }
         (void) munmap((void*) memory_base, bytes_needed);
@@ -689,9 +1342,9 @@ job_scheduler_delete
         size_t                  i, n;
 
         for (i = 0; i < JOB_COUNT_MAX; ++i) {
-            if (sched_->jobdata[i].state != JOB_STATE_UNINITIALIZED) {
+            if (sched_->jobstat[i].state != JOB_STATE_UNINITIALIZED) {
                 (void) pthread_mutex_destroy(&sched_->jobdata[i].lock);
-                sched_->jobdata[i].state  = JOB_STATE_UNINITIALIZED;
+                sched_->jobstat[i].state  = JOB_STATE_UNINITIALIZED;
             }
         }
         if (pthread_mutex_lock(&sched_->jobbuf_mutex) == 0) {
@@ -705,12 +1358,16 @@ job_scheduler_delete
             while (sched_->jobctx_flist != NULL) {
                 jobctx = sched_->jobctx_flist;
                 sched_->jobctx_flist = jobctx->next;
-                free(jobctx); // NOTE: ctx->jobbuf was freed above
+                cacheline_free(jobctx); // NOTE: ctx->jobbuf was freed above
                 ctxfree++;
             }
             (void) pthread_rwlock_unlock(&sched_->jobctx_rwlock);
             assert(ctxfree == sched_->jobctx_count && "One or more non-released job contexts detected, these will leak");
         }
+        for (i = 0; i < JOB_WAIT_BANK_COUNT; ++i) {
+            (void) pthread_cond_destroy (&sched_->jobwait[i].cv);
+            (void) pthread_mutex_destroy(&sched_->jobwait[i].mutex);
+        }
         (void) pthread_mutex_destroy (&sched_->jobbuf_mutex);
         (void) pthread_rwlock_destroy(&sched_->jobctx_rwlock);
         (void) pthread_rwlock_destroy(&sched_->queue_rwlock);
@@ -734,6 +1391,12 @@ job_scheduler_terminate
                 job_queue_signal(queue, JOB_QUEUE_SIGNAL_TERMINATE);
             } (void) pthread_rwlock_unlock(&sched_->queue_rwlock);
         }
+        for (i = 0; i < JOB_WAIT_BANK_COUNT; ++i) {
+            if (pthread_mutex_lock(&sched_->jobwait[i].mutex) == 0) {
+                (void) pthread_cond_broadcast(&sched_->jobwait[i].cv);
+                (void) pthread_mutex_unlock(&sched_->jobwait[i].mutex);
+            }
+        }
     }
 }
 
@@ -757,7 +1420,7 @@ job_scheduler_acquire_context
             /* Acquire or allocate a job_context_t */
             if ((ctx = sched_->jobctx_flist) != NULL) {
                 sched_->jobctx_flist = ctx->next;
-            } else if ((ctx = (job_context_t*) malloc(sizeof(job_context_t))) != NULL) {
+            } else if ((ctx = (job_context_t*) cacheline_alloc(sizeof(job_context_t))) != NULL) {
                 sched_->jobctx_count++;
             } /* Else, failed to allocate a context */
             (void) pthread_rwlock_unlock(&sched_->jobctx_rwlock);
@@ -772,7 +1435,15 @@ job_scheduler_acquire_context
                 ctx->user1  = 0;
                 ctx->user2  = 0;
                 ctx->jobcnt = 0;
+                ctx->policy = JOB_QUEUE_POLICY_SHARED;
+                ctx->top    = 0;
+                ctx->bottom = 0;
+                ctx->seed   =(uint32_t)(owner_tid ^ (owner_tid >> 32)) | 1U; /* xorshift state must be non-zero */
                 ctx->pad1   = 0;
+                ctx->victim = JOB_QUEUE_CONTEXT_MAX;
+                if (sched_->queue_policy == JOB_QUEUE_POLICY_STEALING && job_queue_register_context(wait_queue, ctx)) {
+                    ctx->policy = JOB_QUEUE_POLICY_STEALING;
+                }
             } else { /* Failed to acquire a job buffer. */
                 if (ctx != NULL) { /* Return ctx to the free pool. */
                     ctx->next  = sched_->jobctx_flist;
@@ -817,6 +1488,16 @@ job_scheduler_release_context
         uint32_t                 qix  = JOB_QUEUE_COUNT_MAX;
         size_t                  i, n;
 
+        // Hand any jobs left in the local deque to the shared queue so that they still run.
+        if (context->policy == JOB_QUEUE_POLICY_STEALING) {
+            job_descriptor_t *job = NULL;
+            job_queue_unregister_context(context->queue, context);
+            while ((job = job_deque_pop(context)) != NULL) {
+                job_queue_push(job->target, job);
+            }
+            context->policy = JOB_QUEUE_POLICY_SHARED;
+        }
+
         // Return the context back to the free pool.
         if (pthread_rwlock_wrlock(&sched_->jobctx_rwlock) == 0) {
             context->next        = sched_->jobctx_flist;
@@ -909,12 +1590,14 @@ job_scheduler_cancel
         job_scheduler_posix_t  *sched_=(job_scheduler_posix_t  *) scheduler;
         uint32_t           slot_index = job_id_get_slot_index_u32(id);
         job_data_posix_t    *job_data =&sched_->jobdata[slot_index];
+        job_status_posix_t  *job_stat =&sched_->jobstat[slot_index];
         job_state_e             state = JOB_STATE_UNINITIALIZED;
         if (pthread_mutex_lock(&job_data->lock) == 0) {
             if (state != JOB_STATE_RUNNING && state != JOB_STATE_COMPLETED) {
-                state  = job_data->state = JOB_STATE_CANCELED;
+                state  = JOB_STATE_CANCELED;
+                __atomic_store_n(&job_stat->state, state, __ATOMIC_RELEASE);
             } else {
-                state  = job_data->state;
+                state  = job_stat->state;
             } (void) pthread_mutex_unlock(&job_data->lock);
         } return state;
     } else {
@@ -982,6 +1665,7 @@ struct job_descriptor_t*
 job_context_create_job
 (
     struct job_context_t   *context,
+    job_id_t                 parent,
     size_t                data_size,
     size_t               data_align
 )
@@ -989,6 +1673,7 @@ job_context_create_job
     job_scheduler_posix_t *sched =(job_scheduler_posix_t*) context->sched;
     job_descriptor_t        *job = NULL;
     job_data_posix_t       *data = NULL;
+    job_status_posix_t     *stat = NULL;
     job_buffer_t         *jobbuf = context->jobbuf;
     uint32_t           new_count = context->jobcnt + 1;
     uint32_t          slot_index = 0;
@@ -1033,6 +1718,7 @@ job_context_create_job
     /* Initialize the job descriptor (public data) */
     job  = &sched->jobdesc[slot_index];
     data = &sched->jobdata[slot_index];
+    stat = &sched->jobstat[slot_index];
     generation   = job_id_get_generation_u32(job->id) + 1;
     job->jobbuf  = jobbuf;
     job->target  = NULL;
@@ -1042,18 +1728,19 @@ job_context_create_job
     job->data    = user_data;
     job->size    =(uint32_t) data_size;
     job->id      = job_id_pack(slot_index, generation);
-    job->parent  = JOB_ID_INVALID;
+    job->parent  = parent;
     job->exit    = 0;
 
     /* Initialize the internal per-job state */
-    if (data->state == JOB_STATE_UNINITIALIZED) {
+    if (stat->state == JOB_STATE_UNINITIALIZED) {
         (void) pthread_mutex_init(&data->lock, NULL);
     }
     data->waiters = wait_list;
     data->waitcnt = 0;
     data->wait    =-1; /* Not ready-to-run until submitted */
     data->work    = 1; /* One work item representing self  */
-    data->state   = JOB_STATE_NOT_SUBMITTED;
+    stat->parent  = parent; /* Hot status is complete at creation, so the dispatch-path parent walk never needs the cold descriptor */
+    __atomic_store_n(&stat->state, JOB_STATE_NOT_SUBMITTED, __ATOMIC_RELEASE);
 
     /* Update state on the job context */
     if (new_count != JOB_BUFFER_JOB_COUNT) {
@@ -1066,20 +1753,32 @@ job_context_create_job
     return job;
 }
 
-int
-job_context_submit_job
+/**
+ * Perform the book-keeping for submitting a job to execute or for cancellation, without pushing it to a ready-to-run queue.
+ * @param context The job context from which the job was allocated.
+ * @param job The job descriptor returned by the prior call to `job_context_create_job`.
+ * @param dependency_list The list of identifiers of jobs that must complete before the job being submitted can run. Specify `NULL` for an empty list.
+ * @param dependency_count The number of identifiers in `dependency_list`. Specify 0 for an empty list.
+ * @param submit_type One of the values of the `job_submit_type_e` enumeration.
+ * @param ready On return, set to non-zero if the caller must push the job onto `job->target`.
+ * @return One of the values of the `job_submit_result_e` enumeration, indicating whether job submission was successful.
+ */
+static int
+job_context_prepare_submit
 (
     struct job_context_t   *context,
     struct job_descriptor_t    *job,
     job_id_t const *dependency_list,
     size_t         dependency_count,
-    int                 submit_type
+    int                 submit_type,
+    uint32_t                 *ready
 )
 {
     if (job != NULL) {
         struct job_queue_t  *defaultq = context->queue;
         job_scheduler_posix_t  *sched =(job_scheduler_posix_t*) context->sched;
         job_data_posix_t    *all_data = sched->jobdata;
+        job_status_posix_t  *all_stat = sched->jobstat;
         uint32_t             job_slot = job_id_get_slot_index_u32(job->id);
         uint32_t          parent_slot = job_id_get_slot_index_u32(job->parent);
         job_data_posix_t    *dep_data = NULL;
@@ -1118,7 +1817,7 @@ job_context_submit_job
                     dep_slot = job_id_get_slot_index_u32(dependency_list[i]);
                     dep_data =&all_data[dep_slot];
                     if (pthread_mutex_lock(&dep_data->lock) == 0) {
-                        if (dep_data->state != JOB_STATE_COMPLETED && dep_data->state != JOB_STATE_CANCELED) {
+                        if (all_stat[dep_slot].state != JOB_STATE_COMPLETED && all_stat[dep_slot].state != JOB_STATE_CANCELED) {
                             if (dep_data->waitcnt != JOB_WAITER_COUNT_MAX) {
                                 dep_data->waiters[dep_data->waitcnt++] = (uint16_t) job_slot;
                                 wait_count++;
@@ -1143,7 +1842,7 @@ job_context_submit_job
                 parent_slot = job_id_get_slot_index_u32(job->parent);
                 parent_data =&all_data[parent_slot];
                 if (pthread_mutex_lock(&parent_data->lock) == 0) {
-                    if (parent_data->state != JOB_STATE_CANCELED) {
+                    if (all_stat[parent_slot].state != JOB_STATE_CANCELED) {
                         parent_data->work++;
                     } (void) pthread_mutex_unlock(&parent_data->lock);
                 }
@@ -1164,20 +1863,84 @@ job_context_submit_job
             if((job_data->wait   =(job_data->wait + wait_count + 1)) == 0) {
                 state = JOB_STATE_READY;
             }
-            if (job_data->state != JOB_STATE_CANCELED) {
-                job_data->state  = state;
+            if (all_stat[job_slot].state != JOB_STATE_CANCELED) {
+                __atomic_store_n(&all_stat[job_slot].state, state, __ATOMIC_RELEASE);
             } (void) pthread_mutex_unlock(&job_data->lock);
         }
 
-        /* Finally, potentially submit the job to the ready-to-run queue. */
-        if (state != JOB_STATE_NOT_READY) {
-            job_queue_push(job->target, job);
-        } return result;
+        /* Finally, let the caller submit the job to the ready-to-run queue. */
+        *ready = (state != JOB_STATE_NOT_READY) ? 1 : 0;
+        return result;
     } else {
+        *ready = 0;
         return JOB_SUBMIT_INVALID_JOB;
     }
 }
 
+int
+job_context_submit_job
+(
+    struct job_context_t   *context,
+    struct job_descriptor_t    *job,
+    job_id_t const *dependency_list,
+    size_t         dependency_count,
+    int                 submit_type
+)
+{
+    uint32_t ready  = 0;
+    int      result = job_context_prepare_submit(context, job, dependency_list, dependency_count, submit_type, &ready);
+    if (ready) {
+        job_context_push_ready(context, job);
+    } return result;
+}
+
+size_t
+job_context_submit_jobs
+(
+    struct job_context_t     *context,
+    struct job_descriptor_t    **jobs,
+    size_t                  job_count,
+    job_id_t const   *dependency_list,
+    size_t const   *dependency_counts,
+    int                   submit_type,
+    int                      *results
+)
+{
+    struct job_descriptor_t *batch[JOB_CONTEXT_RTRQ_MAX];
+    struct job_queue_t      *batchq = NULL;
+    size_t                   nbatch = 0;
+    size_t                 nsuccess = 0;
+    size_t                   depofs = 0;
+    size_t                     ndep = 0;
+    uint32_t                  ready = 0;
+    int                      result = JOB_SUBMIT_SUCCESS;
+    size_t                        i;
+
+    for (i = 0; i < job_count; ++i) {
+        ndep   = (dependency_counts != NULL) ? dependency_counts[i] : 0;
+        result = job_context_prepare_submit(context, jobs[i], (ndep != 0) ? &dependency_list[depofs] : NULL, ndep, submit_type, &ready);
+        depofs+= ndep;
+        if (results != NULL) {
+            results[i] = result;
+        }
+        if (result == JOB_SUBMIT_SUCCESS) {
+            nsuccess++;
+        }
+        if (ready) {
+            /* Ready jobs are pushed in runs that share a target queue, preserving submission order. */
+            if (nbatch == JOB_CONTEXT_RTRQ_MAX || (nbatch != 0 && jobs[i]->target != batchq)) {
+                job_context_push_ready_many(context, batchq, batch, nbatch);
+                nbatch = 0;
+            }
+            batchq = jobs[i]->target;
+            batch[nbatch++] = jobs[i];
+        }
+    }
+    if (nbatch != 0) {
+        job_context_push_ready_many(context, batchq, batch, nbatch);
+    } return nsuccess;
+}
+
 int
 job_context_cancel_job
 (
@@ -1188,44 +1951,169 @@ job_context_cancel_job
     return job_scheduler_cancel(context->sched, id);
 }
 
+/**
+ * Prepare a job taken from a ready-to-run queue for execution.
+ * A job whose chain of parent jobs includes a canceled job is completed immediately instead.
+ * @param context The job context bound to the calling thread.
+ * @param job The job taken from the ready-to-run queue.
+ * @return Non-zero if the job has been marked as running and should be executed, or zero if it was canceled and completed.
+ */
+static int
+job_context_start_ready
+(
+    struct job_context_t *context,
+    struct job_descriptor_t  *job
+)
+{
+    job_scheduler_posix_t  *sched =(job_scheduler_posix_t*) context->sched;
+    job_status_posix_t  *all_stat = sched->jobstat;
+    uint32_t             job_slot = job_id_get_slot_index_u32(job->id);
+    job_data_posix_t    *job_data =&sched->jobdata[job_slot];
+    job_id_t               itr_id = job->id;
+    uint32_t             canceled = 0;
+    uint32_t             itr_slot = job_slot;
+
+    do { /* Determine job cancelation status - only the dense status array is touched */
+        if (__atomic_load_n(&all_stat[itr_slot].state, __ATOMIC_ACQUIRE) == JOB_STATE_CANCELED) {
+            canceled = 1;
+        }
+        itr_id   = all_stat[itr_slot].parent;
+        itr_slot = job_id_get_slot_index_u32(itr_id);
+    } while (canceled == 0 && job_id_valid(itr_id));
+
+    if (canceled == 0) {
+        /* This is a non-canceled, ready-to-run job */
+        if (pthread_mutex_lock(&job_data->lock) == 0) {
+            __atomic_store_n(&all_stat[job_slot].state, JOB_STATE_RUNNING, __ATOMIC_RELEASE);
+            (void) pthread_mutex_unlock(&job_data->lock);
+        } return 1;
+    } else {
+        /* This is a canceled job */
+        if (all_stat[job_slot].state != JOB_STATE_CANCELED) {
+            if (pthread_mutex_lock(&job_data->lock) == 0) {
+                __atomic_store_n(&all_stat[job_slot].state, JOB_STATE_CANCELED, __ATOMIC_RELEASE);
+                (void) pthread_mutex_unlock(&job_data->lock);
+            }
+        }
+        /* Complete the job without returning to the caller */
+        job_context_complete_job(context, job);
+        return 0;
+    }
+}
+
+/**
+ * Determine whether a job has finished executing.
+ * @param sched The scheduler that owns the job.
+ * @param id The identifier of the job.
+ * @return Non-zero if the job has completed or been canceled, or if its slot has been reused by a newer job.
+ */
+static int
+job_scheduler_job_finished
+(
+    job_scheduler_posix_t *sched,
+    job_id_t                  id
+)
+{
+    uint32_t          slot = job_id_get_slot_index_u32(id);
+    int32_t          state = JOB_STATE_UNINITIALIZED;
+
+    if (__atomic_load_n(&sched->jobdesc[slot].id, __ATOMIC_ACQUIRE) != id) {
+        return 1; /* The generation has changed, the job has already completed */
+    }
+    state = __atomic_load_n(&sched->jobstat[slot].state, __ATOMIC_ACQUIRE);
+    return (state == JOB_STATE_COMPLETED || state == JOB_STATE_CANCELED);
+}
+
+/**
+ * Park a thread waiting on a job until that job completes, the scheduler is terminated, or JOB_WAIT_PARK_MSEC elapses.
+ * The thread parks on the wait bank selected by the job's slot index, and is only woken by completion of a job in that bank.
+ * @param sched The scheduler that owns the job.
+ * @param id The identifier of the job being waited on.
+ */
+static void
+job_scheduler_park_waiter
+(
+    job_scheduler_posix_t *sched,
+    job_id_t                  id
+)
+{
+    job_wait_bank_posix_t *bank = &sched->jobwait[job_id_get_slot_index_u32(id) & (JOB_WAIT_BANK_COUNT - 1)];
+    struct timespec    deadline;
+
+    (void) clock_gettime(CLOCK_REALTIME, &deadline);
+    deadline.tv_nsec += JOB_WAIT_PARK_MSEC * 1000000L;
+    if (deadline.tv_nsec >= 1000000000L) {
+        deadline.tv_sec  += 1;
+        deadline.tv_nsec -= 1000000000L;
+    }
+    if (pthread_mutex_lock(&bank->mutex) == 0) {
+        /* Pairs with the fence in job_scheduler_notify_waiters; either this thread sees the completed job or the completing thread sees the waiter */
+        __atomic_add_fetch(&bank->count, 1, __ATOMIC_SEQ_CST);
+        if (job_scheduler_job_finished(sched, id) == 0) {
+            (void) pthread_cond_timedwait(&bank->cv, &bank->mutex, &deadline);
+        }
+        __atomic_sub_fetch(&bank->count, 1, __ATOMIC_SEQ_CST);
+        (void) pthread_mutex_unlock(&bank->mutex);
+    }
+}
+
+/**
+ * Wake the threads parked in job_context_wait_job on the wait bank of a job that has completed.
+ * Waiters on other jobs in the same bank also wake, re-check their own job and park again.
+ * @param sched The scheduler that owns the completed job.
+ * @param slot The slot index of the completed job.
+ */
+static void
+job_scheduler_notify_waiters
+(
+    job_scheduler_posix_t *sched,
+    uint32_t                slot
+)
+{
+    job_wait_bank_posix_t *bank = &sched->jobwait[slot & (JOB_WAIT_BANK_COUNT - 1)];
+
+    __atomic_thread_fence(__ATOMIC_SEQ_CST);
+    if (__atomic_load_n(&bank->count, __ATOMIC_RELAXED) != 0) {
+        if (pthread_mutex_lock(&bank->mutex) == 0) {
+            (void) pthread_cond_broadcast(&bank->cv);
+            (void) pthread_mutex_unlock(&bank->mutex);
+        }
+    }
+}
+
 int
 job_context_wait_job
 (
     struct job_context_t *context,
-    job_id_t                   id
+    job_id_t                   id,
+    uint32_t           spin_count
 )
 {
     job_scheduler_posix_t *sched =(job_scheduler_posix_t*) context->sched;
-    job_descriptor_t   *wait_job = NULL;
     job_descriptor_t   *exec_job = NULL;
-    job_data_posix_t  *wait_data = NULL;
-    int32_t           wait_state = JOB_STATE_UNINITIALIZED;
-    uint32_t           wait_slot = 0;
+    uint32_t          idle_count = 0;
 
     if (job_id_valid(id)) {
-        wait_slot = job_id_get_slot_index_u32(id);
-        wait_job  =&sched->jobdesc[wait_slot];
-        wait_data =&sched->jobdata[wait_slot];
-        if (wait_job->id != id) {
-            /* The generation has changed, the job has already completed */
-            return 1;
-        }
         for ( ; ; ) {
-            /* Retrieve the current state of the job we're waiting for */
-            if (pthread_mutex_lock(&wait_data->lock) == 0) {
-                wait_state = wait_data->state;
-                (void) pthread_mutex_unlock(&wait_data->lock);
-            }
-            if (wait_state == JOB_STATE_COMPLETED || wait_state == JOB_STATE_CANCELED) {
+            if (job_scheduler_job_finished(sched, id)) {
                 return 1;
             }
-            /* The job hasn't completed yet, so take and execute a job */
-            if ((exec_job = job_context_wait_ready_job(context)) != NULL) {
-                exec_job->exit = exec_job->jobmain(context, exec_job, JOB_CALL_TYPE_EXECUTE);
-                job_context_complete_job(context, exec_job);
-            } else {
+            if (job_queue_check_signal(context->queue) != JOB_QUEUE_SIGNAL_CLEAR) {
                 return 0; /* Queue was signaled */
             }
+            /* The job hasn't completed yet, so try to take and execute a job */
+            if ((exec_job = job_context_poll_ready(context)) != NULL) {
+                if (job_context_start_ready(context, exec_job)) {
+                    exec_job->exit = exec_job->jobmain(context, exec_job, JOB_CALL_TYPE_EXECUTE);
+                    job_context_complete_job(context, exec_job);
+                    if (context->user1 != 0) {
+                        return 0; /* The executed job flagged an error */
+                    }
+                } idle_count = 0;
+            } else if (++idle_count > spin_count) {
+                job_scheduler_park_waiter(sched, id);
+                idle_count = 0;
+            }
         }
     } return 0;
 }
@@ -1236,58 +2124,33 @@ job_context_wait_ready_job
     struct job_context_t *context
 )
 {
-    job_scheduler_posix_t  *sched =(job_scheduler_posix_t*) context->sched;
-    job_descriptor_t    *itr_desc = NULL;
-    job_descriptor_t    *job_desc = NULL;
-    job_data_posix_t    *job_data = NULL;
-    job_data_posix_t    *itr_data = NULL;
-    job_id_t               itr_id = JOB_ID_INVALID;
-    uint32_t             canceled = 0;
-    uint32_t             itr_slot;
+    job_descriptor_t *job_desc = NULL;
 
     for ( ; ; ) {
-        if ((job_desc = job_queue_take(context->queue)) == NULL) {
+        if ((job_desc = job_context_take_ready(context)) == NULL) {
             return NULL; /* Queue was signaled, abort the wait */
         }
-
-        canceled = 0;
-        itr_id   = job_desc->id;
-        itr_slot = job_id_get_slot_index_u32(job_desc->id);
-        itr_data =&sched->jobdata[itr_slot];
-        itr_desc = job_desc;
-        job_data = itr_data;
-        do { /* Determine job cancelation status */
-            if (pthread_mutex_lock(&itr_data->lock) == 0) {
-                if (itr_data->state == JOB_STATE_CANCELED) {
-                    canceled = 1;
-                } (void) pthread_mutex_unlock(&itr_data->lock);
-            }
-            itr_id   = itr_desc->parent;
-            itr_slot = job_id_get_slot_index_u32(itr_desc->parent);
-            itr_desc =&sched->jobdesc[itr_slot];
-            itr_data =&sched->jobdata[itr_slot];
-        } while (canceled == 0 && job_id_valid(itr_id));
-
-        if (canceled == 0) {
-            /* This is a non-canceled, ready-to-run job */
-            if (pthread_mutex_lock(&job_data->lock) == 0) {
-                job_data->state = JOB_STATE_RUNNING;
-                (void) pthread_mutex_unlock(&job_data->lock);
-            } return job_desc;
-        } else {
-            /* This is a canceled job */
-            if (job_data->state != JOB_STATE_CANCELED) {
-                if (pthread_mutex_lock(&job_data->lock) == 0) {
-                    job_data->state = JOB_STATE_CANCELED;
-                    (void) pthread_mutex_unlock(&job_data->lock);
-                }
-            }
-            /* Complete the job without returning to the caller */
-            job_context_complete_job(context, job_desc);
+        if (job_context_start_ready(context, job_desc)) {
+            return job_desc;
         }
     }
 }
 
+struct job_descriptor_t*
+job_context_poll_ready_job
+(
+    struct job_context_t *context
+)
+{
+    job_descriptor_t *job_desc = NULL;
+
+    while ((job_desc = job_context_poll_ready(context)) != NULL) {
+        if (job_context_start_ready(context, job_desc)) {
+            return job_desc;
+        }
+    } return NULL;
+}
+
 void
 job_context_complete_job
 (
@@ -1298,6 +2161,7 @@ job_context_complete_job
     job_scheduler_posix_t  *sched =(job_scheduler_posix_t*) context->sched;
     job_descriptor_t    *all_jobs = sched->jobdesc;
     job_data_posix_t    *all_data = sched->jobdata;
+    job_status_posix_t  *all_stat = sched->jobstat;
     job_data_posix_t    *job_data = NULL;
     job_data_posix_t   *wait_data = NULL;
     job_descriptor_t    *wait_job = NULL;
@@ -1319,12 +2183,15 @@ job_context_complete_job
             memcpy(wait_list, job_data->waiters, job_data->waitcnt * sizeof(uint16_t));
             wait_count = job_data->waitcnt;
             completed  = 1; /* Also applies to canceled jobs */
-            if (job_data->state != JOB_STATE_CANCELED) {
-                job_data->state  = JOB_STATE_COMPLETED;
+            if (all_stat[job_slot].state != JOB_STATE_CANCELED) {
+                __atomic_store_n(&all_stat[job_slot].state, JOB_STATE_COMPLETED, __ATOMIC_RELEASE);
             }
         } (void) pthread_mutex_unlock(&job_data->lock);
     }
     if (completed) {
+        /* Wake any threads parked waiting for this job to complete */
+        job_scheduler_notify_waiters(sched, job_slot);
+
         /* Run the cleanup phase for the job */
         (void) job->jobmain(context, job, JOB_CALL_TYPE_CLEANUP);
 
@@ -1339,13 +2206,13 @@ job_context_complete_job
             wait_job  = &all_jobs[wait_slot];
             if (pthread_mutex_lock(&wait_data->lock) == 0) {
                 if (wait_data->wait-- == 1) {
-                    if (wait_data->state != JOB_STATE_CANCELED) {
-                        wait_data->state  = JOB_STATE_READY;
+                    if (all_stat[wait_slot].state != JOB_STATE_CANCELED) {
+                        __atomic_store_n(&all_stat[wait_slot].state, JOB_STATE_READY, __ATOMIC_RELEASE);
                     } job_ready = 1;
                 } (void) pthread_mutex_unlock(&wait_data->lock);
             }
             if (job_ready) {
-                job_queue_push(wait_job->target, wait_job);
+                job_context_push_ready(context, wait_job);
             }
         }
     }
@@ -123,6 +123,40 @@ mem_vmm_protect
     return VirtualProtect(address, region_size, new_access, &old_access) != FALSE;
 }
 
+bool
+mem_vmm_prefault
+(
+    void      *address, 
+    size_t region_size
+)
+{
+    size_t page_size;
+    size_t    offset;
+
+    if (address == NULL || region_size == 0) {
+        return true;
+    }
+    page_size = mem_page_size();
+    for (offset = 0; offset < region_size; offset += page_size) {
+        ((uint8_t volatile*) address)[offset] = 0; /* Memory is freshly allocated, so it is already zero */
+    }
+    return true;
+}
+
+bool
+mem_vmm_decommit
+(
+    void      *address, 
+    size_t region_size
+)
+{
+    if (address == NULL || region_size == 0) {
+        return true;
+    }
+    /* MEM_RESET discards the contents but keeps the pages committed, so the range remains usable without a subsequent MEM_COMMIT */
+    return VirtualAlloc(address, region_size, MEM_RESET, PAGE_READWRITE) != NULL;
+}
+
 bool
 mem_vmm_release
 (
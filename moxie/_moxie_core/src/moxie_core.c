@@ -26,6 +26,12 @@
 
 #define MEM_TAG_BUFFER_SIZE                                                    5
 
+/* The size of the stack buffer used for the scratch arrays of small submit batches; larger batches fall back to PyMem_Malloc. */
+#define PYMOXIE_SUBMIT_SCRATCH_BYTES                                           1024
+
+/* Stored in job_context_t::user1 by python_job_main when a job raises, so the native worker loops know to return to Python. */
+#define PYMOXIE_CONTEXT_JOB_RAISED                                             1
+
 
 typedef struct mem_allocator_stats_t {                                         /* Information about a memory allocator instance. */
     size_t               watermark;                                            /* The high watermark value of the allocator. */
@@ -37,6 +43,11 @@ typedef struct mem_allocator_stats_t {                                         /
     size_t             chunk_count;                                            /* The total number of chunks in the arena. */
 } mem_allocator_stats_t;
 
+typedef int32_t (*PFN_native_job_main)(                                        /* Function pointer type for the entry point of a native job. */
+    uint32_t,                                                                  /* The identifier of the executing job. */
+    uintptr_t                                                                  /* The application-defined argument supplied when the job was created. */
+);
+
 
 static void                          PyMoxie_MemoryMarker_dealloc(PyMoxie_MemoryMarker*);
 static PyMoxie_MemoryMarker*         PyMoxie_MemoryMarker_new(PyTypeObject*, PyObject*, PyObject*);
@@ -53,6 +64,11 @@ static void                          PyMoxie_InternalAllocator_dealloc(PyMoxie_I
 static PyMoxie_InternalAllocator*    PyMoxie_InternalAllocator_new(PyTypeObject*, PyObject*, PyObject*);
 static PyObject*                     PyMoxie_Create_Memory_Allocator(PyObject*, PyObject*, PyObject*);
 static PyObject*                     PyMoxie_Allocate_Memory(PyObject*, PyObject*, PyObject*);
+static PyObject*                     PyMoxie_Allocate_Memory_Default(PyObject*, PyObject*);
+static PyObject*                     PyMoxie_Allocate_Memory_Bulk(PyObject*, PyObject*, PyObject*);
+static PyObject*                     PyMoxie_Release_Allocation(PyObject*, PyObject*, PyObject*);
+static PyObject*                     PyMoxie_Get_Memory_Allocator_Info(PyObject*, PyObject*);
+static PyObject*                     PyMoxie_Get_Allocator_Stats(PyObject*, PyObject*);
 static PyObject*                     PyMoxie_Mark_Allocator(PyObject*, PyObject*);
 static PyObject*                     PyMoxie_Reset_Allocator(PyObject*, PyObject*);
 static PyObject*                     PyMoxie_Reset_Allocator_To_Marker(PyObject*, PyObject*, PyObject*);
@@ -61,20 +77,36 @@ static void                          PyMoxie_InternalJobQueue_dealloc(PyMoxie_In
 static PyMoxie_InternalJobQueue*     PyMoxie_InternalJobQueue_new(PyTypeObject*, PyObject*, PyObject*);
 static PyObject*                     PyMoxie_Create_Job_Queue(PyObject*, PyObject*, PyObject*);
 static PyObject*                     PyMoxie_Flush_Job_Queue(PyObject*, PyObject*);
+static PyObject*                     PyMoxie_Flush_Job_Queues(PyObject*, PyObject*);
 static PyObject*                     PyMoxie_Signal_Job_Queue(PyObject*, PyObject*, PyObject*);
+static PyObject*                     PyMoxie_Signal_Job_Queue_One(PyObject*, PyObject*, PyObject*);
 static PyObject*                     PyMoxie_Check_Job_Queue_Signal(PyObject*, PyObject*);
 
 static void                          PyMoxie_InternalJobContext_dealloc(PyMoxie_InternalJobContext*);
 static PyMoxie_InternalJobContext*   PyMoxie_InternalJobContext_new(PyTypeObject*, PyObject*, PyObject*);
 static PyObject*                     PyMoxie_Acquire_JobContext(PyObject*, PyObject*, PyObject*);
 static PyObject*                     PyMoxie_Release_JobContext(PyObject*, PyObject*);
-static PyObject*                     PyMoxie_Create_Python_Job(PyObject*, PyObject*, PyObject*);
+static PyObject*                     PyMoxie_Register_Python_Job_Entry(PyObject*, PyObject*, PyObject*);
+static PyObject*                     PyMoxie_Create_Python_Job(PyObject*, PyObject* const*, Py_ssize_t);
+static PyObject*                     PyMoxie_Create_Python_Job_By_Id(PyObject*, PyObject*, PyObject*);
+static PyObject*                     PyMoxie_Create_Python_Job_Fast(PyObject*, PyObject*);
+static PyObject*                     PyMoxie_Create_Native_Job(PyObject*, PyObject*, PyObject*);
 static PyObject*                     PyMoxie_Submit_Python_Job(PyObject*, PyObject*, PyObject*);
+static PyObject*                     PyMoxie_Submit_Python_Job_0(PyObject*, PyObject*);
+static PyObject*                     PyMoxie_Submit_Python_Job_1(PyObject*, PyObject*);
+static PyObject*                     PyMoxie_Submit_Python_Job_2(PyObject*, PyObject*);
+static PyObject*                     PyMoxie_Submit_Python_Jobs(PyObject*, PyObject*, PyObject*);
+static PyObject*                     PyMoxie_Submit_Python_Jobs_Buf(PyObject*, PyObject*, PyObject*);
+static PyObject*                     PyMoxie_Submit_Python_Batch(PyObject*, PyObject*, PyObject*);
 static PyObject*                     PyMoxie_Cancel_Job(PyObject*, PyObject*, PyObject*);
 static PyObject*                     PyMoxie_Complete_Job(PyObject*, PyObject*, PyObject*);
 static PyObject*                     PyMoxie_Wait_For_Job(PyObject*, PyObject*, PyObject*);
 static PyObject*                     PyMoxie_Run_Next_Job(PyObject*, PyObject*);
 static PyObject*                     PyMoxie_Run_Next_Job_No_Completion(PyObject*, PyObject*);
+static PyObject*                     PyMoxie_Try_Run_Next_Job(PyObject*, PyObject*);
+static PyObject*                     PyMoxie_Run_Worker_Loop(PyObject*, PyObject*);
+static PyObject*                     PyMoxie_Run_Default_Worker(PyObject*, PyObject*);
+static PyObject*                     PyMoxie_Set_Thread_Affinity(PyObject*, PyObject*);
 
 static void                          PyMoxie_InternalJobScheduler_dealloc(PyMoxie_InternalJobScheduler*);
 static PyMoxie_InternalJobScheduler* PyMoxie_InternalJobScheduler_new(PyTypeObject*, PyObject*, PyObject*);
@@ -211,6 +243,13 @@ static PyMemberDef InternalAllocator_members[] = {
         .flags    = READONLY, 
         .doc      = PyDoc_STR("True if the maximum allocator size can increase beyond the initial capacity.")
     },
+    { 
+        .name     = "aligned_allocs", 
+        .type     = T_ULONGLONG,
+        .offset   = PLATFORM_OFFSET_OF(PyMoxie_InternalAllocator, allocator.aligned_allocs), 
+        .flags    = READONLY, 
+        .doc      = PyDoc_STR("The number of allocations that required no alignment padding. Used for debugging.")
+    },
     {   /* Must be the last entry in the list. */
         .name     = NULL,
         .type     = 0,
@@ -268,6 +307,13 @@ static PyMethodDef InternalJobContext_methods[] = {
 };
 
 static PyMemberDef InternalJobScheduler_members[] = {
+    {
+        .name     = "id_to_ctx",
+        .type     = T_OBJECT_EX,
+        .offset   = PLATFORM_OFFSET_OF(PyMoxie_InternalJobScheduler, id_to_ctx),
+        .flags    = READONLY,
+        .doc      = PyDoc_STR("The dictionary mapping thread identifiers to Python JobContext instances. Jobs resolve their JobContext through this dictionary when they run.")
+    },
     {   /* Must be the last entry in the list. */
         .name     = NULL,
         .type     = 0,
@@ -291,7 +337,7 @@ static PyMethodDef PyMoxie_Core_ExtensionFunctions[] = {
         .ml_name  = "create_memory_allocator",
         .ml_meth  =(PyCFunction) PyMoxie_Create_Memory_Allocator,
         .ml_flags = METH_VARARGS | METH_KEYWORDS,
-        .ml_doc   = PyDoc_STR("Create a new arena memory allocator (or sub-allocator).")
+        .ml_doc   = PyDoc_STR("Create a new arena memory allocator (or sub-allocator), returning the tuple (arena, page_size, growable, name, tag).")
     },
     {
         .ml_name  = "allocate_memory",
@@ -299,6 +345,36 @@ static PyMethodDef PyMoxie_Core_ExtensionFunctions[] = {
         .ml_flags = METH_VARARGS | METH_KEYWORDS,
         .ml_doc   = PyDoc_STR("Allocate memory with a specific alignment from a memory arena.")
     },
+    {
+        .ml_name  = "allocate_memory_default",
+        .ml_meth  =(PyCFunction) PyMoxie_Allocate_Memory_Default,
+        .ml_flags = METH_VARARGS,
+        .ml_doc   = PyDoc_STR("Allocate memory with the alignment specified when the memory arena was created.")
+    },
+    {
+        .ml_name  = "allocate_memory_bulk",
+        .ml_meth  =(PyCFunction) PyMoxie_Allocate_Memory_Bulk,
+        .ml_flags = METH_VARARGS | METH_KEYWORDS,
+        .ml_doc   = PyDoc_STR("Allocate several blocks of memory with the same alignment from a memory arena.")
+    },
+    {
+        .ml_name  = "release_allocation",
+        .ml_meth  =(PyCFunction) PyMoxie_Release_Allocation,
+        .ml_flags = METH_VARARGS | METH_KEYWORDS,
+        .ml_doc   = PyDoc_STR("Invalidate a memory allocation and return the object to its memory arena for reuse.")
+    },
+    {
+        .ml_name  = "get_memory_allocator_info",
+        .ml_meth  =(PyCFunction) PyMoxie_Get_Memory_Allocator_Info,
+        .ml_flags = METH_VARARGS,
+        .ml_doc   = PyDoc_STR("Retrieve the (page_size, growable, name, tag) attributes of a memory arena.")
+    },
+    {
+        .ml_name  = "get_allocator_stats",
+        .ml_meth  =(PyCFunction) PyMoxie_Get_Allocator_Stats,
+        .ml_flags = METH_VARARGS,
+        .ml_doc   = PyDoc_STR("Retrieve the (bytes_used, bytes_reserved, n_allocations, n_resets, peak_bytes) counters of a memory arena.")
+    },
     {
         .ml_name  = "create_allocator_marker",
         .ml_meth  =(PyCFunction) PyMoxie_Mark_Allocator,
@@ -329,12 +405,24 @@ static PyMethodDef PyMoxie_Core_ExtensionFunctions[] = {
         .ml_flags = METH_VARARGS,
         .ml_doc   = PyDoc_STR("Flush the queue and wake all waiting producer threads.")
     },
+    {
+        .ml_name  = "flush_job_queues",
+        .ml_meth  =(PyCFunction) PyMoxie_Flush_Job_Queues,
+        .ml_flags = METH_VARARGS,
+        .ml_doc   = PyDoc_STR("Flush each queue in a sequence of job queues and wake all waiting producer threads.")
+    },
     {
         .ml_name  = "signal_job_queue",
         .ml_meth  =(PyCFunction) PyMoxie_Signal_Job_Queue,
         .ml_flags = METH_VARARGS | METH_KEYWORDS,
         .ml_doc   = PyDoc_STR("Signal all waiters on a job queue to wake up for some event such as process shutdown.")
     },
+    {
+        .ml_name  = "signal_job_queue_one",
+        .ml_meth  =(PyCFunction) PyMoxie_Signal_Job_Queue_One,
+        .ml_flags = METH_VARARGS | METH_KEYWORDS,
+        .ml_doc   = PyDoc_STR("Set the signal value on a job queue and wake at most one waiting consumer thread.")
+    },
     {
         .ml_name  = "check_job_queue_signal",
         .ml_meth  =(PyCFunction) PyMoxie_Check_Job_Queue_Signal,
@@ -371,11 +459,35 @@ static PyMethodDef PyMoxie_Core_ExtensionFunctions[] = {
         .ml_flags = METH_VARARGS,
         .ml_doc   = PyDoc_STR("Return a job management context to the free pool when the associated thread terminates or the context is no longer needed.")
     },
+    {
+        .ml_name  = "register_python_job_entry",
+        .ml_meth  =(PyCFunction) PyMoxie_Register_Python_Job_Entry,
+        .ml_flags = METH_VARARGS | METH_KEYWORDS,
+        .ml_doc   = PyDoc_STR("Register a Python callable as a job entry point, returning an integer entry identifier for use with create_python_job_by_id.")
+    },
     {
         .ml_name  = "create_python_job",
         .ml_meth  =(PyCFunction) PyMoxie_Create_Python_Job,
+        .ml_flags = METH_FASTCALL,
+        .ml_doc   = PyDoc_STR("Allocate a job identifier for a job implemented in Python. Arguments are positional: (context, parent, callable, args, kwargs).")
+    },
+    {
+        .ml_name  = "create_python_job_by_id",
+        .ml_meth  =(PyCFunction) PyMoxie_Create_Python_Job_By_Id,
+        .ml_flags = METH_VARARGS | METH_KEYWORDS,
+        .ml_doc   = PyDoc_STR("Allocate a job identifier for a job implemented in Python, whose entry point was registered with register_python_job_entry.")
+    },
+    {
+        .ml_name  = "create_python_job_fast",
+        .ml_meth  =(PyCFunction) PyMoxie_Create_Python_Job_Fast,
+        .ml_flags = METH_VARARGS,
+        .ml_doc   = PyDoc_STR("Allocate a job identifier for a job implemented in Python that has no parent job and no keyword arguments.")
+    },
+    {
+        .ml_name  = "create_native_job",
+        .ml_meth  =(PyCFunction) PyMoxie_Create_Native_Job,
         .ml_flags = METH_VARARGS | METH_KEYWORDS,
-        .ml_doc   = PyDoc_STR("Allocate a job identifier for a job implemented in Python.")
+        .ml_doc   = PyDoc_STR("Allocate a job identifier for a job implemented by a native function with signature int32_t (uint32_t job, uintptr_t arg), which runs without the GIL.")
     },
     {
         .ml_name  = "submit_python_job",
@@ -383,6 +495,42 @@ static PyMethodDef PyMoxie_Core_ExtensionFunctions[] = {
         .ml_flags = METH_VARARGS | METH_KEYWORDS,
         .ml_doc   = PyDoc_STR("Submit or cancel a job implemented in Python.")
     },
+    {
+        .ml_name  = "submit_python_job_0",
+        .ml_meth  =(PyCFunction) PyMoxie_Submit_Python_Job_0,
+        .ml_flags = METH_VARARGS,
+        .ml_doc   = PyDoc_STR("Submit or cancel a job with no dependencies. Arguments are positional: (context, jobid, queue, submit_type).")
+    },
+    {
+        .ml_name  = "submit_python_job_1",
+        .ml_meth  =(PyCFunction) PyMoxie_Submit_Python_Job_1,
+        .ml_flags = METH_VARARGS,
+        .ml_doc   = PyDoc_STR("Submit or cancel a job with one dependency. Arguments are positional: (context, jobid, queue, submit_type, d0).")
+    },
+    {
+        .ml_name  = "submit_python_job_2",
+        .ml_meth  =(PyCFunction) PyMoxie_Submit_Python_Job_2,
+        .ml_flags = METH_VARARGS,
+        .ml_doc   = PyDoc_STR("Submit or cancel a job with two or three dependencies. Arguments are positional: (context, jobid, queue, submit_type, d0, d1[, d2]).")
+    },
+    {
+        .ml_name  = "submit_python_jobs",
+        .ml_meth  =(PyCFunction) PyMoxie_Submit_Python_Jobs,
+        .ml_flags = METH_VARARGS | METH_KEYWORDS,
+        .ml_doc   = PyDoc_STR("Submit a batch of Python jobs for execution or cancellation with a single queue lock acquisition per target queue.")
+    },
+    {
+        .ml_name  = "submit_python_jobs_buf",
+        .ml_meth  =(PyCFunction) PyMoxie_Submit_Python_Jobs_Buf,
+        .ml_flags = METH_VARARGS | METH_KEYWORDS,
+        .ml_doc   = PyDoc_STR("Submit a batch of Python jobs, writing one int8 result code per job into a caller-supplied buffer and returning the number of failed jobs.")
+    },
+    {
+        .ml_name  = "submit_python_batch",
+        .ml_meth  =(PyCFunction) PyMoxie_Submit_Python_Batch,
+        .ml_flags = METH_VARARGS | METH_KEYWORDS,
+        .ml_doc   = PyDoc_STR("Create and submit a batch of Python jobs, whose dependencies refer to other jobs in the batch, with a single call.")
+    },
     {
         .ml_name  = "cancel_job",
         .ml_meth  =(PyCFunction) PyMoxie_Cancel_Job,
@@ -413,6 +561,30 @@ static PyMethodDef PyMoxie_Core_ExtensionFunctions[] = {
         .ml_flags = METH_VARARGS,
         .ml_doc   = PyDoc_STR("Wait for a job to become ready-to-run and then execute the job, but do not complete the job.")
     },
+    {
+        .ml_name  = "try_run_next_job",
+        .ml_meth  =(PyCFunction) PyMoxie_Try_Run_Next_Job,
+        .ml_flags = METH_VARARGS,
+        .ml_doc   = PyDoc_STR("Execute and complete a ready-to-run job if one is available, without blocking.")
+    },
+    {
+        .ml_name  = "run_worker_loop",
+        .ml_meth  =(PyCFunction) PyMoxie_Run_Worker_Loop,
+        .ml_flags = METH_VARARGS,
+        .ml_doc   = PyDoc_STR("Repeatedly wait for, execute and complete jobs, invoking a signal handler when the wait queue is signaled.")
+    },
+    {
+        .ml_name  = "run_default_worker",
+        .ml_meth  =(PyCFunction) PyMoxie_Run_Default_Worker,
+        .ml_flags = METH_VARARGS,
+        .ml_doc   = PyDoc_STR("Repeatedly wait for, execute and complete jobs until the wait queue is signaled with JOB_QUEUE_SIGNAL_TERMINATE, ignoring all other signals.")
+    },
+    {
+        .ml_name  = "set_thread_affinity",
+        .ml_meth  =(PyCFunction) PyMoxie_Set_Thread_Affinity,
+        .ml_flags = METH_VARARGS,
+        .ml_doc   = PyDoc_STR("Pin the calling thread to a single logical processor. Returns False if the affinity could not be set or is not supported on the host.")
+    },
     {   /* Must be the last entry in the list. */
         .ml_name  = NULL,
         .ml_meth  = NULL,
@@ -582,6 +754,7 @@ extension_register_constants
     PyMoxie_RegisterIntConstant(_moxie_core, "MEM_ALLOCATION_FLAG_HEAP"    , MEM_ALLOCATION_FLAG_HEAP);
     PyMoxie_RegisterIntConstant(_moxie_core, "MEM_ALLOCATION_FLAG_VIRTUAL" , MEM_ALLOCATION_FLAG_VIRTUAL);
     PyMoxie_RegisterIntConstant(_moxie_core, "MEM_ALLOCATION_FLAG_EXTERNAL", MEM_ALLOCATION_FLAG_EXTERNAL);
+    PyMoxie_RegisterIntConstant(_moxie_core, "MEM_ALLOCATION_FLAG_PREFAULT", MEM_ALLOCATION_FLAG_PREFAULT);
     PyMoxie_RegisterIntConstant(_moxie_core, "MEM_ALLOCATION_FLAG_GROWABLE", MEM_ALLOCATION_FLAG_GROWABLE);
     PyMoxie_RegisterIntConstant(_moxie_core, "MEM_ACCESS_FLAGS_NONE"       , MEM_ACCESS_FLAGS_NONE);
     PyMoxie_RegisterIntConstant(_moxie_core, "MEM_ACCESS_FLAG_READ"        , MEM_ACCESS_FLAG_READ);
@@ -603,6 +776,9 @@ extension_register_constants
     PyMoxie_RegisterIntConstant(_moxie_core, "JOB_QUEUE_SIGNAL_CLEAR"      , JOB_QUEUE_SIGNAL_CLEAR);
     PyMoxie_RegisterIntConstant(_moxie_core, "JOB_QUEUE_SIGNAL_TERMINATE"  , JOB_QUEUE_SIGNAL_TERMINATE);
     PyMoxie_RegisterIntConstant(_moxie_core, "JOB_QUEUE_SIGNAL_USER"       , JOB_QUEUE_SIGNAL_USER);
+    PyMoxie_RegisterIntConstant(_moxie_core, "JOB_QUEUE_POLICY_SHARED"     , JOB_QUEUE_POLICY_SHARED);
+    PyMoxie_RegisterIntConstant(_moxie_core, "JOB_QUEUE_POLICY_STEALING"   , JOB_QUEUE_POLICY_STEALING);
+    PyMoxie_RegisterIntConstant(_moxie_core, "JOB_WAIT_SPIN_COUNT"         , JOB_WAIT_SPIN_COUNT);
     return 0;
 }
 
@@ -681,6 +857,29 @@ mem_allocator_stats
     stats->chunk_count = chunks;
 }
 
+/**
+ * The job entry point for jobs implemented by a native function, such as a Numba cfunc or a ctypes callback.
+ * The function address is stored in job->user1 and its argument in job->user2.
+ * The Global Interpreter Lock is not acquired; a native function that calls back into Python must acquire it itself.
+ * @param context The job context associated with the thread executing the job.
+ * @param job Data associated with the job being executed.
+ * @param call_type One of the values of the job_call_type_e enumeration indicating the stage being run.
+ * @return The value returned by the native function, where zero is reserved to mean success.
+ */
+static int32_t
+native_job_main
+(
+    struct job_context_t *context,
+    struct job_descriptor_t  *job,
+    int32_t             call_type
+)
+{
+    PLATFORM_UNUSED_PARAM(context);
+    if (call_type == JOB_CALL_TYPE_EXECUTE) {
+        return ((PFN_native_job_main) job->user1)((uint32_t) job->id, job->user2);
+    } return 0;
+}
+
 /**
  * The job entry point for jobs implemented in Python.
  * The Global Interpreter Lock is held while calling back into the Python code.
@@ -722,11 +921,17 @@ python_job_main
             PyDict_SetItemString(data->kwargs, "job"   , jobid);
         }
         if (jobctx != NULL) {
-            result  = PyObject_Call(data->callable, data->args, data->kwargs);
-            retval  = PyLong_AsLong(result);
-            Py_DECREF(result); result = NULL;
+            /* If the callable raises, leave the exception set for the caller to propagate. */
+            if ((result = PyObject_Call(data->callable, data->args, data->kwargs)) != NULL) {
+                retval  = PyLong_AsLong(result);
+                Py_DECREF(result); result = NULL;
+            } else {
+                retval  = -1;
+                context->user1 = PYMOXIE_CONTEXT_JOB_RAISED;
+            }
         } else {
             PyErr_Format(PyExc_RuntimeError, "Failed to find JobContext for thread ID %zu", context->thrid);
+            context->user1 = PYMOXIE_CONTEXT_JOB_RAISED;
         }
         PyGILState_Release(GIL_state);
     }
@@ -778,6 +983,9 @@ PyMoxie_InternalAllocator_dealloc
 )
 {
     if (self != NULL) {
+        while (self->freelist_count > 0) {
+            Py_XDECREF(self->freelist[--self->freelist_count]);
+        }
         mem_allocator_delete(&self->allocator);
         Py_XDECREF(self->growable_bool);
         Py_XDECREF(self->page_size_int);
@@ -824,6 +1032,8 @@ PyMoxie_InternalJobScheduler_dealloc
     if (self != NULL) {
         job_scheduler_terminate(self->state);
         job_scheduler_delete(self->state);
+        Py_XDECREF(self->entries);
+        Py_XDECREF(self->id_to_ctx);
         Py_TYPE(self)->tp_free((PyObject*) self);
     }
 }
@@ -895,6 +1105,7 @@ PyMoxie_InternalAllocator_new
     self->allocator_tag_int  = PyMoxie_Retain(Py_None);
     self->page_size_int      = PyLong_FromSize_t(0);
     self->growable_bool      = PyMoxie_Retain(Py_False);
+    self->default_alignment  = _MOXIE_CORE_DEFAULT_ALIGNMENT_BYTES;
     mem_zero(&self->allocator, sizeof(mem_allocator_t));
     return self;
 }
@@ -951,7 +1162,9 @@ PyMoxie_InternalJobScheduler_new
         PyMoxie_LogErrorN("_moxie_core: tp_alloc failed for InternalJobScheduler.\n");
         return NULL;
     }
-    self->state = NULL;
+    self->state     = NULL;
+    self->id_to_ctx = NULL;
+    self->entries   = NULL;
     return self;
 }
 
@@ -1013,17 +1226,104 @@ PyMoxie_MemoryAllocation_getbuffer
     int                      flags
 )
 {
-    int readonly;
-    if (self->readonly_bool == Py_True) {
-        readonly = 1;
-    } else {
-        readonly = 0;
+    int readonly = (self->readonly_bool == Py_True) ? 1 : 0;
+
+    if (view == NULL) {
+        PyErr_SetString(PyExc_BufferError, "The view argument must not be NULL");
+        return -1;
+    }
+    if (self->base_address == NULL) {
+        PyErr_SetString(PyExc_BufferError, "The MemoryAllocation does not reference a valid memory block");
+        view->obj = NULL;
+        return -1;
+    }
+    if ((flags & PyBUF_WRITABLE) == PyBUF_WRITABLE && readonly) {
+        PyErr_SetString(PyExc_BufferError, "The MemoryAllocation is read-only");
+        view->obj = NULL;
+        return -1;
     }
-    return PyBuffer_FillInfo(view, (PyObject*) self, self->base_address, (Py_ssize_t) self->byte_length, readonly, flags);
+
+    /* Describe the block as a 1-D contiguous array of unsigned bytes */
+    view->obj        = PyMoxie_Retain(self);
+    view->buf        = self->base_address;
+    view->len        =(Py_ssize_t) self->byte_length;
+    view->readonly   = readonly;
+    view->itemsize   = 1;
+    view->format     = "B";
+    view->ndim       = 1;
+    view->shape      = ((flags & PyBUF_ND     ) == PyBUF_ND     ) ? &view->len      : NULL;
+    view->strides    = ((flags & PyBUF_STRIDES) == PyBUF_STRIDES) ? &view->itemsize : NULL;
+    view->suboffsets = NULL;
+    view->internal   = NULL;
+    return 0;
 }
 
 
 
+/**
+ * Obtain a MemoryAllocation object describing a block of memory allocated from an arena.
+ * Objects previously returned to the arena via release_allocation are reused before a new object is created.
+ * @param arena The arena from which the memory block was allocated.
+ * @param address The base address of the memory block.
+ * @param length The length of the memory block, in bytes.
+ * @param alignment The alignment of the base address, in bytes.
+ * @return A new reference to the MemoryAllocation, or NULL if resource allocation failed.
+ */
+static PyMoxie_MemoryAllocation*
+PyMoxie_MemoryAllocation_Acquire
+(
+    PyMoxie_InternalAllocator *arena,
+    void                    *address,
+    size_t                    length,
+    size_t                 alignment
+)
+{
+    PyMoxie_MemoryAllocation *inst = NULL;
+    PyObject     *base_address_int = NULL;
+    PyObject           *length_int = NULL;
+    PyObject        *alignment_int = NULL;
+
+    /* Only recycle objects the freelist owns exclusively; a caller may still hold a released allocation, and must not see it re-pointed at new memory */
+    while (arena->freelist_count > 0 && Py_REFCNT(arena->freelist[arena->freelist_count-1]) > 1) {
+        inst = arena->freelist[--arena->freelist_count];
+        arena->freelist[arena->freelist_count] = NULL;
+        Py_DECREF(inst);
+        inst = NULL;
+    }
+    if (arena->freelist_count == 0) {
+        return PyMoxie_MemoryAllocation_Create(arena, address, length, alignment);
+    }
+    if ((base_address_int = PyLong_FromVoidPtr(address)) == NULL) {
+        goto cleanup_and_fail;
+    }
+    if ((alignment_int = PyLong_FromSize_t(alignment)) == NULL) {
+        goto cleanup_and_fail;
+    }
+    if ((length_int = PyLong_FromSize_t(length)) == NULL) {
+        goto cleanup_and_fail;
+    }
+    /* The freelist reference is transferred to the caller */
+    inst = arena->freelist[--arena->freelist_count];
+    arena->freelist[arena->freelist_count] = NULL;
+    Py_SETREF(inst->base_address_int  , base_address_int);
+    Py_SETREF(inst->alignment_int     , alignment_int);
+    Py_SETREF(inst->length_int        , length_int);
+    Py_SETREF(inst->allocator_name_str, PyMoxie_Retain(arena->allocator_name_str));
+    Py_SETREF(inst->allocator_tag_int , PyMoxie_Retain(arena->allocator_tag_int));
+    Py_SETREF(inst->readonly_bool     , PyBool_FromLong((arena->allocator.access_flags & MEM_ACCESS_FLAG_WRITE) == 0));
+    inst->base_address = address;
+    inst->byte_length  = length;
+    inst->tag          = arena->allocator.allocator_tag;
+    inst->arena        = arena;
+    return inst;
+
+cleanup_and_fail:
+    Py_XDECREF(length_int);
+    Py_XDECREF(alignment_int);
+    Py_XDECREF(base_address_int);
+    return NULL;
+}
+
 static PyObject*
 PyMoxie_Create_Memory_Allocator
 (
@@ -1033,6 +1333,7 @@ PyMoxie_Create_Memory_Allocator
 )
 {
     PyMoxie_InternalAllocator *self_ = NULL;
+    PyObject                 *result = NULL;
     size_t                     guard = 0;
     char const              *nameval = NULL;
     char const               *tagval = NULL;
@@ -1043,10 +1344,12 @@ PyMoxie_Create_Memory_Allocator
     uint32_t                   flags = MEM_ALLOCATION_FLAG_LOCAL | MEM_ALLOCATION_FLAG_HEAP | MEM_ALLOCATION_FLAG_GROWABLE;
     uint32_t                  access = MEM_ACCESS_FLAG_RDWR;
     mem_tag_t                    tag = 0;
-    static char const      *kwlist[] ={"chunk_size","alignment","flags","access","name","tag",NULL};
+    double                    growth = _MOXIE_CORE_DEFAULT_GROWTH_FACTOR;
+    Py_ssize_t            chunk_max = 0;
+    static char const      *kwlist[] ={"chunk_size","alignment","flags","access","name","tag","growth_factor","max_chunk_size",NULL};
 
-    if (PyArg_ParseTupleAndKeywords(args, kwargs, "nnIIz#z#:create_memory_allocator", (char**) kwlist, &chunk_size, &alignment, &flags, &access, &nameval, &namelen, &tagval, &taglen) == 0) {
-        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTupleAndKeywords(chunk_size,alignment,flags,access,name,tag) failed in PyMoxie_Create_Memory_Allocator.\n");
+    if (PyArg_ParseTupleAndKeywords(args, kwargs, "nnIIz#z#|dn:create_memory_allocator", (char**) kwlist, &chunk_size, &alignment, &flags, &access, &nameval, &namelen, &tagval, &taglen, &growth, &chunk_max) == 0) {
+        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTupleAndKeywords(chunk_size,alignment,flags,access,name,tag,growth_factor,max_chunk_size) failed in PyMoxie_Create_Memory_Allocator.\n");
         return NULL;
     }
     if (chunk_size <= 0) {
@@ -1067,6 +1370,26 @@ PyMoxie_Create_Memory_Allocator
         PyErr_SetString(PyExc_ValueError, "The alignment argument must specify a positive power of two, or zero");
         return NULL;
     }
+    if (alignment > (Py_ssize_t) mem_page_size()) {
+        PyMoxie_LogErrorV("_moxie_core: alignment %zd must be less than or equal to the system page size %zu.\n", alignment, mem_page_size());
+        PyErr_SetString(PyExc_ValueError, "The alignment argument must be less than or equal to the system page size");
+        return NULL;
+    }
+    if (chunk_size <= alignment) {
+        PyMoxie_LogErrorV("_moxie_core: chunk_size %zd must be greater than the alignment %zd.\n", chunk_size, alignment);
+        PyErr_SetString(PyExc_ValueError, "The chunk_size argument must be greater than the alignment");
+        return NULL;
+    }
+    if (!(growth > 1.0 && growth <= 2.0)) {
+        PyMoxie_LogErrorV("_moxie_core: growth_factor %f must be in the range (1.0, 2.0].\n", growth);
+        PyErr_SetString(PyExc_ValueError, "The growth_factor argument must be greater than 1.0 and less than or equal to 2.0");
+        return NULL;
+    }
+    if (chunk_max != 0 && chunk_max < chunk_size) {
+        PyMoxie_LogErrorV("_moxie_core: max_chunk_size %zd must be zero or at least chunk_size %zd.\n", chunk_max, chunk_size);
+        PyErr_SetString(PyExc_ValueError, "The max_chunk_size argument must be zero or greater than or equal to chunk_size");
+        return NULL;
+    }
     if (tagval != NULL && taglen != 4) {
         PyMoxie_LogErrorV("_moxie_core: tag value %.*s must have a length of 4 ASCII characters (%zd bytes supplied).\n", (int) taglen, tagval, taglen);
         PyErr_SetString(PyExc_ValueError, "The tag argument must be a string of exactly 4 ASCII characters");
@@ -1083,7 +1406,10 @@ PyMoxie_Create_Memory_Allocator
         PyMoxie_LogErrorV("_moxie_core: Failed to create InternalAllocator with chunk_size %zu, alignment %zu, flags %08X, access %08X.\n", chunk_size, alignment, flags, access);
         return NULL;
     }
-    return PyMoxie_Retain(self_);
+    mem_allocator_set_growth_policy(&self_->allocator, growth, (size_t) chunk_max);
+    result = PyTuple_Pack(5, (PyObject*) self_, self_->page_size_int, self_->growable_bool, self_->allocator_name_str, self_->allocator_tag_int);
+    Py_DECREF(self_);
+    return result;
 }
 
 static PyObject*
@@ -1114,15 +1440,18 @@ PyMoxie_Allocate_Memory
     if (align == 0) {
         align  = _MOXIE_CORE_DEFAULT_ALIGNMENT_BYTES;
     }
-    if (align <  0 || align > (Py_ssize_t) self_->allocator.page_size) {
-        PyMoxie_LogErrorV("_moxie_core: Desired alignment %zd is outside of valid range [0, %u].\n", align, self_->allocator.page_size);
-        PyErr_SetString(PyExc_ValueError, "The alignment argument is outside of the valid range");
-        return NULL;
-    }
-    if ((align & (align - 1)) != 0) {
-        PyMoxie_LogErrorV("_moxie_core: Desired alignment %zd must be a power of two integer value.\n", align);
-        PyErr_SetString(PyExc_ValueError, "The alignment argument must be a power of two");
-        return NULL;
+    if (align != (Py_ssize_t) self_->default_alignment) {
+        /* The arena alignment was validated against the page size when the arena was created */
+        if (align <  0 || align > (Py_ssize_t) self_->allocator.page_size) {
+            PyMoxie_LogErrorV("_moxie_core: Desired alignment %zd is outside of valid range [0, %u].\n", align, self_->allocator.page_size);
+            PyErr_SetString(PyExc_ValueError, "The alignment argument is outside of the valid range");
+            return NULL;
+        }
+        if ((align & (align - 1)) != 0) {
+            PyMoxie_LogErrorV("_moxie_core: Desired alignment %zd must be a power of two integer value.\n", align);
+            PyErr_SetString(PyExc_ValueError, "The alignment argument must be a power of two");
+            return NULL;
+        }
     }
     if (self_->allocator.head == NULL) {
         PyMoxie_LogErrorV("_moxie_core: Attempted to allocate %zd bytes from disposed allocator.\n", nbytes);
@@ -1132,71 +1461,182 @@ PyMoxie_Allocate_Memory
 
     mark = mem_allocator_mark(&self_->allocator);
     if ((addr = mem_allocator_alloc(&self_->allocator, (size_t) nbytes, (size_t) align)) == NULL) {
-        PyMoxie_LogErrorV("_moxie_core: Memory allocation of %zd bytes with alignment %zd failed from arena %.*s.\n", nbytes, align, 4, (char*)(size_t) self_->allocator.allocator_tag);
+        PyMoxie_LogErrorV("_moxie_core: Memory allocation of %zd bytes with alignment %zd failed from arena %.*s.\n", nbytes, align, 4, (char const*) &self_->allocator.allocator_tag);
         Py_RETURN_NONE; /* This is an expected possible outcome */
     }
 
-    if ((alloc = PyMoxie_MemoryAllocation_Create(self_, addr, (size_t) nbytes, (size_t) align)) == NULL) {
-        PyMoxie_LogErrorV("_moxie_core: Failed to allocate a new MemoryAllocation instance for %p, %zd bytes from arena %.*s.\n", addr, nbytes, 4, (char*)(size_t) self_->allocator.allocator_tag);
+    if ((alloc = PyMoxie_MemoryAllocation_Acquire(self_, addr, (size_t) nbytes, (size_t) align)) == NULL) {
+        PyMoxie_LogErrorV("_moxie_core: Failed to allocate a new MemoryAllocation instance for %p, %zd bytes from arena %.*s.\n", addr, nbytes, 4, (char const*) &self_->allocator.allocator_tag);
         mem_allocator_reset_to_marker(&self_->allocator, &mark);
         Py_RETURN_NONE; /* Not expected, but recoverable */
     }
-    return PyMoxie_Retain(alloc);
+    return (PyObject*) alloc;
 }
 
 static PyObject*
-PyMoxie_Mark_Allocator
+PyMoxie_Allocate_Memory_Default
 (
     PyObject * Py_UNUSED(self),
     PyObject *           args
 )
 {
     PyMoxie_InternalAllocator *self_ = NULL;
-    PyMoxie_MemoryMarker     *marker = NULL;
+    PyMoxie_MemoryAllocation  *alloc = NULL;
+    Py_ssize_t                nbytes = 0;
+    size_t                     align = 0;
+    void                       *addr = NULL;
     mem_marker_t                mark;
 
-    if (PyArg_ParseTuple(args, "O!:create_allocator_marker", &PyMoxie_InternalAllocatorType, &self_) == 0) {
-        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTuple failed in PyMoxie_Mark_Allocator.\n");
+    if (PyArg_ParseTuple(args, "O!n:allocate_memory_default", &PyMoxie_InternalAllocatorType, &self_, &nbytes) == 0) {
+        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTuple(arena,length) failed in PyMoxie_Allocate_Memory_Default.\n");
+        return NULL;
+    }
+    if (nbytes <= 0) {
+        PyMoxie_LogErrorV("_moxie_core: Attempted to allocate %zd bytes from arena; size must be greater than zero.\n", nbytes);
+        PyErr_SetString(PyExc_ValueError, "The length argument must be greater than zero");
         return NULL;
     }
     if (self_->allocator.head == NULL) {
-        PyMoxie_LogErrorN("_moxie_core: Attempted to obtain a marker from a disposed allocator.\n");
-        PyErr_SetString(PyExc_ValueError, "Attempted to obtain a marker from a disposed allocator");
+        PyMoxie_LogErrorV("_moxie_core: Attempted to allocate %zd bytes from disposed allocator.\n", nbytes);
+        PyErr_SetString(PyExc_ValueError, "Attempted to allocate memory from a disposed allocator");
         return NULL;
     }
 
-    mark = mem_allocator_mark(&self_->allocator);
-    if ((marker = PyMoxie_MemoryMarker_Create(self_, mark)) == NULL) {
-        PyMoxie_LogErrorV("_moxie_core: Failed to allocate a new MemoryMarker instance for arena %.*s.\n", 4, (char*)(size_t) self_->allocator.allocator_tag);
-        return NULL;
+    /* The default alignment was validated when the arena was created */
+    align = self_->default_alignment;
+    mark  = mem_allocator_mark(&self_->allocator);
+    if ((addr = mem_allocator_alloc(&self_->allocator, (size_t) nbytes, align)) == NULL) {
+        PyMoxie_LogErrorV("_moxie_core: Memory allocation of %zd bytes with alignment %zu failed from arena %.*s.\n", nbytes, align, 4, (char const*) &self_->allocator.allocator_tag);
+        Py_RETURN_NONE; /* This is an expected possible outcome */
     }
-    return PyMoxie_Retain(marker);
+
+    if ((alloc = PyMoxie_MemoryAllocation_Acquire(self_, addr, (size_t) nbytes, align)) == NULL) {
+        PyMoxie_LogErrorV("_moxie_core: Failed to allocate a new MemoryAllocation instance for %p, %zd bytes from arena %.*s.\n", addr, nbytes, 4, (char const*) &self_->allocator.allocator_tag);
+        mem_allocator_reset_to_marker(&self_->allocator, &mark);
+        Py_RETURN_NONE; /* Not expected, but recoverable */
+    }
+    return (PyObject*) alloc;
 }
 
 static PyObject*
-PyMoxie_Reset_Allocator
+PyMoxie_Allocate_Memory_Bulk
 (
     PyObject * Py_UNUSED(self),
-    PyObject *           args
+    PyObject *           args ,
+    PyObject *         kwargs
 )
 {
     PyMoxie_InternalAllocator *self_ = NULL;
+    PyMoxie_MemoryAllocation  *alloc = NULL;
+    PyObject                *lengths = NULL;
+    PyObject                 *seqobj = NULL;
+    PyObject                 *result = NULL;
+    int64_t const           *lenbuf = NULL;
+    Py_ssize_t                 count = 0;
+    Py_ssize_t                 align = _MOXIE_CORE_DEFAULT_ALIGNMENT_BYTES;
+    Py_ssize_t                     i = 0;
+    void                       *addr = NULL;
+    char const             *kwlist[] ={"arena","lengths","alignment",NULL};
+    Py_buffer                   view;
+    mem_marker_t                mark;
+    int                     has_view = 0;
 
-    if (PyArg_ParseTuple(args, "O!:reset_memory_allocator", &PyMoxie_InternalAllocatorType, &self_) == 0) {
-        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTuple failed in PyMoxie_Reset_Allocator.\n");
+    if (PyArg_ParseTupleAndKeywords(args, kwargs, "O!On:allocate_memory_bulk", (char**) kwlist, &PyMoxie_InternalAllocatorType, &self_, &lengths, &align) == 0) {
+        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTupleAndKeywords(arena,lengths,alignment) failed in PyMoxie_Allocate_Memory_Bulk.\n");
+        return NULL;
+    }
+    if (align == 0) {
+        align  = _MOXIE_CORE_DEFAULT_ALIGNMENT_BYTES;
+    }
+    if (align <  0 || align > (Py_ssize_t) self_->allocator.page_size) {
+        PyMoxie_LogErrorV("_moxie_core: Desired alignment %zd is outside of valid range [0, %u].\n", align, self_->allocator.page_size);
+        PyErr_SetString(PyExc_ValueError, "The alignment argument is outside of the valid range");
+        return NULL;
+    }
+    if ((align & (align - 1)) != 0) {
+        PyMoxie_LogErrorV("_moxie_core: Desired alignment %zd must be a power of two integer value.\n", align);
+        PyErr_SetString(PyExc_ValueError, "The alignment argument must be a power of two");
         return NULL;
     }
     if (self_->allocator.head == NULL) {
-        PyMoxie_LogErrorN("_moxie_core: Attempted to reset a disposed allocator.\n");
-        PyErr_SetString(PyExc_ValueError, "Attempted to reset a disposed allocator");
+        PyMoxie_LogErrorN("_moxie_core: Attempted to allocate from disposed allocator.\n");
+        PyErr_SetString(PyExc_ValueError, "Attempted to allocate memory from a disposed allocator");
         return NULL;
     }
-    mem_allocator_reset(&self_->allocator);
-    Py_RETURN_NONE;
+
+    /* Prefer a contiguous buffer of int64 (array.array('q'), numpy.int64) so the lengths can be read without touching Python objects */
+    if (PyObject_CheckBuffer(lengths) && PyObject_GetBuffer(lengths, &view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT) == 0) {
+        if (view.ndim == 1 && view.itemsize == sizeof(int64_t) && view.format != NULL && (view.format[0] == 'q' || view.format[0] == 'l') && view.format[1] == '\0') {
+            lenbuf   =(int64_t const*) view.buf;
+            count    = view.len / view.itemsize;
+            has_view = 1;
+        } else {
+            PyBuffer_Release(&view);
+        }
+    } else {
+        PyErr_Clear();
+    }
+    if (has_view == 0) {
+        if ((seqobj = PySequence_Fast(lengths, "The lengths argument must be a sequence of integers or a buffer of int64")) == NULL) {
+            return NULL;
+        }
+        count = PySequence_Fast_GET_SIZE(seqobj);
+    }
+    if ((result = PyList_New(count)) == NULL) {
+        goto cleanup_and_fail;
+    }
+
+    mark = mem_allocator_mark(&self_->allocator);
+    for (i = 0; i < count; ++i) {
+        Py_ssize_t nbytes = 0;
+        if (has_view) {
+            nbytes =(Py_ssize_t) lenbuf[i];
+        } else if ((nbytes = PyLong_AsSsize_t(PySequence_Fast_GET_ITEM(seqobj, i))) == -1 && PyErr_Occurred()) {
+            mem_allocator_reset_to_marker(&self_->allocator, &mark);
+            goto cleanup_and_fail;
+        }
+        if (nbytes <= 0) {
+            PyMoxie_LogErrorV("_moxie_core: Attempted to allocate %zd bytes from arena; size must be greater than zero.\n", nbytes);
+            PyErr_SetString(PyExc_ValueError, "Each entry in the lengths argument must be greater than zero");
+            mem_allocator_reset_to_marker(&self_->allocator, &mark);
+            goto cleanup_and_fail;
+        }
+        if ((addr = mem_allocator_alloc(&self_->allocator, (size_t) nbytes, (size_t) align)) == NULL) {
+            PyMoxie_LogErrorV("_moxie_core: Memory allocation of %zd bytes with alignment %zd failed from arena %.*s.\n", nbytes, align, 4, (char const*) &self_->allocator.allocator_tag);
+            mem_allocator_reset_to_marker(&self_->allocator, &mark);
+            Py_CLEAR(result);
+            break; /* This is an expected possible outcome */
+        }
+        if ((alloc = PyMoxie_MemoryAllocation_Acquire(self_, addr, (size_t) nbytes, (size_t) align)) == NULL) {
+            PyMoxie_LogErrorV("_moxie_core: Failed to allocate a new MemoryAllocation instance for %p, %zd bytes from arena %.*s.\n", addr, nbytes, 4, (char const*) &self_->allocator.allocator_tag);
+            mem_allocator_reset_to_marker(&self_->allocator, &mark);
+            Py_CLEAR(result);
+            break; /* Not expected, but recoverable */
+        }
+        PyList_SET_ITEM(result, i, (PyObject*) alloc);
+    }
+
+    if (has_view) {
+        PyBuffer_Release(&view);
+    }
+    Py_XDECREF(seqobj);
+    if (result == NULL) {
+        PyErr_Clear();
+        Py_RETURN_NONE;
+    }
+    return result;
+
+cleanup_and_fail:
+    if (has_view) {
+        PyBuffer_Release(&view);
+    }
+    Py_XDECREF(seqobj);
+    Py_XDECREF(result);
+    return NULL;
 }
 
 static PyObject*
-PyMoxie_Reset_Allocator_To_Marker
+PyMoxie_Release_Allocation
 (
     PyObject * Py_UNUSED(self),
     PyObject *           args ,
@@ -1204,40 +1644,181 @@ PyMoxie_Reset_Allocator_To_Marker
 )
 {
     PyMoxie_InternalAllocator *self_ = NULL;
-    PyMoxie_MemoryMarker     *marker = NULL;
-    char const             *kwlist[] ={"arena","marker",NULL};
+    PyMoxie_MemoryAllocation  *alloc = NULL;
+    char const             *kwlist[] ={"arena","allocation",NULL};
 
-    if (PyArg_ParseTupleAndKeywords(args, kwargs, "O!O!:reset_memory_allocator_to_marker", (char**) kwlist, &PyMoxie_InternalAllocatorType, &self_, &PyMoxie_MemoryMarkerType, &marker) == 0) {
-        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTupleAndKeywords(arena,marker) failed in PyMoxie_Reset_Allocator_To_Marker.\n");
+    if (PyArg_ParseTupleAndKeywords(args, kwargs, "O!O!:release_allocation", (char**) kwlist, &PyMoxie_InternalAllocatorType, &self_, &PyMoxie_MemoryAllocationType, &alloc) == 0) {
+        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTupleAndKeywords(arena,allocation) failed in PyMoxie_Release_Allocation.\n");
         return NULL;
     }
-    if (self_->allocator.head == NULL) {
-        PyMoxie_LogErrorN("_moxie_core: Attempted to reset a disposed allocator to a previous marker.\n");
-        PyErr_SetString(PyExc_ValueError, "Attempted to reset a disposed allocator to a previous marker");
+    if (alloc->arena != self_) {
+        PyMoxie_LogErrorV("_moxie_core: Attempted to release allocation %p to arena %.*s other than the one it was allocated from.\n", alloc->base_address, 4, (char const*) &self_->allocator.allocator_tag);
+        PyErr_SetString(PyExc_ValueError, "The allocation was not obtained from this arena");
         return NULL;
     }
-    mem_allocator_reset_to_marker(&self_->allocator, &marker->marker);
+    if (alloc->base_address == NULL) {
+        Py_RETURN_NONE; /* Already released */
+    }
+
+    /* Invalidate the allocation so it no longer exposes the memory block */
+    Py_SETREF(alloc->base_address_int, PyLong_FromVoidPtr(NULL));
+    Py_SETREF(alloc->length_int      , PyLong_FromSize_t(0));
+    alloc->base_address = NULL;
+    alloc->byte_length  = 0;
+    if (self_->freelist_count < _MOXIE_CORE_ALLOCATION_FREELIST_SIZE) {
+        self_->freelist[self_->freelist_count++] =(PyMoxie_MemoryAllocation*) PyMoxie_Retain(alloc);
+    }
     Py_RETURN_NONE;
 }
 
 static PyObject*
-PyMoxie_Create_Job_Queue
+PyMoxie_Get_Memory_Allocator_Info
 (
     PyObject * Py_UNUSED(self),
-    PyObject *           args ,
-    PyObject *         kwargs
+    PyObject *           args
 )
 {
-    PyMoxie_InternalJobQueue *self_ = NULL;
-    uint32_t                     id = 0;
-    static char const     *kwlist[] = {"id", NULL};
+    PyMoxie_InternalAllocator *self_ = NULL;
 
-    if (PyArg_ParseTupleAndKeywords(args, kwargs, "I:create_job_queue", (char**) kwlist, &id) == 0) {
-        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTupleAndKeywords(id) failed in PyMoxie_Create_Job_Queue");
-        return NULL;
-    }
-    if ((self_ = PyMoxie_InternalJobQueue_Create(id)) == NULL) {
-        PyMoxie_LogErrorV("_moxie_core: Failed to create job_queue_t instance with id=%u.\n", id);
+    if (PyArg_ParseTuple(args, "O!:get_memory_allocator_info", &PyMoxie_InternalAllocatorType, &self_) == 0) {
+        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTuple failed in PyMoxie_Get_Memory_Allocator_Info.\n");
+        return NULL;
+    }
+    return PyTuple_Pack(4, self_->page_size_int, self_->growable_bool, self_->allocator_name_str, self_->allocator_tag_int);
+}
+
+static PyObject*
+PyMoxie_Get_Allocator_Stats
+(
+    PyObject * Py_UNUSED(self),
+    PyObject *           args
+)
+{
+    PyMoxie_InternalAllocator *self_ = NULL;
+    uint64_t                    peak = 0;
+    mem_allocator_stats_t      stats;
+
+    if (PyArg_ParseTuple(args, "O!:get_allocator_stats", &PyMoxie_InternalAllocatorType, &self_) == 0) {
+        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTuple failed in PyMoxie_Get_Allocator_Stats.\n");
+        return NULL;
+    }
+    if (self_->allocator.head == NULL) {
+        mem_allocator_stats(&stats, NULL);
+    } else {
+        mem_allocator_stats(&stats, &self_->allocator);
+    }
+    if ((peak = self_->allocator.peak_bytes) < (uint64_t) stats.bytes_used) {
+        peak =(uint64_t) stats.bytes_used;
+    }
+    return Py_BuildValue("(nnKKK)", (Py_ssize_t) stats.bytes_used, (Py_ssize_t) stats.bytes_total, (unsigned long long) self_->allocator.alloc_count, (unsigned long long) self_->allocator.reset_count, (unsigned long long) peak);
+}
+
+static PyObject*
+PyMoxie_Mark_Allocator
+(
+    PyObject * Py_UNUSED(self),
+    PyObject *           args
+)
+{
+    PyMoxie_InternalAllocator *self_ = NULL;
+    PyMoxie_MemoryMarker     *marker = NULL;
+    mem_marker_t                mark;
+
+    if (PyArg_ParseTuple(args, "O!:create_allocator_marker", &PyMoxie_InternalAllocatorType, &self_) == 0) {
+        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTuple failed in PyMoxie_Mark_Allocator.\n");
+        return NULL;
+    }
+    if (self_->allocator.head == NULL) {
+        PyMoxie_LogErrorN("_moxie_core: Attempted to obtain a marker from a disposed allocator.\n");
+        PyErr_SetString(PyExc_ValueError, "Attempted to obtain a marker from a disposed allocator");
+        return NULL;
+    }
+
+    mark = mem_allocator_mark(&self_->allocator);
+    if ((marker = PyMoxie_MemoryMarker_Create(self_, mark)) == NULL) {
+        PyMoxie_LogErrorV("_moxie_core: Failed to allocate a new MemoryMarker instance for arena %.*s.\n", 4, (char const*) &self_->allocator.allocator_tag);
+        return NULL;
+    }
+    return PyMoxie_Retain(marker);
+}
+
+static PyObject*
+PyMoxie_Reset_Allocator
+(
+    PyObject * Py_UNUSED(self),
+    PyObject *           args
+)
+{
+    PyMoxie_InternalAllocator *self_ = NULL;
+    Py_ssize_t             threshold = _MOXIE_CORE_DEFAULT_DECOMMIT_THRESHOLD;
+
+    if (PyArg_ParseTuple(args, "O!|n:reset_memory_allocator", &PyMoxie_InternalAllocatorType, &self_, &threshold) == 0) {
+        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTuple failed in PyMoxie_Reset_Allocator.\n");
+        return NULL;
+    }
+    if (threshold < 0) {
+        PyMoxie_LogErrorV("_moxie_core: Decommit threshold %zd must be greater than or equal to zero.\n", threshold);
+        PyErr_SetString(PyExc_ValueError, "The threshold argument must be greater than or equal to zero");
+        return NULL;
+    }
+    if (self_->allocator.head == NULL) {
+        PyMoxie_LogErrorN("_moxie_core: Attempted to reset a disposed allocator.\n");
+        PyErr_SetString(PyExc_ValueError, "Attempted to reset a disposed allocator");
+        return NULL;
+    }
+    mem_allocator_reset_and_decommit(&self_->allocator, (size_t) threshold);
+    Py_RETURN_NONE;
+}
+
+static PyObject*
+PyMoxie_Reset_Allocator_To_Marker
+(
+    PyObject * Py_UNUSED(self),
+    PyObject *           args ,
+    PyObject *         kwargs
+)
+{
+    PyMoxie_InternalAllocator *self_ = NULL;
+    PyMoxie_MemoryMarker     *marker = NULL;
+    Py_ssize_t             threshold = _MOXIE_CORE_DEFAULT_DECOMMIT_THRESHOLD;
+    char const             *kwlist[] ={"arena","marker","threshold",NULL};
+
+    if (PyArg_ParseTupleAndKeywords(args, kwargs, "O!O!|n:reset_memory_allocator_to_marker", (char**) kwlist, &PyMoxie_InternalAllocatorType, &self_, &PyMoxie_MemoryMarkerType, &marker, &threshold) == 0) {
+        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTupleAndKeywords(arena,marker,threshold) failed in PyMoxie_Reset_Allocator_To_Marker.\n");
+        return NULL;
+    }
+    if (threshold < 0) {
+        PyMoxie_LogErrorV("_moxie_core: Decommit threshold %zd must be greater than or equal to zero.\n", threshold);
+        PyErr_SetString(PyExc_ValueError, "The threshold argument must be greater than or equal to zero");
+        return NULL;
+    }
+    if (self_->allocator.head == NULL) {
+        PyMoxie_LogErrorN("_moxie_core: Attempted to reset a disposed allocator to a previous marker.\n");
+        PyErr_SetString(PyExc_ValueError, "Attempted to reset a disposed allocator to a previous marker");
+        return NULL;
+    }
+    mem_allocator_reset_to_marker_and_decommit(&self_->allocator, &marker->marker, (size_t) threshold);
+    Py_RETURN_NONE;
+}
+
+static PyObject*
+PyMoxie_Create_Job_Queue
+(
+    PyObject * Py_UNUSED(self),
+    PyObject *           args ,
+    PyObject *         kwargs
+)
+{
+    PyMoxie_InternalJobQueue *self_ = NULL;
+    uint32_t                     id = 0;
+    static char const     *kwlist[] = {"id", NULL};
+
+    if (PyArg_ParseTupleAndKeywords(args, kwargs, "I:create_job_queue", (char**) kwlist, &id) == 0) {
+        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTupleAndKeywords(id) failed in PyMoxie_Create_Job_Queue");
+        return NULL;
+    }
+    if ((self_ = PyMoxie_InternalJobQueue_Create(id)) == NULL) {
+        PyMoxie_LogErrorV("_moxie_core: Failed to create job_queue_t instance with id=%u.\n", id);
         return NULL;
     }
     return PyMoxie_Retain(self_);
@@ -1261,7 +1842,47 @@ PyMoxie_Flush_Job_Queue
         PyErr_SetString(PyExc_ValueError, "InternalJobQueue state field is NULL");
         return NULL;
     }
+    Py_BEGIN_ALLOW_THREADS
     job_queue_flush(self_->state);
+    Py_END_ALLOW_THREADS
+    Py_RETURN_NONE;
+}
+
+static PyObject*
+PyMoxie_Flush_Job_Queues
+(
+    PyObject * Py_UNUSED(self),
+    PyObject *           args
+)
+{
+    PyObject                 *queues = NULL;
+    PyObject                   *fast = NULL;
+    PyObject                 **items = NULL;
+    PyMoxie_InternalJobQueue  *queue = NULL;
+    Py_ssize_t                  i, n;
+
+    if (PyArg_ParseTuple(args, "O:flush_job_queues", &queues) == 0) {
+        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTuple failed in PyMoxie_Flush_Job_Queues.\n");
+        return NULL;
+    }
+    if ((fast = PySequence_Fast(queues, "flush_job_queues expects a sequence of InternalJobQueue")) == NULL) {
+        return NULL;
+    }
+    items = PySequence_Fast_ITEMS(fast);
+    for (i = 0, n = PySequence_Fast_GET_SIZE(fast); i < n; ++i) {
+        if (PyObject_TypeCheck(items[i], &PyMoxie_InternalJobQueueType) == 0) {
+            PyErr_SetString(PyExc_TypeError, "flush_job_queues expects a sequence of InternalJobQueue");
+            Py_DECREF(fast);
+            return NULL;
+        }
+        queue =(PyMoxie_InternalJobQueue*) items[i];
+        if (queue->state != NULL) {
+            Py_BEGIN_ALLOW_THREADS
+            job_queue_flush(queue->state);
+            Py_END_ALLOW_THREADS
+        }
+    }
+    Py_DECREF(fast);
     Py_RETURN_NONE;
 }
 
@@ -1286,7 +1907,36 @@ PyMoxie_Signal_Job_Queue
         PyErr_SetString(PyExc_ValueError, "InternalJobQueue state field is NULL");
         return NULL;
     }
+    Py_BEGIN_ALLOW_THREADS
     job_queue_signal(self_->state, signal);
+    Py_END_ALLOW_THREADS
+    Py_RETURN_NONE;
+}
+
+static PyObject*
+PyMoxie_Signal_Job_Queue_One
+(
+    PyObject *   self,
+    PyObject *   args,
+    PyObject * kwargs
+)
+{
+    PyMoxie_InternalJobQueue *self_ = NULL;
+    uint32_t                 signal = JOB_QUEUE_SIGNAL_CLEAR;
+    static char const     *kwlist[] ={"queue", "signal", NULL};
+
+    if (PyArg_ParseTupleAndKeywords(args, kwargs, "O!I:signal_job_queue_one", (char**) kwlist, &PyMoxie_InternalJobQueueType, &self_, &signal) == 0) {
+        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTupleAndKeywords(queue, signal) failed in PyMoxie_Signal_Job_Queue_One");
+        return NULL;
+    }
+    if (self_->state == NULL) {
+        PyMoxie_LogErrorN("_moxie_core: PyMoxie_InternalJobQueue::state field is NULL.\n");
+        PyErr_SetString(PyExc_ValueError, "InternalJobQueue state field is NULL");
+        return NULL;
+    }
+    Py_BEGIN_ALLOW_THREADS
+    job_queue_signal_one(self_->state, signal);
+    Py_END_ALLOW_THREADS
     Py_RETURN_NONE;
 }
 
@@ -1387,7 +2037,722 @@ PyMoxie_Release_JobContext
 }
 
 static PyObject*
-PyMoxie_Create_Python_Job
+PyMoxie_Register_Python_Job_Entry
+(
+    PyObject * Py_UNUSED(self),
+    PyObject *           args ,
+    PyObject *         kwargs
+)
+{
+    PyMoxie_InternalJobContext *self_ = NULL;
+    PyObject                *callable = NULL;
+    PyObject                 *entries = NULL;
+    Py_ssize_t                  entry = 0;
+    Py_ssize_t                      n = 0;
+    static char const       *kwlist[] ={"context","callable",NULL};
+
+    if (PyArg_ParseTupleAndKeywords(args, kwargs, "O!O:register_python_job_entry", (char**) kwlist, &PyMoxie_InternalJobContextType, &self_, &callable) == 0) {
+        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTupleAndKeywords(context,callable) failed in PyMoxie_Register_Python_Job_Entry.\n");
+        return NULL;
+    }
+    if (self_->sched == NULL || self_->sched->entries == NULL) {
+        PyMoxie_LogErrorN("_moxie_core: InternalJobContext::sched field is NULL or has no entry list.\n");
+        PyErr_SetString(PyExc_ValueError, "InternalJobContext sched field is NULL");
+        return NULL;
+    }
+    if (PyCallable_Check(callable) == 0) {
+        PyMoxie_LogErrorN("_moxie_core: register_python_job_entry received non-callable callable argument.\n");
+        PyErr_SetString(PyExc_TypeError, "Value specified for callable argument should be a callable");
+        return NULL;
+    }
+    /* Registering the same callable again returns the existing entry identifier. */
+    entries = self_->sched->entries;
+    for (entry = 0, n = PyList_GET_SIZE(entries); entry < n; ++entry) {
+        if (PyList_GET_ITEM(entries, entry) == callable) {
+            return PyLong_FromSsize_t(entry);
+        }
+    }
+    if (PyList_Append(entries, callable) != 0) {
+        return NULL;
+    } return PyLong_FromSsize_t(n);
+}
+
+/**
+ * Allocate a job and retain the references required to invoke a Python job entry point.
+ * @param self_ The InternalJobContext bound to the calling thread.
+ * @param parent_id The identifier of the parent job, or JOB_ID_INVALID.
+ * @param callable The job entry point. A new reference is retained by the job.
+ * @param callargs The tuple of positional arguments. A new reference is retained by the job.
+ * @param callkwargs The dictionary of keyword arguments. A new reference is retained by the job.
+ * @return The job descriptor, or NULL if an error occurred.
+ */
+static job_descriptor_t*
+python_job_alloc
+(
+    PyMoxie_InternalJobContext *self_,
+    job_id_t                parent_id,
+    PyObject                *callable,
+    PyObject                *callargs,
+    PyObject              *callkwargs
+)
+{
+    PyMoxie_PythonJobState   *jobdata = NULL;
+    job_descriptor_t         *jobdesc = NULL;
+
+    if ((jobdesc = job_context_create_job(self_->state, parent_id, sizeof(PyMoxie_PythonJobState), mem_align_of(PyMoxie_PythonJobState))) == NULL) {
+        PyMoxie_LogErrorV("_moxie_core: Failed to allocate %zu bytes with alignment %zu for Python job state.\n", sizeof(PyMoxie_PythonJobState), mem_align_of(PyMoxie_PythonJobState));
+        PyErr_SetString(PyExc_RuntimeError, "Failed to acquired storage for Python job");
+        return NULL;
+    }
+    jobdesc->jobmain   = python_job_main;
+    jobdesc->user1     =(uintptr_t) 0;
+    jobdesc->user2     =(uintptr_t) 0;
+    jobdata = (PyMoxie_PythonJobState*) jobdesc->data;
+    jobdata->id_to_ctx = PyMoxie_Retain(self_->sched->id_to_ctx);
+    jobdata->callable  = PyMoxie_Retain(callable);
+    jobdata->args      = PyMoxie_Retain(callargs);
+    jobdata->kwargs    = PyMoxie_Retain(callkwargs);
+    return jobdesc;
+}
+
+/**
+ * Allocate a job and retain the references required to invoke a Python job entry point.
+ * @param self_ The InternalJobContext bound to the calling thread.
+ * @param parent_id The identifier of the parent job, or JOB_ID_INVALID.
+ * @param callable The job entry point. A new reference is retained by the job.
+ * @param callargs The tuple of positional arguments. A new reference is retained by the job.
+ * @param callkwargs The dictionary of keyword arguments. A new reference is retained by the job.
+ * @return The job identifier as a Python int, or NULL if an error occurred.
+ */
+static PyObject*
+python_job_create
+(
+    PyMoxie_InternalJobContext *self_,
+    job_id_t                parent_id,
+    PyObject                *callable,
+    PyObject                *callargs,
+    PyObject              *callkwargs
+)
+{
+    job_descriptor_t *jobdesc = python_job_alloc(self_, parent_id, callable, callargs, callkwargs);
+    if (jobdesc != NULL) {
+        return PyLong_FromUnsignedLong((unsigned long) jobdesc->id);
+    } return NULL;
+}
+
+static PyObject*
+PyMoxie_Create_Python_Job
+(
+    PyObject * Py_UNUSED(self),
+    PyObject * const    *args ,
+    Py_ssize_t           nargs
+)
+{
+    PyMoxie_InternalJobContext *self_ = NULL;
+    job_id_t                parent_id = JOB_ID_INVALID;
+
+    /* Called on every job spawn; arguments are positional-only (context, parent, callable, args, kwargs) and are taken straight from the vectorcall stack, so no argument tuple is built. */
+    if (nargs != 5) {
+        PyMoxie_LogErrorV("_moxie_core: create_python_job expects 5 positional arguments (context,parent,callable,args,kwargs), got %zd.\n", nargs);
+        PyErr_Format(PyExc_TypeError, "create_python_job expected 5 positional arguments, got %zd", nargs);
+        return NULL;
+    }
+    if (Py_TYPE(args[0]) != &PyMoxie_InternalJobContextType) {
+        PyMoxie_LogErrorN("_moxie_core: Expected InternalJobContext instance for context argument in create_python_job.\n");
+        PyErr_SetString(PyExc_TypeError, "Expected InternalJobContext instance for context argument");
+        return NULL;
+    }
+    self_     =(PyMoxie_InternalJobContext*) args[0];
+    parent_id =(job_id_t) PyLong_AsUnsignedLongMask(args[1]);
+    if (parent_id == (job_id_t) -1 && PyErr_Occurred()) {
+        PyMoxie_LogErrorN("_moxie_core: create_python_job received non-int parent argument.\n");
+        return NULL;
+    }
+#ifndef NDEBUG
+    if (self_->state == NULL) {
+        PyMoxie_LogErrorN("_moxie_core: InternalJobContext::state field is NULL.\n");
+        PyErr_SetString(PyExc_ValueError, "InternalJobContext state field is NULL");
+        return NULL;
+    }
+    if (PyCallable_Check(args[2]) == 0) {
+        PyMoxie_LogErrorN("_moxie_core: create_python_job received non-callable callable argument.\n");
+        PyErr_SetString(PyExc_TypeError, "Value specified for callable argument should be a callable");
+        return NULL;
+    }
+#endif
+    return python_job_create(self_, parent_id, args[2], args[3], args[4]);
+}
+
+static PyObject*
+PyMoxie_Create_Python_Job_By_Id
+(
+    PyObject * Py_UNUSED(self),
+    PyObject *           args ,
+    PyObject *         kwargs
+)
+{
+    PyMoxie_InternalJobContext *self_ = NULL;
+    PyObject                *callargs = NULL;
+    PyObject              *callkwargs = NULL;
+    Py_ssize_t                  entry = 0;
+    job_id_t                parent_id = JOB_ID_INVALID;
+    static char const       *kwlist[] ={"context","entry","parent","args","kwargs",NULL};
+
+    if (PyArg_ParseTupleAndKeywords(args, kwargs, "O!nIOO:create_python_job_by_id", (char**) kwlist, &PyMoxie_InternalJobContextType, &self_, &entry, &parent_id, &callargs, &callkwargs) == 0) {
+        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTupleAndKeywords(context,entry,parent,args,kwargs) failed in PyMoxie_Create_Python_Job_By_Id.\n");
+        return NULL;
+    }
+#ifndef NDEBUG
+    if (self_->state == NULL) {
+        PyMoxie_LogErrorN("_moxie_core: InternalJobContext::state field is NULL.\n");
+        PyErr_SetString(PyExc_ValueError, "InternalJobContext state field is NULL");
+        return NULL;
+    }
+#endif
+    if (entry < 0 || entry >= PyList_GET_SIZE(self_->sched->entries)) {
+        PyMoxie_LogErrorV("_moxie_core: Invalid job entry identifier %zd supplied to create_python_job_by_id.\n", entry);
+        PyErr_SetString(PyExc_ValueError, "Invalid job entry identifier supplied to create_python_job_by_id");
+        return NULL;
+    }
+    return python_job_create(self_, parent_id, PyList_GET_ITEM(self_->sched->entries, entry), callargs, callkwargs);
+}
+
+static PyObject*
+PyMoxie_Create_Python_Job_Fast
+(
+    PyObject * Py_UNUSED(self),
+    PyObject *           args
+)
+{
+    PyMoxie_InternalJobContext *self_ = NULL;
+    PyObject                *callable = NULL;
+    PyObject                *callargs = NULL;
+
+    /* Positional-only arguments, no parent and no kwargs dict - python_job_main builds the dict when the job runs. */
+    if (PyArg_ParseTuple(args, "O!OO!:create_python_job_fast", &PyMoxie_InternalJobContextType, &self_, &callable, &PyTuple_Type, &callargs) == 0) {
+        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTuple(context,callable,args) failed in PyMoxie_Create_Python_Job_Fast.\n");
+        return NULL;
+    }
+#ifndef NDEBUG
+    if (self_->state == NULL) {
+        PyMoxie_LogErrorN("_moxie_core: InternalJobContext::state field is NULL.\n");
+        PyErr_SetString(PyExc_ValueError, "InternalJobContext state field is NULL");
+        return NULL;
+    }
+    if (PyCallable_Check(callable) == 0) {
+        PyMoxie_LogErrorN("_moxie_core: create_python_job_fast received non-callable callable argument.\n");
+        PyErr_SetString(PyExc_TypeError, "Value specified for callable argument should be a callable");
+        return NULL;
+    }
+#endif
+    return python_job_create(self_, JOB_ID_INVALID, callable, callargs, Py_None);
+}
+
+static PyObject*
+PyMoxie_Create_Native_Job
+(
+    PyObject * Py_UNUSED(self),
+    PyObject *           args ,
+    PyObject *         kwargs
+)
+{
+    PyMoxie_InternalJobContext *self_ = NULL;
+    job_descriptor_t         *jobdesc = NULL;
+    unsigned long long       function = 0;
+    unsigned long long        userarg = 0;
+    job_id_t                parent_id = JOB_ID_INVALID;
+    static char const       *kwlist[] ={"context","function","arg","parent",NULL};
+
+    if (PyArg_ParseTupleAndKeywords(args, kwargs, "O!K|KI:create_native_job", (char**) kwlist, &PyMoxie_InternalJobContextType, &self_, &function, &userarg, &parent_id) == 0) {
+        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTupleAndKeywords(context,function,arg,parent) failed in PyMoxie_Create_Native_Job.\n");
+        return NULL;
+    }
+    if (self_->state == NULL) {
+        PyMoxie_LogErrorN("_moxie_core: InternalJobContext::state field is NULL.\n");
+        PyErr_SetString(PyExc_ValueError, "InternalJobContext state field is NULL");
+        return NULL;
+    }
+    if (function == 0) {
+        PyMoxie_LogErrorN("_moxie_core: create_native_job received a NULL function address.\n");
+        PyErr_SetString(PyExc_ValueError, "The function address for a native job cannot be zero");
+        return NULL;
+    }
+    if ((jobdesc = job_context_create_job(self_->state, parent_id, 0, 1)) == NULL) {
+        PyMoxie_LogErrorN("_moxie_core: Failed to allocate a native job.\n");
+        PyErr_SetString(PyExc_RuntimeError, "Failed to acquire storage for native job");
+        return NULL;
+    }
+    jobdesc->jobmain = native_job_main;
+    jobdesc->user1   =(uintptr_t) function;
+    jobdesc->user2   =(uintptr_t) userarg;
+    return PyLong_FromUnsignedLong((unsigned long) jobdesc->id);
+}
+
+static PyObject*
+PyMoxie_Submit_Python_Job
+(
+    PyObject * Py_UNUSED(self),
+    PyObject *           args ,
+    PyObject *         kwargs
+)
+{
+    PyMoxie_InternalJobContext *self_ = NULL;
+    PyMoxie_InternalJobQueue   *queue = NULL;
+    job_descriptor_t         *jobdesc = NULL;
+    PyObject                 *deplist = NULL;
+    long                  submit_type = JOB_SUBMIT_RUN;
+    job_id_t                   job_id = JOB_ID_INVALID;
+    job_id_t                   depjob = JOB_ID_INVALID;
+    job_id_t                  depvals[16];
+    Py_ssize_t const          MAXDEPS = mem_count_of(depvals);
+    Py_ssize_t                numdeps = 0;
+    Py_ssize_t               numvalid = 0;
+    Py_ssize_t                      i = 0;
+    int                 submit_result = JOB_SUBMIT_SUCCESS;
+    static char const       *kwlist[] ={"context","jobid","queue","depends","submit_type",NULL};
+
+    if (PyArg_ParseTupleAndKeywords(args, kwargs, "O!IOOl:submit_python_job", (char**) kwlist, &PyMoxie_InternalJobContextType, &self_, &job_id, &queue, &deplist, &submit_type) == 0) {
+        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTupleAndKeywords(context,jobid,queue,depends,submit_type) failed in PyMoxie_Submit_Python_Job.\n");
+        return NULL;
+    }
+#ifndef NDEBUG
+    if (self_->state == NULL) {
+        PyMoxie_LogErrorN("_moxie_core: InternalJobContext::state field is NULL. Was job context released previously?\n");
+        PyErr_SetString(PyExc_ValueError, "InternalJobContext state field is NULL");
+        return NULL;
+    }
+    if (self_->sched == NULL) {
+        PyMoxie_LogErrorN("_moxie_core: InternalJobContext::sched field is NULL.\n");
+        PyErr_SetString(PyExc_ValueError, "InternalJobContext sched field is NULL");
+        return NULL;
+    }
+    if (self_->queue == NULL) {
+        PyMoxie_LogErrorN("_moxie_core: InternalJobContext::queue field is NULL.\n");
+        PyErr_SetString(PyExc_ValueError, "InternalJobContext queue field is NULL");
+        return NULL;
+    }
+    if (self_->sched->state == NULL) {
+        PyMoxie_LogErrorN("_moxie_core: InternalJobContext::sched field has NULL state field.\n");
+        PyErr_SetString(PyExc_ValueError, "InternalJobContext sched field has NULL state field");
+        return NULL;
+    }
+    if (submit_type != JOB_SUBMIT_RUN && submit_type != JOB_SUBMIT_CANCEL) {
+        PyMoxie_LogErrorV("_moxie_core: Invalid submit_type %u supplied to submit_python_job.\n", submit_type);
+        PyErr_SetString(PyExc_ValueError, "Invalid submit_type supplied to submit_python_job");
+        return NULL;
+    }
+#endif
+    if ((jobdesc = job_scheduler_resolve_job_id(self_->sched->state, job_id)) == NULL) {
+        return PyLong_FromLong((long) JOB_SUBMIT_INVALID_JOB);
+    }
+    if (queue == NULL || queue == (PyMoxie_InternalJobQueue*) Py_None) {
+        /* Use the default queue for the job context. */
+        jobdesc->target = NULL;
+    } else {
+#ifndef NDEBUG
+        if (Py_TYPE(queue) != &PyMoxie_InternalJobQueueType) {
+            PyMoxie_LogErrorN("_moxie_core: Expected InternalJobQueue instance for queue argument in submit_python_job.\n");
+            PyErr_SetString(PyExc_TypeError, "Expected InternalJobQueue instance for queue argument");
+            return NULL;
+        }
+#endif
+        /* Submit the job to the supplied queue. */
+        jobdesc->target = queue->state;
+    }
+    if (deplist != NULL && deplist != Py_None) {
+#ifndef NDEBUG
+        if (PyList_Check(deplist) == 0) {
+            PyMoxie_LogErrorN("_moxie_core: Expected List[int] for depends argument.\n");
+            PyErr_SetString(PyExc_TypeError, "Expected List[int] for depends argument");
+            return NULL;
+        }
+#endif
+        if ((numdeps = PyList_Size(deplist)) > MAXDEPS) {
+            PyMoxie_LogErrorV("_moxie_core: Rejecting job 0x%08X; dependency count %zu exceeds maximum %zu.\n", job_id, (size_t) numdeps, (size_t) MAXDEPS);
+            PyErr_SetString(PyExc_RuntimeError, "Rejecting job submission; job has too many dependencies");
+            return NULL;
+        }
+        for (i = 0; i < numdeps; ++i) {
+            PyObject *val = PyList_GET_ITEM(deplist, i);
+#ifndef NDEBUG
+            if (PyLong_Check(val) == 0) {
+                PyMoxie_LogErrorV("_moxie_core: Job 0x%08X dependency %zu does not have expected int type.\n", job_id, (size_t) i);
+                PyErr_SetString(PyExc_TypeError, "Job dependency list contains non-int values");
+                return NULL;
+            }
+#endif
+            if ((depjob = (job_id_t) PyLong_AsUnsignedLong(val)) != JOB_ID_INVALID) {
+                depvals[numvalid++] = depjob;
+            } else {
+                PyMoxie_LogErrorV("_moxie_core: Job 0x%08X dependency %zu is JOB_ID_INVALID; ignoring.\n", job_id, (size_t) i);
+            }
+        }
+    }
+    submit_result = job_context_submit_job(self_->state, jobdesc, depvals, (size_t) numvalid, (int) submit_type);
+    return PyLong_FromLong((long) submit_result);
+}
+
+/**
+ * Submit a job whose dependencies were passed as individual positional arguments.
+ * This is the shared tail of the submit_python_job_N entry points, which avoid building and unpacking a dependency list.
+ * @param self_ The InternalJobContext bound to the calling thread.
+ * @param job_id The identifier of the job to submit.
+ * @param queue The InternalJobQueue to which the job is submitted, or None to use the context's default queue.
+ * @param depvals An array of numdeps dependency job identifiers. Entries equal to JOB_ID_INVALID are ignored.
+ * @param numdeps The number of entries in depvals.
+ * @param submit_type One of the values of the job_submit_type_e enumeration.
+ * @return A PyLong holding one of the values of the job_submit_result_e enumeration, or NULL if an error occurred.
+ */
+static PyObject*
+python_job_submit_inline
+(
+    PyMoxie_InternalJobContext *self_,
+    job_id_t                   job_id,
+    PyObject                   *queue,
+    job_id_t                 *depvals,
+    size_t                    numdeps,
+    long                  submit_type
+)
+{
+    job_descriptor_t *jobdesc = NULL;
+    size_t              count = 0;
+    size_t                  i = 0;
+
+#ifndef NDEBUG
+    if (self_->state == NULL || self_->sched == NULL || self_->sched->state == NULL) {
+        PyMoxie_LogErrorN("_moxie_core: InternalJobContext is not bound to a scheduler. Was job context released previously?\n");
+        PyErr_SetString(PyExc_ValueError, "InternalJobContext is not bound to a scheduler");
+        return NULL;
+    }
+    if (submit_type != JOB_SUBMIT_RUN && submit_type != JOB_SUBMIT_CANCEL) {
+        PyMoxie_LogErrorV("_moxie_core: Invalid submit_type %ld supplied to submit_python_job_N.\n", submit_type);
+        PyErr_SetString(PyExc_ValueError, "Invalid submit_type supplied to submit_python_job_N");
+        return NULL;
+    }
+#endif
+    if ((jobdesc = job_scheduler_resolve_job_id(self_->sched->state, job_id)) == NULL) {
+        return PyLong_FromLong((long) JOB_SUBMIT_INVALID_JOB);
+    }
+    if (queue == Py_None) {
+        /* Use the default queue for the job context. */
+        jobdesc->target = NULL;
+    } else {
+        if (Py_TYPE(queue) != &PyMoxie_InternalJobQueueType) {
+            PyMoxie_LogErrorN("_moxie_core: Expected InternalJobQueue instance for queue argument in submit_python_job_N.\n");
+            PyErr_SetString(PyExc_TypeError, "Expected InternalJobQueue instance for queue argument");
+            return NULL;
+        }
+        jobdesc->target = ((PyMoxie_InternalJobQueue*) queue)->state;
+    }
+    for (i = 0; i < numdeps; ++i) {
+        if (depvals[i] != JOB_ID_INVALID) {
+            depvals[count++] = depvals[i];
+        }
+    }
+    return PyLong_FromLong((long) job_context_submit_job(self_->state, jobdesc, depvals, count, (int) submit_type));
+}
+
+static PyObject*
+PyMoxie_Submit_Python_Job_0
+(
+    PyObject * Py_UNUSED(self),
+    PyObject *           args
+)
+{
+    PyMoxie_InternalJobContext *self_ = NULL;
+    PyObject                   *queue = NULL;
+    long                  submit_type = JOB_SUBMIT_RUN;
+    job_id_t                   job_id = JOB_ID_INVALID;
+
+    if (PyArg_ParseTuple(args, "O!IOl:submit_python_job_0", &PyMoxie_InternalJobContextType, &self_, &job_id, &queue, &submit_type) == 0) {
+        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTuple(context,jobid,queue,submit_type) failed in PyMoxie_Submit_Python_Job_0.\n");
+        return NULL;
+    }
+    return python_job_submit_inline(self_, job_id, queue, NULL, 0, submit_type);
+}
+
+static PyObject*
+PyMoxie_Submit_Python_Job_1
+(
+    PyObject * Py_UNUSED(self),
+    PyObject *           args
+)
+{
+    PyMoxie_InternalJobContext *self_ = NULL;
+    PyObject                   *queue = NULL;
+    long                  submit_type = JOB_SUBMIT_RUN;
+    job_id_t                   job_id = JOB_ID_INVALID;
+    job_id_t                  depvals[1] = { JOB_ID_INVALID };
+
+    if (PyArg_ParseTuple(args, "O!IOlI:submit_python_job_1", &PyMoxie_InternalJobContextType, &self_, &job_id, &queue, &submit_type, &depvals[0]) == 0) {
+        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTuple(context,jobid,queue,submit_type,d0) failed in PyMoxie_Submit_Python_Job_1.\n");
+        return NULL;
+    }
+    return python_job_submit_inline(self_, job_id, queue, depvals, 1, submit_type);
+}
+
+static PyObject*
+PyMoxie_Submit_Python_Job_2
+(
+    PyObject * Py_UNUSED(self),
+    PyObject *           args
+)
+{
+    PyMoxie_InternalJobContext *self_ = NULL;
+    PyObject                   *queue = NULL;
+    long                  submit_type = JOB_SUBMIT_RUN;
+    job_id_t                   job_id = JOB_ID_INVALID;
+    job_id_t                  depvals[3] = { JOB_ID_INVALID, JOB_ID_INVALID, JOB_ID_INVALID };
+
+    if (PyArg_ParseTuple(args, "O!IOlII|I:submit_python_job_2", &PyMoxie_InternalJobContextType, &self_, &job_id, &queue, &submit_type, &depvals[0], &depvals[1], &depvals[2]) == 0) {
+        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTuple(context,jobid,queue,submit_type,d0,d1,d2) failed in PyMoxie_Submit_Python_Job_2.\n");
+        return NULL;
+    }
+    return python_job_submit_inline(self_, job_id, queue, depvals, mem_count_of(depvals), submit_type);
+}
+
+/**
+ * Submit a batch of Python jobs with a single call into the native scheduler.
+ * @param self_ The InternalJobContext bound to the calling thread.
+ * @param queue The InternalJobQueue to which ready-to-run jobs are pushed, or NULL/None to use the context's default queue.
+ * @param joblist A sequence of job identifiers.
+ * @param deplist A sequence with one Optional[List[int]] of dependencies per job, or NULL/None.
+ * @param submit_type One of the values of the job_submit_type_e enumeration.
+ * @param outbuf An optional caller-supplied array of outlen int8 values that receives one job_submit_result_e per job. Specify NULL to return the results as Python objects.
+ * @param outlen The number of entries in outbuf.
+ * @return If outbuf is NULL, JOB_SUBMIT_SUCCESS or a list of per-job results. Otherwise, the number of jobs that failed to submit. NULL if an error occurred.
+ */
+static PyObject*
+python_jobs_submit
+(
+    PyMoxie_InternalJobContext *self_,
+    PyMoxie_InternalJobQueue   *queue,
+    PyObject                 *joblist,
+    PyObject                 *deplist,
+    long                  submit_type,
+    int8_t                    *outbuf,
+    Py_ssize_t                 outlen
+)
+{
+    PyObject                 *jobseq  = NULL;
+    PyObject                 *depseq  = NULL;
+    PyObject                  *retval = NULL;
+    job_descriptor_t        **jobdesc = NULL;
+    job_id_t                 *depvals = NULL;
+    size_t                  *depcount = NULL;
+    int                      *results = NULL;
+    int                      *jobrslt = NULL;
+    uint8_t                  *storage = NULL;
+    uint64_t                  scratch[PYMOXIE_SUBMIT_SCRATCH_BYTES / sizeof(uint64_t)];
+    size_t                     nbytes = 0;
+    struct job_queue_t        *target = NULL;
+    job_id_t                   job_id = JOB_ID_INVALID;
+    Py_ssize_t                 njobs  = 0;
+    Py_ssize_t                 ndeps  = 0;
+    Py_ssize_t                 nvalid = 0;
+    Py_ssize_t                 nfail  = 0;
+    Py_ssize_t                  i, j;
+
+    if (self_->state == NULL || self_->sched == NULL || self_->sched->state == NULL) {
+        PyMoxie_LogErrorN("_moxie_core: InternalJobContext passed to submit_python_jobs has NULL state. Was job context released previously?\n");
+        PyErr_SetString(PyExc_ValueError, "InternalJobContext state field is NULL");
+        return NULL;
+    }
+    if (submit_type != JOB_SUBMIT_RUN && submit_type != JOB_SUBMIT_CANCEL) {
+        PyMoxie_LogErrorV("_moxie_core: Invalid submit_type %ld supplied to submit_python_jobs.\n", submit_type);
+        PyErr_SetString(PyExc_ValueError, "Invalid submit_type supplied to submit_python_jobs");
+        return NULL;
+    }
+    if (queue != NULL && queue != (PyMoxie_InternalJobQueue*) Py_None) {
+        if (Py_TYPE(queue) != &PyMoxie_InternalJobQueueType) {
+            PyMoxie_LogErrorN("_moxie_core: Expected InternalJobQueue instance for queue argument in submit_python_jobs.\n");
+            PyErr_SetString(PyExc_TypeError, "Expected InternalJobQueue instance for queue argument");
+            return NULL;
+        } target = queue->state;
+    }
+    if ((jobseq = PySequence_Fast(joblist, "Expected Sequence[int] for jobids argument")) == NULL) {
+        return NULL;
+    }
+    njobs = PySequence_Fast_GET_SIZE(jobseq);
+    if (outbuf != NULL && outlen < njobs) {
+        PyMoxie_LogErrorV("_moxie_core: Result buffer with %zd entries is too small for %zd jobs in submit_python_jobs_buf.\n", outlen, njobs);
+        PyErr_SetString(PyExc_ValueError, "The out buffer must have at least one entry per job");
+        goto cleanup;
+    }
+    if (deplist != NULL && deplist != Py_None) {
+        if ((depseq = PySequence_Fast(deplist, "Expected Sequence[Optional[List[int]]] for depends argument")) == NULL) {
+            goto cleanup;
+        }
+        if (PySequence_Fast_GET_SIZE(depseq) != njobs) {
+            PyErr_SetString(PyExc_ValueError, "The depends argument must have one entry per job");
+            goto cleanup;
+        }
+        for (i = 0; i < njobs; ++i) {
+            PyObject *deps = PySequence_Fast_GET_ITEM(depseq, i);
+            if (deps != Py_None) {
+                if (PyList_Check(deps) == 0) {
+                    PyErr_SetString(PyExc_TypeError, "Expected List[int] or None for each entry of the depends argument");
+                    goto cleanup;
+                } ndeps += PyList_GET_SIZE(deps);
+            }
+        }
+    }
+
+    /* Sub-allocate all scratch arrays from a single block, which for the common small batch lives on the stack. */
+    nbytes = (size_t) njobs * (sizeof(job_descriptor_t*) + sizeof(size_t) + 2 * sizeof(int)) + (size_t) ndeps * sizeof(job_id_t) + 1;
+    if (nbytes <= sizeof(scratch)) {
+        storage = (uint8_t*) scratch;
+    } else if ((storage = (uint8_t*) PyMem_Malloc(nbytes)) == NULL) {
+        PyErr_NoMemory();
+        goto cleanup;
+    }
+    jobdesc  = (job_descriptor_t**) storage;
+    depcount = (size_t  *)(jobdesc  + njobs);
+    depvals  = (job_id_t*)(depcount + njobs);
+    results  = (int     *)(depvals  + ndeps);
+    jobrslt  = (int     *)(results  + njobs);
+
+    /* Resolve job identifiers and flatten dependency lists; invalid jobs are reported but not submitted. */
+    for (i = 0, ndeps = 0; i < njobs; ++i) {
+        PyObject *val  = PySequence_Fast_GET_ITEM(jobseq, i);
+        PyObject *deps = (depseq != NULL) ? PySequence_Fast_GET_ITEM(depseq, i) : Py_None;
+        job_id = (job_id_t) PyLong_AsUnsignedLong(val);
+        if (job_id == (job_id_t) -1 && PyErr_Occurred()) {
+            goto cleanup;
+        }
+        if ((jobdesc[nvalid] = job_scheduler_resolve_job_id(self_->sched->state, job_id)) == NULL) {
+            results[i] = JOB_SUBMIT_INVALID_JOB;
+            continue;
+        }
+        jobdesc[nvalid]->target = target;
+        depcount[nvalid] = 0;
+        if (deps != Py_None) {
+            for (j = 0; j < PyList_GET_SIZE(deps); ++j) {
+                job_id_t depjob = (job_id_t) PyLong_AsUnsignedLong(PyList_GET_ITEM(deps, j));
+                if (depjob == (job_id_t) -1 && PyErr_Occurred()) {
+                    goto cleanup;
+                }
+                if (depjob != JOB_ID_INVALID) {
+                    depvals[ndeps++] = depjob;
+                    depcount[nvalid]++;
+                }
+            }
+        }
+        results[i] = JOB_SUBMIT_SUCCESS;
+        nvalid++;
+    }
+    (void) job_context_submit_jobs(self_->state, jobdesc, (size_t) nvalid, depvals, depcount, (int) submit_type, jobrslt);
+
+    /* Merge the per-job results back into submission order. */
+    for (i = 0, j = 0; i < njobs; ++i) {
+        if (results[i] == JOB_SUBMIT_SUCCESS) {
+            results[i] = jobrslt[j++];
+        }
+        if (results[i] != JOB_SUBMIT_SUCCESS) {
+            nfail++;
+        }
+    }
+    if (outbuf != NULL) {
+        for (i = 0; i < njobs; ++i) {
+            outbuf[i] = (int8_t) results[i];
+        } retval = PyLong_FromSsize_t(nfail);
+    } else if (nfail == 0) {
+        retval = PyLong_FromLong((long) JOB_SUBMIT_SUCCESS);
+    } else if ((retval = PyList_New(njobs)) != NULL) {
+        for (i = 0; i < njobs; ++i) {
+            PyList_SET_ITEM(retval, i, PyLong_FromLong((long) results[i]));
+        }
+    }
+
+cleanup:
+    if (storage != (uint8_t*) scratch) {
+        PyMem_Free(storage);
+    }
+    Py_XDECREF(depseq);
+    Py_XDECREF(jobseq);
+    return retval;
+}
+
+static PyObject*
+PyMoxie_Submit_Python_Jobs
+(
+    PyObject * Py_UNUSED(self),
+    PyObject *           args ,
+    PyObject *         kwargs
+)
+{
+    PyMoxie_InternalJobContext *self_ = NULL;
+    PyMoxie_InternalJobQueue   *queue = NULL;
+    PyObject                 *joblist = NULL;
+    PyObject                 *deplist = NULL;
+    long                  submit_type = JOB_SUBMIT_RUN;
+    static char const       *kwlist[] ={"context","jobids","queue","depends","submit_type",NULL};
+
+    if (PyArg_ParseTupleAndKeywords(args, kwargs, "O!OOOl:submit_python_jobs", (char**) kwlist, &PyMoxie_InternalJobContextType, &self_, &joblist, &queue, &deplist, &submit_type) == 0) {
+        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTupleAndKeywords(context,jobids,queue,depends,submit_type) failed in PyMoxie_Submit_Python_Jobs.\n");
+        return NULL;
+    }
+    return python_jobs_submit(self_, queue, joblist, deplist, submit_type, NULL, 0);
+}
+
+/**
+ * Determine whether the batch-relative dependency indices of a submit_python_batch spec list form a cycle.
+ * The search is an iterative depth-first traversal; a dependency on a job that is still on the traversal stack closes a cycle.
+ * Every dependency index must have been validated to lie in [0, njobs) before calling this function.
+ * @param specseq The PySequence_Fast of (callable, parent, kwargs, submit_type, dependencies) tuples.
+ * @param njobs The number of entries in specseq.
+ * @param cursor Scratch storage for njobs values, used to store the next dependency to visit for each job.
+ * @param color Scratch storage for njobs values, used to store the traversal state of each job.
+ * @param stack Scratch storage for njobs values, used as the traversal stack.
+ * @return Non-zero if the dependencies form a cycle, or zero if the batch can be ordered.
+ */
+static int
+python_batch_has_cycle
+(
+    PyObject    *specseq,
+    Py_ssize_t     njobs,
+    size_t       *cursor,
+    int           *color,
+    Py_ssize_t    *stack
+)
+{
+    Py_ssize_t root, top, node, dep;
+    PyObject  *deps;
+
+    for (root = 0; root < njobs; ++root) {
+        color[root] = 0; /* Not yet visited */
+    }
+    for (root = 0; root < njobs; ++root) {
+        if (color[root] != 0) {
+            continue;
+        }
+        color [root] = 1; /* On the traversal stack */
+        cursor[root] = 0;
+        stack [0]    = root;
+        top          = 1;
+        while (top > 0) {
+            node = stack[top - 1];
+            deps = PyTuple_GET_ITEM(PySequence_Fast_GET_ITEM(specseq, node), 4);
+            if (deps != Py_None && (Py_ssize_t) cursor[node] < PyList_GET_SIZE(deps)) {
+                dep = PyLong_AsSsize_t(PyList_GET_ITEM(deps, (Py_ssize_t) cursor[node]++));
+                if (color[dep] == 1) {
+                    return 1;
+                }
+                if (color[dep] == 0) {
+                    color [dep] = 1;
+                    cursor[dep] = 0;
+                    stack[top++] = dep;
+                }
+            } else {
+                color[node] = 2; /* All dependencies visited */
+                top--;
+            }
+        }
+    } return 0;
+}
+
+static PyObject*
+PyMoxie_Submit_Python_Batch
 (
     PyObject * Py_UNUSED(self),
     PyObject *           args ,
@@ -1395,150 +2760,243 @@ PyMoxie_Create_Python_Job
 )
 {
     PyMoxie_InternalJobContext *self_ = NULL;
-    PyMoxie_PythonJobState   *jobdata = NULL;
-    job_descriptor_t         *jobdesc = NULL;
-    PyObject               *id_to_ctx = NULL;
-    PyObject                *callable = NULL;
-    PyObject                *callargs = NULL;
-    PyObject              *callkwargs = NULL;
-    unsigned long           parent_id = JOB_ID_INVALID;
-    static char const       *kwlist[] ={"context","id_to_ctx","parent","callable","args","kwargs",NULL};
-
-    if (PyArg_ParseTupleAndKeywords(args, kwargs, "O!OkOOO:create_python_job", (char**) kwlist, &PyMoxie_InternalJobContextType, &self_, &id_to_ctx, &parent_id, &callable, &callargs, &callkwargs) == 0) {
-        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTupleAndKeywords(context,id_to_ctx,parent,callable,args,kwargs) failed in PyMoxie_Create_Python_Job.\n");
-        return NULL;
-    }
-#ifndef NDEBUG
-    if (self_->state == NULL) {
-        PyMoxie_LogErrorN("_moxie_core: InternalJobContext::state field is NULL.\n");
+    PyMoxie_InternalJobQueue   *queue = NULL;
+    PyObject                *speclist = NULL;
+    PyObject                 *specseq = NULL;
+    PyObject                  *noargs = NULL;
+    PyObject                  *jobids = NULL;
+    PyObject                  *rslobj = NULL;
+    PyObject                  *retval = NULL;
+    job_descriptor_t        **jobdesc = NULL;
+    job_id_t                 *depvals = NULL;
+    size_t                  *depcount = NULL;
+    Py_ssize_t               *visited = NULL;
+    int                      *results = NULL;
+    int                        *types = NULL;
+    uint8_t                  *storage = NULL;
+    uint64_t                  scratch[PYMOXIE_SUBMIT_SCRATCH_BYTES / sizeof(uint64_t)];
+    size_t                     nbytes = 0;
+    struct job_queue_t        *target = NULL;
+    Py_ssize_t                 njobs  = 0;
+    Py_ssize_t                 ndeps  = 0;
+    Py_ssize_t                 nmade  = 0;
+    Py_ssize_t                 nfail  = 0;
+    Py_ssize_t                 depofs = 0;
+    Py_ssize_t                i, j, k;
+    static char const       *kwlist[] ={"context","specs","queue",NULL};
+
+    if (PyArg_ParseTupleAndKeywords(args, kwargs, "O!O|O:submit_python_batch", (char**) kwlist, &PyMoxie_InternalJobContextType, &self_, &speclist, &queue) == 0) {
+        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTupleAndKeywords(context,specs,queue) failed in PyMoxie_Submit_Python_Batch.\n");
+        return NULL;
+    }
+    if (self_->state == NULL || self_->sched == NULL || self_->sched->state == NULL) {
+        PyMoxie_LogErrorN("_moxie_core: InternalJobContext passed to submit_python_batch has NULL state. Was job context released previously?\n");
         PyErr_SetString(PyExc_ValueError, "InternalJobContext state field is NULL");
         return NULL;
     }
-    if (PyCallable_Check(callable) == 0) {
-        PyMoxie_LogErrorN("_moxie_core: create_python_job received non-callable callable argument.\n");
-        PyErr_SetString(PyExc_TypeError, "Value specified for callable argument should be a callable");
-        return NULL;
+    if (queue != NULL && queue != (PyMoxie_InternalJobQueue*) Py_None) {
+        if (Py_TYPE(queue) != &PyMoxie_InternalJobQueueType) {
+            PyMoxie_LogErrorN("_moxie_core: Expected InternalJobQueue instance for queue argument in submit_python_batch.\n");
+            PyErr_SetString(PyExc_TypeError, "Expected InternalJobQueue instance for queue argument");
+            return NULL;
+        } target = queue->state;
     }
-#endif
-    if ((jobdesc = job_context_create_job(self_->state, sizeof(PyMoxie_PythonJobState), mem_align_of(PyMoxie_PythonJobState))) == NULL) {
-        PyMoxie_LogErrorV("_moxie_core: Failed to allocate %zu bytes with alignment %zu for Python job state.\n", sizeof(PyMoxie_PythonJobState), mem_align_of(PyMoxie_PythonJobState));
-        PyErr_SetString(PyExc_RuntimeError, "Failed to acquired storage for Python job");
+    if ((specseq = PySequence_Fast(speclist, "Expected Sequence[tuple] for specs argument")) == NULL) {
         return NULL;
     }
-    jobdesc->jobmain   = python_job_main;
-    jobdesc->user1     =(uintptr_t) 0;
-    jobdesc->user2     =(uintptr_t) 0;
-    jobdesc->parent    = parent_id;
-    jobdata = (PyMoxie_PythonJobState*) jobdesc->data;
-    jobdata->id_to_ctx = PyMoxie_Retain(id_to_ctx);
-    jobdata->callable  = PyMoxie_Retain(callable);
-    jobdata->args      = PyMoxie_Retain(callargs);
-    jobdata->kwargs    = PyMoxie_Retain(callkwargs);
-    return PyLong_FromUnsignedLong((unsigned long) jobdesc->id);
+    njobs = PySequence_Fast_GET_SIZE(specseq);
+
+    /* Validate every spec before any job is created, so that a malformed batch has no side effects. */
+    for (i = 0; i < njobs; ++i) {
+        PyObject *spec = PySequence_Fast_GET_ITEM(specseq, i);
+        PyObject *deps = NULL;
+        long      type = JOB_SUBMIT_RUN;
+        if (PyTuple_Check(spec) == 0 || PyTuple_GET_SIZE(spec) != 5) {
+            PyErr_SetString(PyExc_TypeError, "Each entry of the specs argument must be a tuple (callable, parent, kwargs, submit_type, dependencies)");
+            goto cleanup;
+        }
+        if (PyCallable_Check(PyTuple_GET_ITEM(spec, 0)) == 0) {
+            PyErr_SetString(PyExc_TypeError, "Value specified for callable should be a callable");
+            goto cleanup;
+        }
+        if (PyTuple_GET_ITEM(spec, 2) != Py_None && PyDict_Check(PyTuple_GET_ITEM(spec, 2)) == 0) {
+            PyErr_SetString(PyExc_TypeError, "Expected dict or None for kwargs");
+            goto cleanup;
+        }
+        if ((type = PyLong_AsLong(PyTuple_GET_ITEM(spec, 3))) == -1 && PyErr_Occurred()) {
+            goto cleanup;
+        }
+        if (type != JOB_SUBMIT_RUN && type != JOB_SUBMIT_CANCEL) {
+            PyMoxie_LogErrorV("_moxie_core: Invalid submit_type %ld supplied to submit_python_batch.\n", type);
+            PyErr_SetString(PyExc_ValueError, "Invalid submit_type supplied to submit_python_batch");
+            goto cleanup;
+        }
+        if ((deps = PyTuple_GET_ITEM(spec, 4)) != Py_None) {
+            if (PyList_Check(deps) == 0) {
+                PyErr_SetString(PyExc_TypeError, "Expected List[int] or None for dependencies");
+                goto cleanup;
+            }
+            for (j = 0; j < PyList_GET_SIZE(deps); ++j) {
+                Py_ssize_t index = PyLong_AsSsize_t(PyList_GET_ITEM(deps, j));
+                if (index == -1 && PyErr_Occurred()) {
+                    goto cleanup;
+                }
+                if (index < 0 || index >= njobs || index == i) {
+                    PyErr_SetString(PyExc_ValueError, "Each dependency must be the index of another job in the batch");
+                    goto cleanup;
+                }
+            } ndeps += PyList_GET_SIZE(deps);
+        }
+    }
+
+    /* Sub-allocate all scratch arrays from a single block, which for the common small batch lives on the stack. */
+    nbytes = (size_t) njobs * (sizeof(job_descriptor_t*) + sizeof(size_t) + sizeof(Py_ssize_t) + 2 * sizeof(int)) + (size_t) ndeps * sizeof(job_id_t) + 1;
+    if (nbytes <= sizeof(scratch)) {
+        storage = (uint8_t*) scratch;
+    } else if ((storage = (uint8_t*) PyMem_Malloc(nbytes)) == NULL) {
+        PyErr_NoMemory();
+        goto cleanup;
+    }
+    jobdesc  = (job_descriptor_t**) storage;
+    depcount = (size_t    *)(jobdesc  + njobs);
+    visited  = (Py_ssize_t*)(depcount + njobs);
+    depvals  = (job_id_t  *)(visited  + njobs);
+    results  = (int       *)(depvals  + ndeps);
+    types    = (int       *)(results  + njobs);
+
+    /* A dependency cycle would leave every job in it waiting forever; reject the batch while it still has no side effects.
+     * depcount and results are reused as traversal scratch, and are overwritten below. */
+    if (ndeps != 0 && python_batch_has_cycle(specseq, njobs, depcount, results, visited)) {
+        PyMoxie_LogErrorN("_moxie_core: Dependencies supplied to submit_python_batch form a cycle.\n");
+        PyErr_SetString(PyExc_ValueError, "The dependencies in the batch form a cycle");
+        goto cleanup;
+    }
+    if ((noargs = PyTuple_New(0)) == NULL) {
+        goto cleanup;
+    }
+
+    /* Create all of the jobs. Each job gets its own kwargs dict, since python_job_main adds the job and jobctx entries to it. */
+    for (nmade = 0; nmade < njobs; ++nmade) {
+        PyObject *spec   = PySequence_Fast_GET_ITEM(specseq, nmade);
+        PyObject *jobkw  = Py_None;
+        job_id_t  parent = (job_id_t) PyLong_AsUnsignedLong(PyTuple_GET_ITEM(spec, 1));
+        if (parent == (job_id_t) -1 && PyErr_Occurred()) {
+            goto cancel_created;
+        }
+        if (PyTuple_GET_ITEM(spec, 2) != Py_None) {
+            if ((jobkw = PyDict_Copy(PyTuple_GET_ITEM(spec, 2))) == NULL) {
+                goto cancel_created;
+            }
+        } else {
+            Py_INCREF(jobkw);
+        }
+        jobdesc[nmade] = python_job_alloc(self_, parent, PyTuple_GET_ITEM(spec, 0), noargs, jobkw);
+        Py_DECREF(jobkw);
+        if (jobdesc[nmade] == NULL) {
+            goto cancel_created;
+        }
+        jobdesc[nmade]->target = target;
+        types[nmade] = (int) PyLong_AsLong(PyTuple_GET_ITEM(spec, 3));
+    }
+
+    /* Translate batch-relative dependency indices into job identifiers. */
+    for (i = 0, k = 0; i < njobs; ++i) {
+        PyObject *deps = PyTuple_GET_ITEM(PySequence_Fast_GET_ITEM(specseq, i), 4);
+        depcount[i] = 0;
+        if (deps != Py_None) {
+            for (j = 0; j < PyList_GET_SIZE(deps); ++j) {
+                depvals[k++] = jobdesc[PyLong_AsSsize_t(PyList_GET_ITEM(deps, j))]->id;
+                depcount[i]++;
+            }
+        }
+    }
+
+    /* Submit runs of jobs that share a submit type, preserving batch order. */
+    for (i = 0; i < njobs; i = j) {
+        Py_ssize_t ndep = 0;
+        for (j = i; j < njobs && types[j] == types[i]; ++j) {
+            ndep += (Py_ssize_t) depcount[j];
+        }
+        (void) job_context_submit_jobs(self_->state, &jobdesc[i], (size_t)(j - i), &depvals[depofs], &depcount[i], types[i], &results[i]);
+        depofs += ndep;
+    }
+    for (i = 0; i < njobs; ++i) {
+        if (results[i] != JOB_SUBMIT_SUCCESS) {
+            nfail++;
+        }
+    }
+
+    if ((jobids = PyList_New(njobs)) == NULL) {
+        goto cleanup;
+    }
+    for (i = 0; i < njobs; ++i) {
+        PyList_SET_ITEM(jobids, i, PyLong_FromUnsignedLong((unsigned long) jobdesc[i]->id));
+    }
+    if (nfail == 0) {
+        rslobj = PyLong_FromLong((long) JOB_SUBMIT_SUCCESS);
+    } else if ((rslobj = PyList_New(njobs)) != NULL) {
+        for (i = 0; i < njobs; ++i) {
+            PyList_SET_ITEM(rslobj, i, PyLong_FromLong((long) results[i]));
+        }
+    }
+    if (rslobj != NULL) {
+        retval = PyTuple_Pack(2, jobids, rslobj);
+    }
+    goto cleanup;
+
+cancel_created:
+    /* Release the jobs created before the failure; they never run, but their Python references are dropped on completion. */
+    if (nmade != 0) {
+        (void) job_context_submit_jobs(self_->state, jobdesc, (size_t) nmade, NULL, NULL, JOB_SUBMIT_CANCEL, NULL);
+    }
+
+cleanup:
+    if (storage != (uint8_t*) scratch) {
+        PyMem_Free(storage);
+    }
+    Py_XDECREF(rslobj);
+    Py_XDECREF(jobids);
+    Py_XDECREF(noargs);
+    Py_XDECREF(specseq);
+    return retval;
 }
 
 static PyObject*
-PyMoxie_Submit_Python_Job
+PyMoxie_Submit_Python_Jobs_Buf
 (
     PyObject * Py_UNUSED(self),
     PyObject *           args ,
     PyObject *         kwargs
 )
 {
+    Py_buffer                    view;
     PyMoxie_InternalJobContext *self_ = NULL;
     PyMoxie_InternalJobQueue   *queue = NULL;
-    job_descriptor_t         *jobdesc = NULL;
+    PyObject                 *joblist = NULL;
     PyObject                 *deplist = NULL;
+    PyObject                  *outobj = NULL;
+    PyObject                  *retval = NULL;
     long                  submit_type = JOB_SUBMIT_RUN;
-    job_id_t                   job_id = JOB_ID_INVALID;
-    job_id_t                   depjob = JOB_ID_INVALID;
-    job_id_t                  depvals[16];
-    Py_ssize_t const          MAXDEPS = mem_count_of(depvals);
-    Py_ssize_t                numdeps = 0;
-    Py_ssize_t                      i = 0;
-    int                 submit_result = JOB_SUBMIT_SUCCESS;
-    static char const       *kwlist[] ={"context","jobid","queue","depends","submit_type",NULL};
+    static char const       *kwlist[] ={"context","jobids","queue","depends","submit_type","out",NULL};
 
-    if (PyArg_ParseTupleAndKeywords(args, kwargs, "O!kOOl:submit_python_job", (char**) kwlist, &PyMoxie_InternalJobContextType, &self_, &job_id, &queue, &deplist, &submit_type) == 0) {
-        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTupleAndKeywords(context,jobid,queue,depends,submit_type) failed in PyMoxie_Submit_Python_Job.\n");
-        return NULL;
-    }
-#ifndef NDEBUG
-    if (self_->state == NULL) {
-        PyMoxie_LogErrorN("_moxie_core: InternalJobContext::state field is NULL. Was job context released previously?\n");
-        PyErr_SetString(PyExc_ValueError, "InternalJobContext state field is NULL");
-        return NULL;
-    }
-    if (self_->sched == NULL) {
-        PyMoxie_LogErrorN("_moxie_core: InternalJobContext::sched field is NULL.\n");
-        PyErr_SetString(PyExc_ValueError, "InternalJobContext sched field is NULL");
-        return NULL;
-    }
-    if (self_->queue == NULL) {
-        PyMoxie_LogErrorN("_moxie_core: InternalJobContext::queue field is NULL.\n");
-        PyErr_SetString(PyExc_ValueError, "InternalJobContext queue field is NULL");
+    if (PyArg_ParseTupleAndKeywords(args, kwargs, "O!OOOlO:submit_python_jobs_buf", (char**) kwlist, &PyMoxie_InternalJobContextType, &self_, &joblist, &queue, &deplist, &submit_type, &outobj) == 0) {
+        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTupleAndKeywords(context,jobids,queue,depends,submit_type,out) failed in PyMoxie_Submit_Python_Jobs_Buf.\n");
         return NULL;
     }
-    if (self_->sched->state == NULL) {
-        PyMoxie_LogErrorN("_moxie_core: InternalJobContext::sched field has NULL state field.\n");
-        PyErr_SetString(PyExc_ValueError, "InternalJobContext sched field has NULL state field");
+    /* The results are written as int8 (array.array('b'), numpy.int8) so no per-job Python objects are created */
+    if (PyObject_GetBuffer(outobj, &view, PyBUF_C_CONTIGUOUS | PyBUF_FORMAT | PyBUF_WRITABLE) != 0) {
+        PyMoxie_LogErrorN("_moxie_core: The out argument to submit_python_jobs_buf does not expose a writable contiguous buffer.\n");
         return NULL;
     }
-    if (submit_type != JOB_SUBMIT_RUN && submit_type != JOB_SUBMIT_CANCEL) {
-        PyMoxie_LogErrorV("_moxie_core: Invalid submit_type %u supplied to submit_python_job.\n", submit_type);
-        PyErr_SetString(PyExc_ValueError, "Invalid submit_type supplied to submit_python_job");
+    if (view.ndim != 1 || view.itemsize != sizeof(int8_t) || view.format == NULL || view.format[0] != 'b' || view.format[1] != '\0') {
+        PyMoxie_LogErrorN("_moxie_core: The out argument to submit_python_jobs_buf must be a 1-D buffer of int8.\n");
+        PyErr_SetString(PyExc_TypeError, "The out argument must be a 1-D buffer of int8");
+        PyBuffer_Release(&view);
         return NULL;
     }
-#endif
-    if ((jobdesc = job_scheduler_resolve_job_id(self_->sched->state, job_id)) == NULL) {
-        return PyLong_FromLong((long) JOB_SUBMIT_INVALID_JOB);
-    }
-    if (queue == NULL || queue == (PyMoxie_InternalJobQueue*) Py_None) {
-        /* Use the default queue for the job context. */
-        jobdesc->target = NULL;
-    } else {
-#ifndef NDEBUG
-        if (Py_TYPE(queue) != &PyMoxie_InternalJobQueueType) {
-            PyMoxie_LogErrorN("_moxie_core: Expected InternalJobQueue instance for queue argument in submit_python_job.\n");
-            PyErr_SetString(PyExc_TypeError, "Expected InternalJobQueue instance for queue argument");
-            return NULL;
-        }
-#endif
-        /* Submit the job to the supplied queue. */
-        jobdesc->target = queue->state;
-    }
-    if (deplist != NULL && deplist != Py_None) {
-#ifndef NDEBUG
-        if (PyList_Check(deplist) == 0) {
-            PyMoxie_LogErrorN("_moxie_core: Expected List[int] for depends argument.\n");
-            PyErr_SetString(PyExc_TypeError, "Expected List[int] for depends argument");
-            return NULL;
-        }
-#endif
-        if ((numdeps = PyList_Size(deplist)) > MAXDEPS) {
-            PyMoxie_LogErrorV("_moxie_core: Rejecting job 0x%08X; dependency count %zu exceeds maximum %zu.\n", job_id, (size_t) numdeps, (size_t) MAXDEPS);
-            PyErr_SetString(PyExc_RuntimeError, "Rejecting job submission; job has too many dependencies");
-            return NULL;
-        }
-        for (i = 0; i < numdeps; ++i) {
-            PyObject *val = PyList_GetItem(deplist, i);
-#ifndef NDEBUG
-            if (PyLong_Check(val) == 0) {
-                PyMoxie_LogErrorV("_moxie_core: Job 0x%08X dependency %zu does not have expected int type.\n", job_id, (size_t) i);
-                PyErr_SetString(PyExc_TypeError, "Job dependency list contains non-int values");
-                return NULL;
-            }
-#endif
-            if ((depjob = (job_id_t) PyLong_AsUnsignedLong(val)) != JOB_ID_INVALID) {
-                depvals[i] = depjob;
-            } else {
-                PyMoxie_LogErrorV("_moxie_core: Job 0x%08X dependency %zu is JOB_ID_INVALID; ignoring.\n", job_id, (size_t) i);
-                continue;
-            }
-        }
-    }
-    submit_result = job_context_submit_job(self_->state, jobdesc, depvals, (size_t) numdeps, (int) submit_type);
-    return PyLong_FromLong((long) submit_result);
+    retval = python_jobs_submit(self_, queue, joblist, deplist, submit_type, (int8_t*) view.buf, view.len);
+    PyBuffer_Release(&view);
+    return retval;
 }
 
 static PyObject*
@@ -1554,7 +3012,7 @@ PyMoxie_Cancel_Job
     int                     job_state = JOB_STATE_UNINITIALIZED;
     static char const       *kwlist[] ={"context","jobid",NULL};
 
-    if (PyArg_ParseTupleAndKeywords(args, kwargs, "O!k:cancel_job", (char**) kwlist, &PyMoxie_InternalJobContextType, &self_, &job_id) == 0) {
+    if (PyArg_ParseTupleAndKeywords(args, kwargs, "O!I:cancel_job", (char**) kwlist, &PyMoxie_InternalJobContextType, &self_, &job_id) == 0) {
         PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTupleAndKeywords(context,jobid) failed in PyMoxie_Cancel_Job.\n");
         return NULL;
     }
@@ -1580,7 +3038,7 @@ PyMoxie_Complete_Job
     job_id_t                   job_id = JOB_ID_INVALID;
     static char const       *kwlist[] ={"context","jobid",NULL};
 
-    if (PyArg_ParseTupleAndKeywords(args, kwargs, "O!k:cancel_job", (char**) kwlist, &PyMoxie_InternalJobContextType, &self_, &job_id) == 0) {
+    if (PyArg_ParseTupleAndKeywords(args, kwargs, "O!I:complete_job", (char**) kwlist, &PyMoxie_InternalJobContextType, &self_, &job_id) == 0) {
         PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTupleAndKeywords(context,jobid) failed in PyMoxie_Complete_Job.\n");
         return NULL;
     }
@@ -1622,11 +3080,12 @@ PyMoxie_Wait_For_Job
 {
     PyMoxie_InternalJobContext *self_ = NULL;
     job_id_t                   job_id = JOB_ID_INVALID;
+    unsigned int           spin_count = JOB_WAIT_SPIN_COUNT;
     int                   wait_result = 0;
-    static char const       *kwlist[] ={"context","jobid",NULL};
+    static char const       *kwlist[] ={"context","jobid","spin_count",NULL};
 
-    if (PyArg_ParseTupleAndKeywords(args, kwargs, "O!k:cancel_job", (char**) kwlist, &PyMoxie_InternalJobContextType, &self_, &job_id) == 0) {
-        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTupleAndKeywords(context,jobid) failed in PyMoxie_Wait_For_Job.\n");
+    if (PyArg_ParseTupleAndKeywords(args, kwargs, "O!I|I:wait_for_job", (char**) kwlist, &PyMoxie_InternalJobContextType, &self_, &job_id, &spin_count) == 0) {
+        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTupleAndKeywords(context,jobid,spin_count) failed in PyMoxie_Wait_For_Job.\n");
         return NULL;
     }
     if (self_->state == NULL) {
@@ -1634,9 +3093,13 @@ PyMoxie_Wait_For_Job
         PyErr_SetString(PyExc_ValueError, "InternalJobContext state field is NULL");
         return NULL;
     }
+    self_->state->user1 = 0;
     Py_BEGIN_ALLOW_THREADS
-        wait_result = job_context_wait_job(self_->state, job_id);
+        wait_result = job_context_wait_job(self_->state, job_id, (uint32_t) spin_count);
     Py_END_ALLOW_THREADS
+    if (PyErr_Occurred()) {
+        return NULL; /* A job executed while waiting raised an exception */
+    }
     return PyLong_FromLong((long) wait_result);
 }
 
@@ -1668,6 +3131,43 @@ PyMoxie_Run_Next_Job
             job_context_complete_job(self_->state, jobdesc);
         }
     Py_END_ALLOW_THREADS
+    if (PyErr_Occurred()) {
+        return NULL; /* The job raised an exception */
+    }
+    return PyLong_FromUnsignedLong((unsigned long) job_id);
+}
+
+static PyObject*
+PyMoxie_Try_Run_Next_Job
+(
+    PyObject * Py_UNUSED(self),
+    PyObject *           args
+)
+{
+    PyMoxie_InternalJobContext *self_ = NULL;
+    job_descriptor_t         *jobdesc = NULL;
+    job_id_t                   job_id = JOB_ID_INVALID;
+
+    if (PyArg_ParseTuple(args, "O!:try_run_next_job", &PyMoxie_InternalJobContextType, &self_) == 0) {
+        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTuple failed in PyMoxie_Try_Run_Next_Job.\n");
+        return NULL;
+    }
+    if (self_->state == NULL) {
+        PyMoxie_LogErrorN("_moxie_core: PyMoxie_InternalJobContext::state field is NULL.\n");
+        PyErr_SetString(PyExc_ValueError, "InternalJobContext state field is NULL");
+        return NULL;
+    }
+
+    Py_BEGIN_ALLOW_THREADS
+        if ((jobdesc = job_context_poll_ready_job(self_->state)) != NULL) {
+            job_id        = jobdesc->id;
+            jobdesc->exit = jobdesc->jobmain(self_->state, jobdesc, JOB_CALL_TYPE_EXECUTE);
+            job_context_complete_job(self_->state, jobdesc);
+        }
+    Py_END_ALLOW_THREADS
+    if (PyErr_Occurred()) {
+        return NULL; /* The job raised an exception */
+    }
     return PyLong_FromUnsignedLong((unsigned long) job_id);
 }
 
@@ -1698,9 +3198,145 @@ PyMoxie_Run_Next_Job_No_Completion
             jobdesc->exit = jobdesc->jobmain(self_->state, jobdesc, JOB_CALL_TYPE_EXECUTE);
         }
     Py_END_ALLOW_THREADS
+    if (PyErr_Occurred()) {
+        return NULL; /* The job raised an exception */
+    }
     return PyLong_FromUnsignedLong((unsigned long) job_id);
 }
 
+static PyObject*
+PyMoxie_Run_Worker_Loop
+(
+    PyObject * Py_UNUSED(self),
+    PyObject *           args
+)
+{
+    PyMoxie_InternalJobContext *self_ = NULL;
+    PyObject                 *handler = NULL;
+    PyObject                  *result = NULL;
+    job_descriptor_t         *jobdesc = NULL;
+    uint32_t                   signal = JOB_QUEUE_SIGNAL_CLEAR;
+    int                       running = 1;
+
+    if (PyArg_ParseTuple(args, "O!O:run_worker_loop", &PyMoxie_InternalJobContextType, &self_, &handler) == 0) {
+        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTuple failed in PyMoxie_Run_Worker_Loop.\n");
+        return NULL;
+    }
+    if (self_->state == NULL) {
+        PyMoxie_LogErrorN("_moxie_core: PyMoxie_InternalJobContext::state field is NULL.\n");
+        PyErr_SetString(PyExc_ValueError, "InternalJobContext state field is NULL");
+        return NULL;
+    }
+    if (self_->queue == NULL || self_->queue->state == NULL) {
+        PyMoxie_LogErrorN("_moxie_core: PyMoxie_InternalJobContext::queue field is NULL.\n");
+        PyErr_SetString(PyExc_ValueError, "InternalJobContext queue field is NULL");
+        return NULL;
+    }
+    if (PyCallable_Check(handler) == 0) {
+        PyMoxie_LogErrorN("_moxie_core: run_worker_loop received non-callable handler argument.\n");
+        PyErr_SetString(PyExc_TypeError, "Value specified for handler argument should be a callable");
+        return NULL;
+    }
+
+    /* Stay in native code, without the GIL, between jobs; python_job_main takes the GIL only while the job's callable runs.
+     * The GIL is re-acquired here only to handle a queue signal or to propagate an exception raised by a job. */
+    while (running) {
+        self_->state->user1 = 0;
+        Py_BEGIN_ALLOW_THREADS
+            while ((jobdesc = job_context_wait_ready_job(self_->state)) != NULL) {
+                jobdesc->exit = jobdesc->jobmain(self_->state, jobdesc, JOB_CALL_TYPE_EXECUTE);
+                job_context_complete_job(self_->state, jobdesc);
+                if (self_->state->user1 == PYMOXIE_CONTEXT_JOB_RAISED) {
+                    break;
+                }
+            }
+        Py_END_ALLOW_THREADS
+        if (PyErr_Occurred()) {
+            return NULL; /* The job raised an exception */
+        }
+        if (jobdesc == NULL) {
+            signal = job_queue_check_signal(self_->queue->state);
+            if ((result = PyObject_CallFunction(handler, "k", (unsigned long) signal)) == NULL) {
+                return NULL;
+            }
+            running = PyObject_IsTrue(result);
+            Py_DECREF(result); result = NULL;
+            if (running < 0) {
+                return NULL;
+            }
+        }
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject*
+PyMoxie_Run_Default_Worker
+(
+    PyObject * Py_UNUSED(self),
+    PyObject *           args
+)
+{
+    PyMoxie_InternalJobContext *self_ = NULL;
+    job_descriptor_t         *jobdesc = NULL;
+    uint32_t                   signal = JOB_QUEUE_SIGNAL_CLEAR;
+
+    if (PyArg_ParseTuple(args, "O!:run_default_worker", &PyMoxie_InternalJobContextType, &self_) == 0) {
+        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTuple failed in PyMoxie_Run_Default_Worker.\n");
+        return NULL;
+    }
+    if (self_->state == NULL) {
+        PyMoxie_LogErrorN("_moxie_core: PyMoxie_InternalJobContext::state field is NULL.\n");
+        PyErr_SetString(PyExc_ValueError, "InternalJobContext state field is NULL");
+        return NULL;
+    }
+    if (self_->queue == NULL || self_->queue->state == NULL) {
+        PyMoxie_LogErrorN("_moxie_core: PyMoxie_InternalJobContext::queue field is NULL.\n");
+        PyErr_SetString(PyExc_ValueError, "InternalJobContext queue field is NULL");
+        return NULL;
+    }
+
+    /* Signals are handled inline and the GIL stays released for the life of the loop - python_job_main takes it only while the job's callable runs.
+     * The call returns on termination or when a job raises an exception. */
+    while (signal != JOB_QUEUE_SIGNAL_TERMINATE) {
+        self_->state->user1 = 0;
+        Py_BEGIN_ALLOW_THREADS
+            while (signal != JOB_QUEUE_SIGNAL_TERMINATE) {
+                if ((jobdesc = job_context_wait_ready_job(self_->state)) != NULL) {
+                    jobdesc->exit = jobdesc->jobmain(self_->state, jobdesc, JOB_CALL_TYPE_EXECUTE);
+                    job_context_complete_job(self_->state, jobdesc);
+                    if (self_->state->user1 == PYMOXIE_CONTEXT_JOB_RAISED) {
+                        break; /* Check for the exception with the GIL held */
+                    }
+                } else {
+                    signal = job_queue_check_signal(self_->queue->state);
+                }
+            }
+        Py_END_ALLOW_THREADS
+        if (PyErr_Occurred()) {
+            return NULL; /* The job raised an exception */
+        }
+    }
+    Py_RETURN_NONE;
+}
+
+static PyObject*
+PyMoxie_Set_Thread_Affinity
+(
+    PyObject * Py_UNUSED(self),
+    PyObject *           args
+)
+{
+    unsigned int cpu_index = 0;
+    int             result = 0;
+
+    if (PyArg_ParseTuple(args, "I:set_thread_affinity", &cpu_index) == 0) {
+        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTuple(cpu_index) failed in PyMoxie_Set_Thread_Affinity.\n");
+        return NULL;
+    }
+    result = thread_set_affinity((uint32_t) cpu_index);
+    return PyBool_FromLong((long) result);
+}
+
 static PyObject*
 PyMoxie_Create_Job_Scheduler
 (
@@ -1711,13 +3347,19 @@ PyMoxie_Create_Job_Scheduler
 {
     PyMoxie_InternalJobScheduler *self_ = NULL;
     uint32_t                  ncontexts = 1;
-    static char const         *kwlist[] ={"context_count",NULL};
+    uint32_t                     policy = JOB_QUEUE_POLICY_SHARED;
+    static char const         *kwlist[] ={"context_count","queue_policy",NULL};
 
-    if (PyArg_ParseTupleAndKeywords(args, kwargs, "|I:create_job_scheduler", (char**) kwlist, &ncontexts) == 0) {
-        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTuple(context_count) failed in PyMoxie_Create_Job_Scheduler.\n");
+    if (PyArg_ParseTupleAndKeywords(args, kwargs, "|II:create_job_scheduler", (char**) kwlist, &ncontexts, &policy) == 0) {
+        PyMoxie_LogErrorN("_moxie_core: PyArg_ParseTuple(context_count,queue_policy) failed in PyMoxie_Create_Job_Scheduler.\n");
         return NULL;
     }
-    if ((self_ = PyMoxie_InternalJobScheduler_Create(ncontexts)) == NULL) {
+    if (policy != JOB_QUEUE_POLICY_SHARED && policy != JOB_QUEUE_POLICY_STEALING) {
+        PyMoxie_LogErrorV("_moxie_core: Invalid queue_policy %u supplied to create_job_scheduler.\n", policy);
+        PyErr_SetString(PyExc_ValueError, "Invalid queue_policy supplied to create_job_scheduler");
+        return NULL;
+    }
+    if ((self_ = PyMoxie_InternalJobScheduler_Create(ncontexts, policy)) == NULL) {
         PyMoxie_LogErrorV("_moxie_core: Failed to allocate job scheduler with %u context(s).\n", ncontexts);
         return NULL;
     }
@@ -1860,7 +3502,8 @@ PyMoxie_MemoryAllocation_Create
     inst->readonly_bool    = readonly_bool;
     inst->base_address     = address;
     inst->byte_length      = length;
-    inst->tag              = arena->allocator.allocator_tag;
+    inst->tag              = arena != NULL ? arena->allocator.allocator_tag : 0;
+    inst->arena            = arena;
     return inst;
 
 cleanup_and_fail:
@@ -1916,7 +3559,7 @@ PyMoxie_InternalAllocator_Create
         goto cleanup_and_fail;
     }
     if (name != NULL) {
-        if ((name_str = PyUnicode_FromString(name)) == NULL) {
+        if ((name_str = PyUnicode_InternFromString(name)) == NULL) { /* Many allocators share a name */
             goto cleanup_and_fail;
         }
     } else {
@@ -1929,6 +3572,7 @@ PyMoxie_InternalAllocator_Create
     inst->allocator_tag_int  = tag_int;
     inst->page_size_int      = page_size_int;
     inst->growable_bool      = growable_bool;
+    inst->default_alignment  = alignment;
     mem_copy(&inst->allocator, &alloc, sizeof(mem_allocator_t));
     return inst;
 
@@ -2017,13 +3661,14 @@ cleanup_and_fail:
 PyMoxie_InternalJobScheduler*
 PyMoxie_InternalJobScheduler_Create
 (
-    uint32_t context_count
+    uint32_t context_count,
+    uint32_t  queue_policy
 )
 {
     PyMoxie_InternalJobScheduler *inst = NULL;
     struct job_scheduler_t      *state = NULL;
 
-    if ((state = job_scheduler_create((size_t) context_count)) == NULL) {
+    if ((state = job_scheduler_create((size_t) context_count, queue_policy)) == NULL) {
         PyMoxie_LogErrorN("_moxie_core: Failed to allocate job_scheduler_t in PyMoxie_InternalJobScheduler_Create.\n");
         PyErr_SetString(PyExc_MemoryError, "Failed to allocate a new job scheduler");
         goto cleanup_and_fail;
@@ -2033,11 +3678,17 @@ PyMoxie_InternalJobScheduler_Create
         PyErr_SetString(PyExc_MemoryError, "Failed to allocate a new InternalJobScheduler");
         goto cleanup_and_fail;
     }
+    if ((inst->id_to_ctx = PyDict_New()) == NULL || (inst->entries = PyList_New(0)) == NULL) {
+        PyMoxie_LogErrorN("_moxie_core: Failed to allocate the id_to_ctx or entries collection for a new InternalJobScheduler instance.\n");
+        goto cleanup_and_fail;
+    }
     inst->state = state;
     return inst;
 
 cleanup_and_fail:
     if (inst != NULL) {
+        Py_XDECREF(inst->entries);
+        Py_XDECREF(inst->id_to_ctx);
         PyMoxie_InternalJobSchedulerType.tp_free(inst);
     }
     if (state != NULL) {
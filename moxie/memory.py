@@ -1,14 +1,85 @@
 """
 Implements the high-level interface for memory management built on top of the low-level _moxie_core memory allocator.
 """
-from   typing import Optional
+import threading
+
+from   typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
 
 import moxie._moxie_core as _mc
 from   moxie._moxie_core import MemoryMarker
 from   moxie._moxie_core import MemoryAllocation
 
+try:
+    import numpy as _np # type: ignore[import-not-found]
+except ImportError:
+    _np = None
+
+
+DEFAULT_ALIGNMENT         : int   = 16              # The default alignment, in bytes, for memory returned from a `MemoryAllocator`.
+DEFAULT_GROWTH_FACTOR     : float = 1.5             # The default capacity of each chunk appended to a growable `MemoryAllocator`, relative to the previous chunk.
+DEFAULT_DECOMMIT_THRESHOLD: int   = 2 * 1024 * 1024 # The default minimum number of bytes released by a reset before physical pages are returned to the OS.
+
+_ACCESS_READ: int = _mc.MEM_ACCESS_FLAG_READ
+_ACCESS_RDWR: int = _mc.MEM_ACCESS_FLAG_RDWR
+_F_LOCAL    : int = _mc.MEM_ALLOCATION_FLAG_LOCAL
+_F_VIRT     : int = _mc.MEM_ALLOCATION_FLAG_VIRTUAL
+_F_HEAP     : int = _mc.MEM_ALLOCATION_FLAG_HEAP
+_F_GROW     : int = _mc.MEM_ALLOCATION_FLAG_GROWABLE
+_F_PREFAULT : int = _mc.MEM_ALLOCATION_FLAG_PREFAULT
+_create           = _mc.create_memory_allocator
+_allocate_default = _mc.allocate_memory_default
+_release          = _mc.release_allocation
+_stats            = _mc.get_allocator_stats
+_mark             = _mc.create_allocator_marker
+_reset_to         = _mc.reset_memory_allocator_to_marker
 
-DEFAULT_ALIGNMENT: int = 16 # The default alignment, in bytes, for memory returned from a `MemoryAllocator`.
+_tls = threading.local() # Per-thread state; `_tls.cache` holds the allocators returned by `get_shared_allocator`.
+
+_FLAG_TABLE = { # Allocation flags keyed by (virtual_memory, growable).
+    (False, False): _F_LOCAL | _F_HEAP,
+    (False, True ): _F_LOCAL | _F_HEAP | _F_GROW,
+    (True , False): _F_LOCAL | _F_VIRT,
+    (True , True ): _F_LOCAL | _F_VIRT | _F_GROW,
+}
+
+
+class AllocatorStats(NamedTuple):
+    """
+    A snapshot of the counters maintained by a `MemoryAllocator`, returned by `MemoryAllocator.stats`.
+
+    Fields
+    ------
+        bytes_used    : The number of bytes currently allocated from the arena, including alignment padding.
+        bytes_reserved: The total capacity of all chunks currently owned by the arena, in bytes.
+        n_allocations : The number of successful allocations made from the arena across its lifetime.
+        n_resets      : The number of times the arena has been reset or rolled back to a marker.
+        peak_bytes    : The largest number of bytes observed in use, sampled at each reset and at the time of the snapshot.
+    """
+    bytes_used    : int
+    bytes_reserved: int
+    n_allocations : int
+    n_resets      : int
+    peak_bytes    : int
+
+
+class _AllocatorScope:
+    """
+    A context manager that obtains a marker from an arena on entry and resets the arena back to that marker on exit.
+    Instances are returned by `MemoryAllocator.scope`.
+    """
+    __slots__ = ('_h', '_m')
+
+    def __init__(self, handle) -> None:
+        self._h                         = handle
+        self._m: Optional[MemoryMarker] = None
+
+    def __enter__(self) -> None:
+        self._m = _mark(self._h)
+
+    def __exit__(self, *_) -> None:
+        if self._m is not None:
+            _reset_to(self._h, self._m)
+            self._m = None
 
 
 class MemoryAllocator:
@@ -17,48 +88,63 @@ class MemoryAllocator:
 
     Fields
     ------
-        page_size: The size of a single page of virtual address space, in bytes.
-        growable : This field is `True` if the memory arena can increase its total capacity.
-        readonly : This field is `True` if the memory returned by the arena is read-only.
-        virtual  : This field is `True` if the memory allocated from the arena is allocated using the host virtual memory manager.
-        name     : A string name associated with the allocator, used for debugging.
-        tag      : An integer tag value identifying the allocator, used for debugging.
+        chunk_size    : The capacity of the initial chunk of memory, in bytes.
+        growth_factor : The capacity of each chunk appended when the arena grows, relative to the previous chunk.
+        max_chunk_size: The maximum capacity of a chunk appended when the arena grows, in bytes, or `None` if there is no limit.
+        page_size     : The size of a single page of virtual address space, in bytes.
+        growable      : This field is `True` if the memory arena can increase its total capacity.
+        readonly      : This field is `True` if the memory returned by the arena is read-only.
+        virtual       : This field is `True` if the memory allocated from the arena is allocated using the host virtual memory manager.
+        prefault      : This field is `True` if physical pages are mapped when each chunk is allocated, rather than on first access. Only applies to virtual memory arenas.
+        name          : A string name associated with the allocator, used for debugging. The string is interned, so allocators sharing a name share a single string object.
+        tag           : An integer tag value identifying the allocator, used for debugging. This is the four-character code supplied to the constructor packed into an `int`.
     """
-    def __init__(self, chunk_size: int, alignment: int=DEFAULT_ALIGNMENT, virtual_memory: bool=False, growable: bool=True, name: Optional[str]=None, tag: Optional[str]=None) -> None:
-        flags : int = 0
-        access: int = _mc.MEM_ACCESS_FLAG_RDWR
-
-        if alignment < 1:
-            raise ValueError(f'The alignment argument {alignment} must be >= 1')
-        if (alignment & (alignment-1)) != 0:
-            raise ValueError(f'The alignment argument {alignment} must be a non-zero power of two')
-        if chunk_size <= alignment:
-            raise ValueError(f'The chunk_size argument {chunk_size} must be >= the alignment {alignment}')
-
-        if virtual_memory:
-            flags = _mc.MEM_ALLOCATION_FLAG_LOCAL | _mc.MEM_ALLOCATION_FLAG_VIRTUAL
-        else:
-            flags = _mc.MEM_ALLOCATION_FLAG_LOCAL | _mc.MEM_ALLOCATION_FLAG_HEAP
-
-        if growable:
-            flags = _mc.MEM_ALLOCATION_FLAG_GROWABLE | flags
-        
-        self._internal  = _mc.create_memory_allocator(chunk_size, alignment, flags, access, name, tag)
-        self.chunk_size = chunk_size
-        self.page_size  = self._internal.page_size
-        self.growable   = self._internal.growable
-        self.readonly   = True if access == _mc.MEM_ACCESS_FLAG_READ else False
-        self.virtual    = True if virtual_memory else False
-        self.name       = self._internal.name
-        self.tag        = self._internal.tag
-
-    def reset(self) -> None:
+    _ACCESS: int = _ACCESS_RDWR # The access flags for memory returned by the arena.
+
+    __slots__ = ('_internal', 'chunk_size', 'growth_factor', 'max_chunk_size', 'page_size', 'growable', 'readonly', 'virtual', 'prefault', 'name', 'tag')
+
+    def __init__(self, chunk_size: int, alignment: int=DEFAULT_ALIGNMENT, virtual_memory: bool=False, growable: bool=True, name: Optional[str]=None, tag: Optional[str]=None, growth_factor: float=DEFAULT_GROWTH_FACTOR, max_chunk_size: Optional[int]=None, prefault: bool=False) -> None:
+        flags : int = _FLAG_TABLE[(bool(virtual_memory), bool(growable))] | (_F_PREFAULT if prefault else 0)
+        access: int = self._ACCESS
+
+        self._internal, self.page_size, self.growable, self.name, self.tag = _create(chunk_size, alignment, flags, access, name, tag, growth_factor, max_chunk_size or 0)
+        self.chunk_size     = chunk_size
+        self.growth_factor  = growth_factor
+        self.max_chunk_size = max_chunk_size
+        self.readonly       = False
+        self.virtual        = bool(virtual_memory)
+        self.prefault       = bool(prefault) and self.virtual
+
+    def reset(self, threshold: int=DEFAULT_DECOMMIT_THRESHOLD) -> None:
         """
         Reset the memory arena, invalidating all memory allocations.
+
+        Parameters
+        ----------
+            threshold: For arenas using virtual memory, the minimum number of bytes that must be released before the physical pages backing them are returned to the operating system.
         """
-        _mc.reset_memory_allocator(self._internal)
+        _mc.reset_memory_allocator(self._internal, threshold)
 
-    def allocate(self, length: int, alignment: int=DEFAULT_ALIGNMENT) -> MemoryAllocation:
+    def allocate(self, length: int) -> Optional[MemoryAllocation]:
+        """
+        Attempt to allocate some number of bytes from the arena, using the alignment specified when the arena was created.
+
+        Parameters
+        ----------
+            length: The minimum size of the memory region to return, in bytes.
+
+        Returns
+        -------
+            A `MemoryAllocation` representing the allocation, or `None` if the allocation failed.
+            The `MemoryAllocation` type implements the Python buffer protocol.
+
+        Raises
+        ------
+            A `ValueError` if `length` is less than or equal to zero.
+        """
+        return _allocate_default(self._internal, length)
+
+    def allocate_aligned(self, length: int, alignment: int=DEFAULT_ALIGNMENT) -> Optional[MemoryAllocation]:
         """
         Attempt to allocate some number of bytes from the arena, with a given alignment.
 
@@ -81,6 +167,56 @@ class MemoryAllocator:
         """
         return _mc.allocate_memory(self._internal, length, alignment)
 
+    def allocate_many(self, lengths: Sequence[int], alignment: int=DEFAULT_ALIGNMENT) -> Optional[List[MemoryAllocation]]:
+        """
+        Attempt to allocate several memory regions from the arena in a single call, all with the same alignment.
+
+        Parameters
+        ----------
+            lengths  : The minimum size of each memory region to return, in bytes. This may be any sequence of integers; an `array.array('q')` or a 1-D `numpy` int64 array is read directly via the buffer protocol.
+            alignment: The desired alignment of the first addressable byte of each returned memory region, in bytes. This must be a non-zero power of two less than or equal to the host page size.
+
+        Returns
+        -------
+            A list of `MemoryAllocation`, one for each entry in `lengths`, or `None` if any allocation failed.
+            If any allocation fails, the arena is rolled back to its state prior to the call.
+
+        Raises
+        ------
+            A `ValueError` if any entry in `lengths` is less than or equal to zero.
+            A `ValueError` if `alignment` is less than or equal to zero.
+            A `ValueError` if `alignment` is not a power of two.
+            A `ValueError` if `alignment` is greater than the host system page size.
+        """
+        return _mc.allocate_memory_bulk(self._internal, lengths, alignment)
+
+    def release(self, allocation: MemoryAllocation) -> None:
+        """
+        Return a `MemoryAllocation` object to the arena so that it can be reused by a subsequent allocation.
+        The memory block itself is not returned to the arena; use `MemoryAllocator.reset` or `MemoryAllocator.reset_to` to reclaim memory.
+        On return, the allocation has an address and length of zero. The object is only handed out again by a later call to `MemoryAllocator.allocate` once the caller has dropped every reference to it.
+
+        Parameters
+        ----------
+            allocation: A `MemoryAllocation` returned by this arena.
+
+        Raises
+        ------
+            A `ValueError` if `allocation` was not obtained from this arena.
+        """
+        _release(self._internal, allocation)
+
+    def stats(self) -> AllocatorStats:
+        """
+        Retrieve a snapshot of the counters maintained by the arena.
+        The counters are updated by the native allocator, so gathering statistics has no cost until this method is called.
+
+        Returns
+        -------
+            An `AllocatorStats` instance.
+        """
+        return AllocatorStats(*_stats(self._internal))
+
     def mark(self) -> MemoryMarker:
         """
         Obtain a marker representing the state of the arena at the current point in time.
@@ -90,14 +226,100 @@ class MemoryAllocator:
         -------
             A `MemoryMarker` instance storing the state of the arena.
         """
-        return _mc.create_allocator_marker(self._internal)
+        return _mark(self._internal)
+
+    def scope(self) -> _AllocatorScope:
+        """
+        Obtain a context manager that rolls back all allocations made from the arena within the body of a `with` statement.
+        This is equivalent to calling `MemoryAllocator.mark` on entry and `MemoryAllocator.reset_to` on exit.
 
-    def reset_to(self, marker: MemoryMarker) -> None:
+        Returns
+        -------
+            A context manager bound to the arena.
+        """
+        return _AllocatorScope(self._internal)
+
+    def reset_to(self, marker: MemoryMarker, threshold: int=DEFAULT_DECOMMIT_THRESHOLD) -> None:
         """
         Reset the memory arena back to a previously obtained marker, invalidating all allocations made after the marker was obtained.
 
         Parameters
         ----------
-            marker: A `MemoryMarker` obtained by a prior call to `MemoryAllocator.mark`.
+            marker   : A `MemoryMarker` obtained by a prior call to `MemoryAllocator.mark`.
+            threshold: For arenas using virtual memory, the minimum number of bytes that must be released before the physical pages backing them are returned to the operating system.
         """
-        _mc.reset_memory_allocator_to_marker(self._internal, marker)
+        _reset_to(self._internal, marker, threshold)
+
+
+class ReadOnlyMemoryAllocator(MemoryAllocator):
+    """
+    A `MemoryAllocator` whose allocations are exposed as read-only buffers.
+    For arenas using virtual memory, the underlying pages are also mapped without write access, so allocations read as zero.
+    """
+    _ACCESS: int = _ACCESS_READ
+
+    __slots__ = ()
+
+    def __init__(self, chunk_size: int, alignment: int=DEFAULT_ALIGNMENT, virtual_memory: bool=False, growable: bool=True, name: Optional[str]=None, tag: Optional[str]=None, growth_factor: float=DEFAULT_GROWTH_FACTOR, max_chunk_size: Optional[int]=None, prefault: bool=False) -> None:
+        super().__init__(chunk_size, alignment, virtual_memory, growable, name, tag, growth_factor, max_chunk_size, prefault)
+        self.readonly = True
+
+
+def get_shared_allocator(chunk_size: int, alignment: int=DEFAULT_ALIGNMENT, virtual_memory: bool=False, growable: bool=True) -> MemoryAllocator:
+    """
+    Retrieve a `MemoryAllocator` with the given attributes that is shared by all callers on the calling thread.
+    The allocator is created on first use and cached for the lifetime of the thread.
+    Since the returned allocator is shared, callers should use `MemoryAllocator.mark` and `MemoryAllocator.reset_to` to scope their allocations rather than calling `MemoryAllocator.reset`.
+
+    Parameters
+    ----------
+        chunk_size    : The size of each chunk of memory allocated by the arena, in bytes.
+        alignment     : The alignment of each chunk of memory allocated by the arena, in bytes.
+        virtual_memory: Specify `True` to allocate memory using the host virtual memory manager.
+        growable      : Specify `True` if the arena is allowed to increase its total capacity.
+
+    Returns
+    -------
+        A `MemoryAllocator` instance private to the calling thread.
+    """
+    key  : Tuple[int, int, bool, bool] = (chunk_size, alignment, bool(virtual_memory), bool(growable))
+    cache: Dict[Tuple[int, int, bool, bool], MemoryAllocator]
+    try:
+        cache = _tls.cache
+    except AttributeError:
+        cache = _tls.cache = {}
+
+    arena: Optional[MemoryAllocator] = cache.get(key)
+    if arena is None:
+        arena = cache[key] = MemoryAllocator(chunk_size, alignment, virtual_memory, growable)
+    return arena
+
+
+def view(allocation: MemoryAllocation, dtype: Any='u1', shape: Optional[Union[int, Tuple[int, ...]]]=None) -> Any:
+    """
+    Create a `numpy` array that aliases the memory described by a `MemoryAllocation`, without copying.
+    The array references the allocation, which must not be released or reset while the array is in use.
+
+    Parameters
+    ----------
+        allocation: A `MemoryAllocation` returned by a `MemoryAllocator`.
+        dtype     : The `numpy` data type of the array elements.
+        shape     : The shape of the returned array. If `None`, a 1-D array spanning the entire allocation is returned.
+
+    Returns
+    -------
+        A `numpy.ndarray` viewing the allocated memory.
+
+    Raises
+    ------
+        A `RuntimeError` if `numpy` is not installed.
+        A `BufferError` if `allocation` does not reference a valid memory block.
+        A `ValueError` if the allocation length is not a multiple of the element size, or `shape` does not match the number of elements.
+    """
+    if _np is None:
+        raise RuntimeError('The view function requires numpy, which is not installed')
+
+    array = _np.frombuffer(allocation, dtype=dtype)
+    if shape is not None:
+        array = array.reshape(shape)
+    return array
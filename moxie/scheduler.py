@@ -1,15 +1,36 @@
 """
 Implements the high-level interface to the job scheduling system built on top of the low-level _moxie_core scheduler.
 """
+import os
 import sys
+import ctypes
+import select
 import threading
 
+from   array     import array
 from   enum      import IntEnum
-from   typing    import Any, Callable, Dict, List, Optional, Tuple
+from   typing    import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
 from   threading import Lock
 
 import moxie._moxie_core as _mc
 
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+try:
+    import numba as _numba
+except ImportError:
+    _numba = None
+
+try:
+    import cffi as _cffi
+    _ffi = _cffi.FFI()
+except ImportError:
+    _cffi = None
+    _ffi  = None
+
 
 class JobQueueSignal(IntEnum):
     """
@@ -28,6 +49,19 @@ class JobQueueSignal(IntEnum):
     USER     : int = 2
 
 
+class JobQueuePolicy(IntEnum):
+    """
+    Define how ready-to-run jobs are distributed to the threads that wait on a job queue.
+
+    Fields
+    ------
+        SHARED  : All ready-to-run jobs are pushed to, and taken from, the shared `JobQueue`.
+        STEALING: Jobs submitted to a context's own wait queue are kept in a per-context deque, and idle contexts waiting on the same queue steal work from each other before falling back to the shared queue.
+    """
+    SHARED  : int = _mc.JOB_QUEUE_POLICY_SHARED
+    STEALING: int = _mc.JOB_QUEUE_POLICY_STEALING
+
+
 class JobId(IntEnum):
     """
     Define some well-known job identifier values.
@@ -106,14 +140,190 @@ class JobSubmitResult(IntEnum):
     TOO_MANY_WAITERS: int = -2
 
 
+# Module-level integer copies of frequently compared enumeration values.
+# Comparing and marshalling plain ints avoids the IntEnum attribute lookup and conversion on hot paths.
+_SIG_CLEAR    : int = int(JobQueueSignal.CLEAR)
+_SIG_TERMINATE: int = int(JobQueueSignal.TERMINATE)
+_JOB_NONE     : int = int(JobId.NONE)
+_SUBMIT_OK    : int = int(JobSubmitResult.SUCCESS)
+_JOB_CANCELED : int = int(JobState.CANCELED)
+
+# Module-level aliases for native functions called on hot paths, avoiding an attribute lookup on the extension module per call.
+_signal_queue      = _mc.signal_job_queue
+_signal_queue_one  = _mc.signal_job_queue_one
+_check_signal      = _mc.check_job_queue_signal
+_create_job        = _mc.create_python_job
+_create_job_by_id  = _mc.create_python_job_by_id
+_create_job_fast   = _mc.create_python_job_fast
+_create_native_job = _mc.create_native_job
+_submit_job        = _mc.submit_python_job
+_submit_job_0      = _mc.submit_python_job_0
+_submit_job_1      = _mc.submit_python_job_1
+_submit_job_2      = _mc.submit_python_job_2
+_submit_jobs       = _mc.submit_python_jobs
+_submit_jobs_buf   = _mc.submit_python_jobs_buf
+_submit_batch      = _mc.submit_python_batch
+_cancel_job        = _mc.cancel_job
+_complete_job      = _mc.complete_job
+_wait_for_job      = _mc.wait_for_job
+_run_next_job      = _mc.run_next_job
+_run_next_job_only = _mc.run_next_job_no_completion
+_try_run_next_job  = _mc.try_run_next_job
+_release_context   = _mc.release_job_context
+_get_ident         = threading.get_ident
+
+# The signature of a native job entry point, in Numba type notation: int32_t (uint32_t job, uintptr_t arg).
+NATIVE_JOB_SIGNATURE: str = 'int32(uint32, uintp)'
+
+# The accepted ctypes argument types for a native job; the argument may be declared as either a size_t or a void pointer.
+_CTYPES_NATIVE_JOB_ARGTYPES: Tuple[Tuple[Any, ...], ...] = ((ctypes.c_uint32, ctypes.c_size_t), (ctypes.c_uint32, ctypes.c_void_p))
+
+
+def native_job(function: Callable[[int, int], int]) -> Any:
+    """
+    Compile a Python function to a native job entry point with Numba, for use with `JobContext.create_native_job`.
+    The compiled function runs on the worker thread without acquiring the Global Interpreter Lock, so it must be compatible with Numba's nopython mode.
+
+    Parameters
+    ----------
+        function: A function `(job: int, arg: int) -> int` matching `NATIVE_JOB_SIGNATURE`.
+
+    Returns
+    -------
+        The Numba `cfunc` object. Its `address` attribute is the native entry point.
+    """
+    if _numba is None:
+        raise ImportError('numba is required to compile native jobs; install numba or supply a ctypes function pointer instead')
+    return _numba.cfunc(NATIVE_JOB_SIGNATURE, cache=True)(function)
+
+
+def _native_job_address(function: Any) -> int:
+    """
+    Resolve the address of a native job entry point.
+    Only typed function objects are accepted, so the signature can be checked where the object carries one; raw integer addresses are rejected.
+
+    Parameters
+    ----------
+        function: A Numba `cfunc`, a `ctypes` function pointer, or a `cffi` function pointer.
+
+    Returns
+    -------
+        The address of the function as an integer.
+
+    Raises
+    ------
+        A `TypeError` if `function` is not one of the supported function objects.
+        A `TypeError` if `function` is a function object whose signature does not match `int32_t (uint32_t job, uintptr_t arg)`.
+    """
+    if _numba is not None and isinstance(function, _numba.core.ccallback.CFunc):
+        args, restype = _numba.core.sigutils.normalize_signature(NATIVE_JOB_SIGNATURE)
+        if function._sig.return_type != restype or tuple(function._sig.args) != tuple(args):
+            raise TypeError(f'A numba native job must be compiled with signature {NATIVE_JOB_SIGNATURE!r}, got {function._sig}')
+        return function.address
+    if isinstance(function, ctypes._CFuncPtr):
+        argtypes = tuple(function.argtypes or ())
+        if function.restype is not ctypes.c_int32 or argtypes not in _CTYPES_NATIVE_JOB_ARGTYPES:
+            raise TypeError('A ctypes native job must be declared as CFUNCTYPE(c_int32, c_uint32, c_size_t)')
+        return ctypes.cast(function, ctypes.c_void_p).value
+    if _ffi is not None and isinstance(function, _ffi.CData):
+        ctype: Any = _ffi.typeof(function)
+        if ctype.kind == 'pointer' and ctype.item.kind == 'function':
+            ctype = ctype.item
+        if ctype.kind == 'function':
+            if ctype.ellipsis or ctype.result != _ffi.typeof('int32_t') or ctype.args != (_ffi.typeof('uint32_t'), _ffi.typeof('uintptr_t')):
+                raise TypeError(f'A cffi native job must have type int32_t(*)(uint32_t, uintptr_t), got {ctype.cname}')
+            return int(_ffi.cast('uintptr_t', function))
+    raise TypeError(f'Expected a numba cfunc, ctypes function pointer or cffi function pointer for a native job, got {type(function).__name__}')
+
+
+class FastSignal:
+    """
+    A one-shot signal with the same `set`/`is_set`/`wait` interface as `threading.Event`, intended for notifying a waiting thread that a pipeline has completed.
+    Unlike `threading.Event`, setting the signal does not acquire a lock: it performs a single `write` to an `eventfd` (Linux) or self-pipe (other POSIX systems).
+    Waiting blocks in the kernel, with the GIL released, until the signal is set. On platforms without either mechanism, a `threading.Event` is used.
+    Once set, the signal remains set; it cannot be cleared.
+    """
+    __slots__ = ('_flag', '_rfd', '_wfd', '_event')
+
+    def __init__(self) -> None:
+        self._flag : bool = False
+        self._rfd  : int  = -1
+        self._wfd  : int  = -1
+        self._event: Optional[threading.Event] = None
+        if hasattr(os, 'eventfd'):
+            self._rfd = self._wfd = os.eventfd(0, os.EFD_CLOEXEC)
+        elif os.name == 'posix':
+            self._rfd, self._wfd = os.pipe()
+        else:
+            self._event = threading.Event()
+
+    def __del__(self) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Close the file descriptors backing the signal. Calling this function more than once has no effect.
+        """
+        rfd, wfd = self._rfd, self._wfd
+        self._rfd = self._wfd = -1
+        if rfd >= 0:
+            os.close(rfd)
+        if wfd >= 0 and wfd != rfd:
+            os.close(wfd)
+
+    def is_set(self) -> bool:
+        """
+        Determine whether the signal has been set.
+
+        Returns
+        -------
+            `True` if `FastSignal.set` has been called.
+        """
+        return self._flag
+
+    def set(self) -> None:
+        """
+        Set the signal, waking all threads blocked in `FastSignal.wait`. Calling this function more than once has no effect.
+        """
+        if self._flag:
+            return
+        self._flag = True
+        if self._event is not None:
+            self._event.set()
+        else:
+            os.write(self._wfd, (1).to_bytes(8, sys.byteorder))
+
+    def wait(self, timeout: Optional[float]=None) -> bool:
+        """
+        Block the calling thread until the signal is set, or until the timeout elapses.
+
+        Parameters
+        ----------
+            timeout: The maximum amount of time to wait, in seconds, or `None` to wait indefinitely.
+
+        Returns
+        -------
+            `True` if the signal is set, or `False` if the timeout elapsed first.
+        """
+        if self._flag:
+            return True
+        if self._event is not None:
+            return self._event.wait(timeout)
+        ready, _, _ = select.select([self._rfd], [], [], timeout)
+        return bool(ready) or self._flag
+
+
 class JobQueue:
     """
     A waitable job queue to which jobs are submitted, and worker threads can wait on.
+    With `JobQueuePolicy.STEALING`, most ready-to-run jobs stay in the per-context deques of the threads waiting on the queue, so submitters and workers only contend on the queue's lock when a deque is full.
 
     Fields
     ------
         id: A unique `int` identifier for the queue within the job system.
     """
+    __slots__ = ('id', '_internal')
+
     def __init__(self, queue_id: int) -> None:
         self.id        = queue_id
         self._internal = _mc.create_job_queue(queue_id)
@@ -134,7 +344,20 @@ class JobQueue:
         ----------
             signal_id: An integer value with application-defined meaning representing the signal to send.
         """
-        _mc.signal_job_queue(self._internal, signal_id)
+        _signal_queue(self._internal, signal_id)
+
+    def signal_one(self, signal_id: int) -> None:
+        """
+        Send a signal to the queue, waking at most one thread that is parked waiting for work.
+        Prefer this over `JobQueue.signal` for transient control signals that need only be observed by a single thread, as it avoids waking every parked thread.
+        Use `JobQueue.signal` for `JobQueueSignal.TERMINATE`, which every thread must observe.
+        Setting the signal value already set on the queue does not wake any threads.
+
+        Parameters
+        ----------
+            signal_id: An integer value with application-defined meaning representing the signal to send.
+        """
+        _signal_queue_one(self._internal, signal_id)
 
     def get_signal(self) -> int:
         """
@@ -144,13 +367,13 @@ class JobQueue:
         -------
             An `int` signal value, which may be a value with application-defined meaning, `JobQueueSignal.NONE` if there is no active signal, or `JobQueueSignal.TERMINATE` if all threads should terminate.
         """
-        return _mc.check_job_queue_signal(self._internal)
+        return _check_signal(self._internal)
 
     def clear_signal(self) -> None:
         """
         Clear any signal value currently set on the queue, allowing worker threads to wait on the queue again.
         """
-        _mc.signal_job_queue(self._internal, JobQueueSignal.CLEAR)
+        _signal_queue(self._internal, _SIG_CLEAR)
 
     def flush(self) -> None:
         """
@@ -166,27 +389,43 @@ class JobSystem:
     Fields
     ------
         name    : A `str` specifying a name for the job system, used for debugging.
+        policy  : One of the values of the `JobQueuePolicy` enumeration specifying how ready-to-run jobs are distributed to worker threads. Defaults to `JobQueuePolicy.STEALING`.
         queues  : A `list` of `JobQueue` instances representing the set of waitable queues to which work can be submitted.
         threads : A `list` of `JobSystemThread` (or subclasses thereof) representing the pool of threads that create, submit, execute and/or complete work items.
         contexts: A `list` of `JobContext` representing the set of live job management contexts used to interact with the job system from individual threads.
     """
-    def __init__(self, name: str='Main', context_count: int=1) -> None:
+    def __init__(self, name: str='Main', context_count: int=1, queue_policy: JobQueuePolicy=JobQueuePolicy.STEALING) -> None:
         if context_count < 0:
             raise ValueError(f'The supplied context count {context_count} must be >= 0')
 
         self.name              : str    = name if name is not None else 'Unnamed'
-        self.queues            : list   = [] # JobQueue
-        self.threads           : list   = [] # JobSystemThread
-        self.contexts          : list   = [] # JobContext
-        self._internal         : object = _mc.create_job_scheduler(context_count)
-        self._id_to_context    : dict   = {} # int -> JobContext
-        self._id_to_queue      : dict   = {} # int -> JobQueue
-        self._id_to_thread     : dict   = {} # int -> JobSystemThread
-        self._id_to_thread_name: dict   = {} # int -> str
+        self.policy            : int    = JobQueuePolicy(queue_policy)
+        self.queues            : list   = [] # JobQueue, copy-on-write
+        self._queue_states     : tuple  = () # The JobQueue._internal objects for each entry in queues, copy-on-write
+        self._internal         : object = _mc.create_job_scheduler(context_count, int(self.policy))
+        self._id_to_context    : dict   = self._internal.id_to_ctx # int -> JobContext, shared with the native scheduler
+        self._id_to_queue      : dict   = {} # int -> JobQueue, copy-on-write
+        self._id_to_thread     : dict   = {} # int -> JobSystemThread, copy-on-write
+        self._id_to_thread_name: dict   = {} # int -> str, copy-on-write
+        self._thread_set       : dict   = {} # JobSystemThread -> None, in registration order
         self._queue_list_lock  : Lock   = Lock()
         self._thread_list_lock : Lock   = Lock()
         self._context_list_lock: Lock   = Lock()
 
+    @property
+    def threads(self) -> List[threading.Thread]:
+        """
+        Retrieve a snapshot of the threads registered with the `JobSystem`, in registration order.
+        """
+        return list(self._thread_set)
+
+    @property
+    def contexts(self) -> List['JobContext']:
+        """
+        Retrieve a snapshot of the live `JobContext` instances acquired from the `JobSystem`.
+        """
+        return list(self._id_to_context.values())
+
     def __str__(self) -> str:
         return f'JobQueue(name={self.name})'
 
@@ -206,13 +445,22 @@ class JobSystem:
         -------
             A new `JobQueue` instance.
         """
-        with self._queue_list_lock as _:
-            if queue_id in self._id_to_queue:
-                return self._id_to_queue[queue_id]
+        # Fast path: the queue map is copy-on-write, so existing queues are found without locking.
+        queue = self._id_to_queue.get(queue_id, None)
+        if queue is not None:
+            return queue
 
-            queue  = JobQueue(queue_id)
-            self._id_to_queue[queue_id] = queue
-            self.queues.append(queue)
+        with self._queue_list_lock as _:
+            queue = self._id_to_queue.get(queue_id, None)
+            if queue is not None:
+                return queue
+
+            queue       = JobQueue(queue_id)
+            id_to_queue = dict(self._id_to_queue)
+            id_to_queue[queue_id] = queue
+            self._id_to_queue  = id_to_queue
+            self._queue_states = self._queue_states + (queue._internal,)
+            self.queues        = self.queues + [queue]
             return queue
 
     def get_queue_worker_count(self, queue_id: int) -> Optional[int]:
@@ -237,10 +485,9 @@ class JobSystem:
         """
         Flush all work items from all `JobQueue` instances registered with the `JobSystem`.
         Any waiting producer threads are woken up.
+        The queues are flushed with a single call into the native module. No lock is held, so queues may be registered concurrently.
         """
-        with self._queue_list_lock as _:
-            for queue in self.queues:
-                queue.flush()
+        _mc.flush_job_queues(self._queue_states)
 
     def get_thread(self, thread_id: Optional[int]=None) -> Optional[threading.Thread]:
         """
@@ -256,12 +503,12 @@ class JobSystem:
             Returns `None` if the `thread_id` identifies a thread that is not registered with the `JobSystem` and is not the main application thread.
         """
         if thread_id is None:
-            thread_id = threading.get_ident()
+            thread_id = _get_ident()
 
-        with self._thread_list_lock as _:
-            result = self._id_to_thread.get(thread_id, None)
-            if result is not None:
-                return result
+        # The identifier maps are copy-on-write, so a lock-free read sees either the old or the new mapping.
+        result = self._id_to_thread.get(thread_id, None)
+        if result is not None:
+            return result
 
         main_thread = threading.main_thread()
         if main_thread.ident == thread_id:
@@ -282,12 +529,11 @@ class JobSystem:
             The name of the thread associated with `thread_id`, `Main Thread` if `thread_id` identifies the main application thread, or `Unknown Thread` if `thread_id` is not known to the `JobSystem`.
         """
         if thread_id is None:
-            thread_id = threading.get_ident()
+            thread_id = _get_ident()
 
-        with self._thread_list_lock as _:
-            result = self._id_to_thread_name.get(thread_id, None)
-            if result is not None:
-                return result
+        result = self._id_to_thread_name.get(thread_id, None)
+        if result is not None:
+            return result
 
         main_thread = threading.main_thread()
         if main_thread.ident == thread_id:
@@ -314,11 +560,8 @@ class JobSystem:
         if thread.is_alive():
             raise ValueError('Threads registered with the JobSystem must be in the unstarted state')
         with self._thread_list_lock as _:
-            if thread in self.threads:
-                return
-            else:
-                # Note: The thread name is obtained during thread launch.
-                self.threads.append(thread)
+            # Note: The thread name is obtained during thread launch.
+            self._thread_set.setdefault(thread, None)
 
     def unregister_thread(self, thread: threading.Thread) -> None:
         """
@@ -334,53 +577,65 @@ class JobSystem:
         tid: int = thread.ident
         with self._thread_list_lock as _:
             if tid in self._id_to_thread:
-                self._id_to_thread.pop(tid, None)
+                id_to_thread = dict(self._id_to_thread)
+                id_to_thread.pop(tid, None)
+                self._id_to_thread = id_to_thread
             if tid in self._id_to_thread_name:
-                self._id_to_thread_name.pop(tid, None)
-            if thread in self.threads:
-                self.threads.remove(thread)
+                id_to_thread_name = dict(self._id_to_thread_name)
+                id_to_thread_name.pop(tid, None)
+                self._id_to_thread_name = id_to_thread_name
+            self._thread_set.pop(thread, None)
 
         with self._context_list_lock as _:
-            ctx = self._id_to_context.get(tid, None)
-            if ctx is not None:
-                self._id_to_context.pop(tid, None)
-                self.contexts.remove(ctx)
+            self._id_to_context.pop(tid, None)
 
-    def launch_threads(self) -> int:
+    def launch_threads(self, pin_threads: bool=False) -> int:
         """
         Launch all threads registered with the `JobSystem`, allowing them to acquire their `JobContext`.
 
+        Parameters
+        ----------
+            pin_threads: Specify `True` to pin each `JobSystemThread` to a single logical processor, cycling through the processors available to the process.
+                         Pinned workers do not migrate between NUMA nodes, and the job buffers they allocate from are first touched, and so placed, on the worker's node.
+
         Returns
         -------
             The number of threads successfully launched.
         """
-        thread_list : List[threading.Thread] = None
-        name_list   : List[Tuple[int, str]]  = []
-        thread_count: int                    = 0
+        thread_list: List[threading.Thread]                  = None
+        started    : List[Tuple[int, str, threading.Thread]] = []
+        cpu_list   : List[int]                               = []
 
         # Copy the thread list to avoid nested locking.
         with self._thread_list_lock as _:
-            thread_list = self.threads.copy()
+            thread_list = list(self._thread_set)
             self._id_to_thread_name = {}
             self._id_to_thread = {}
 
+        if pin_threads:
+            if hasattr(os, 'sched_getaffinity'):
+                cpu_list = sorted(os.sched_getaffinity(0))
+            else:
+                cpu_list = list(range(os.cpu_count() or 1))
+
         # Start the threads, which assigns an identifier and lets them set their name.
-        for thread in thread_list:
+        # Each thread is paired with its identifier and name here so the tables below cannot be misaligned.
+        for index, thread in enumerate(thread_list):
+            if cpu_list and isinstance(thread, JobSystemThread):
+                # The thread pins itself before acquiring its JobContext.
+                thread.cpu = cpu_list[index % len(cpu_list)]
             thread.start()
-            tid : int = thread.ident
-            name: str = thread.name
-            if not name:
-                name  = 'Unnamed Thread'
-            name_list.append((tid, name))
+            started.append((thread.ident, thread.name or 'Unnamed Thread', thread))
 
         # All threads have been started, update the thread ID tables.
+        # Build the new maps privately and publish them with a single rebind each.
+        id_to_thread     : Dict[int, threading.Thread] = {tid: thread for tid, _, thread in started}
+        id_to_thread_name: Dict[int, str]              = {tid: name   for tid, name, _ in started}
         with self._thread_list_lock as _:
-            for index, item in enumerate(name_list):
-                self._id_to_thread     [item[0]] = self.threads[index]
-                self._id_to_thread_name[item[0]] = item[1]
-                thread_count += 1
+            self._id_to_thread      = id_to_thread
+            self._id_to_thread_name = id_to_thread_name
 
-        return thread_count
+        return len(started)
 
     def terminate_threads(self, timeout: Optional[float]=None) -> None:
         """
@@ -393,7 +648,7 @@ class JobSystem:
         """
         _mc.terminate_job_scheduler(self._internal)
         with self._thread_list_lock as _:
-            for thread in self.threads:
+            for thread in self._thread_set:
                 try:
                     if thread.is_alive():
                         thread.join(timeout)
@@ -411,18 +666,14 @@ class JobSystem:
         """
         thread_list: List[threading.Thread] = None
         with self._thread_list_lock as _:
-            thread_list             = self.threads
-            self.threads            = []
+            thread_list             = list(self._thread_set)
+            self._thread_set        = {}
             self._id_to_thread      = {}
             self._id_to_thread_name = {}
 
         with self._context_list_lock as _:
             for thread in thread_list:
-                tid: int = thread.ident
-                ctx      = self._id_to_context.get(tid, None)
-                if ctx is not None:
-                    self._id_to_context.pop(tid, None)
-                    self.contexts.remove(ctx)
+                self._id_to_context.pop(thread.ident, None)
 
         return thread_list if thread_list is not None else []
 
@@ -442,9 +693,22 @@ class JobSystem:
         ctx = JobContext(self, wait_queue, thread_id)
         with self._context_list_lock as _:
             self._id_to_context[ctx.thread_id] = ctx
-            self.contexts.append(ctx)
         return ctx
 
+    def _remove_context(self, ctx: 'JobContext', thread_id: int) -> None:
+        """
+        Remove a released `JobContext` from the set of live contexts.
+        The native job context has already been returned to the scheduler's free list, so a later `JobSystem.acquire_context` reuses it under a new `JobContext`.
+
+        Parameters
+        ----------
+            ctx      : The `JobContext` whose native context has just been released.
+            thread_id: The identifier of the thread that owned `ctx`.
+        """
+        with self._context_list_lock as _:
+            if self._id_to_context.get(thread_id) is ctx:
+                del self._id_to_context[thread_id]
+
 
 class JobContext:
     """
@@ -457,13 +721,15 @@ class JobContext:
         system   : The `JobSystem` from which the context was acquired.
         thread_id: The identifier of the thread that owns the context.
     """
+    __slots__ = ('queue', 'system', 'thread_id', '_internal')
+
     def __init__(self, owner: JobSystem, wait_queue: JobQueue, thread_id: Optional[int]=None) -> None:
         if owner is None:
             raise ValueError('A valid JobSystem instance must be supplied for the owner argument')
         if wait_queue is None:
             raise ValueError('A valid JobQueue instance must be supplied for the wait_queue argument')
         if thread_id is None:
-            thread_id = threading.get_ident()
+            thread_id = _get_ident()
         if thread_id <= 0:
             raise ValueError(f'An invalid thread_id {thread_id} was specified; valid values are positive integers')
 
@@ -481,22 +747,27 @@ class JobContext:
     def __enter__(self):
         return self
 
-    def __exit__(self, _ex_type, _ex_value, _ex_traceback):
+    def __exit__(self, *_) -> None:
         self.release()
 
     def release(self) -> None:
         """
-        Dispose of resources associated with the `JobContext` and return it to the free pool.
+        Dispose of resources associated with the `JobContext` and return its native context to the scheduler's free pool.
         This function should be called when the owning thread no longer requires use of the `JobContext`.
+        Calling this function more than once has no effect.
         """
-        if self._internal:
-            _mc.release_job_context(self._internal)
-            self._internal = None
+        internal       = self._internal
+        system         = self.system
+        thread_id      = self.thread_id
+        self._internal = None
         self.queue     = None
         self.system    = None
         self.thread_id = None
+        if internal:
+            _release_context(internal)
+            system._remove_context(self, thread_id)
 
-    def create_job(self, callable: Callable, parent: int=JobId.NONE, *args, **kwargs) -> int:
+    def create_job(self, callable: Callable, parent: int=_JOB_NONE, *args, **kwargs) -> int:
         """
         Create, but do not submit, a new work item.
 
@@ -511,7 +782,78 @@ class JobContext:
         -------
             The identifier of the new job, or `JobId.INVALID` if the job could not be created.
         """
-        return _mc.create_python_job(self._internal, self.system._id_to_context, parent, callable, args, kwargs)
+        return _create_job(self._internal, parent, callable, args, kwargs)
+
+    def create_job_fast(self, callable: Callable, args: tuple=()) -> int:
+        """
+        Create, but do not submit, a new work item that has no parent job and no keyword arguments.
+        This skips the keyword argument packing and parent handling performed by `JobContext.create_job`, and should be preferred in tight job creation loops.
+
+        Parameters
+        ----------
+            callable: The job entry point routine to execute when the job is run. The positional arguments `args` are supplied first, followed by the keyword arguments `job: int` and `jobctx: JobContext`, and the function should return an integer result code.
+            args    : A tuple of positional arguments to supply to the job entry point `callable` when it runs.
+
+        Returns
+        -------
+            The identifier of the new job, or `JobId.INVALID` if the job could not be created.
+        """
+        return _create_job_fast(self._internal, callable, args)
+
+    def create_native_job(self, function: Any, arg: int=0, parent: int=_JOB_NONE) -> int:
+        """
+        Create, but do not submit, a new work item implemented by a native function with the signature `int32_t (uint32_t job, uintptr_t arg)`.
+        The function is called directly by the worker thread without acquiring the Global Interpreter Lock, so native jobs run in parallel with each other and with Python code.
+        The caller must keep `function` alive until the job has completed.
+
+        Parameters
+        ----------
+            function: The job entry point; a Numba `cfunc` (see `native_job`), a `ctypes` function pointer or a `cffi` function pointer. Integer addresses are not accepted.
+            arg     : An application-defined integer value, typically an address, passed to the function when it runs.
+            parent  : The identifier of the parent job, or `JobId.NONE`.
+
+        Returns
+        -------
+            The identifier of the new job.
+
+        Raises
+        ------
+            A `TypeError` if `function` is not a supported function object, or its declared signature does not match.
+        """
+        return _create_native_job(self._internal, _native_job_address(function), arg, parent)
+
+    def register_entry(self, callable: Callable) -> int:
+        """
+        Register a job entry point with the `JobSystem`, so that jobs can be created from it by identifier.
+        Registering the same callable more than once returns the same identifier.
+        The `JobSystem` retains a reference to the callable until it is destroyed.
+
+        Parameters
+        ----------
+            callable: The job entry point routine. This function will receive arguments (job: int, jobctx: JobContext, *args, **kwargs) and should return an integer result code.
+
+        Returns
+        -------
+            An integer entry identifier that can be passed to `JobContext.create_job_by_id` from any `JobContext` in the same `JobSystem`.
+        """
+        return _mc.register_python_job_entry(self._internal, callable)
+
+    def create_job_by_id(self, entry: int, parent: int=_JOB_NONE, *args, **kwargs) -> int:
+        """
+        Create, but do not submit, a new work item whose entry point was registered with `JobContext.register_entry`.
+
+        Parameters
+        ----------
+            entry : The entry identifier returned by `JobContext.register_entry`.
+            parent: The identifier of the job's parent job, or `JobId.NONE` if the new job has no parent.
+            args  : Positional arguments to supply to the job entry point when it runs.
+            kwargs: Keyword arguments to supply to the job entry point when it runs.
+
+        Returns
+        -------
+            The identifier of the new job, or `JobId.INVALID` if the job could not be created.
+        """
+        return _create_job_by_id(self._internal, entry, parent, args, kwargs)
 
     def submit_job(self, job: int, submit: JobSubmitType, target: Optional[JobQueue]=None, dependencies: Optional[List[int]]=None) -> JobSubmitResult:
         """
@@ -528,9 +870,94 @@ class JobContext:
         -------
             One of the values of the `JobSubmitResult` enumeration, indicating whether the job was successfully submitted (or canceled).
         """
-        result: int = _mc.submit_python_job(self._internal, job, target, dependencies, submit)
+        queue : Any = target._internal if target is not None else None
+        result: int
+        # Dependencies are passed as positional arguments for the common counts, so no list is unpacked natively.
+        if not dependencies:
+            result = _submit_job_0(self._internal, job, queue, submit)
+        elif len(dependencies) == 1:
+            result = _submit_job_1(self._internal, job, queue, submit, dependencies[0])
+        elif len(dependencies) <= 3:
+            result = _submit_job_2(self._internal, job, queue, submit, *dependencies)
+        else:
+            result = _submit_job(self._internal, job, queue, dependencies, submit)
+        if result == _SUBMIT_OK: # Enum members are singletons; skip the value lookup on the common path.
+            return JobSubmitResult.SUCCESS
         return JobSubmitResult(result)
 
+    def submit_jobs(self, jobs: Sequence[int], submit: JobSubmitType, target: Optional[JobQueue]=None, dependencies: Optional[Sequence[Optional[List[int]]]]=None) -> Union[JobSubmitResult, List[JobSubmitResult]]:
+        """
+        Submit a batch of jobs for execution or cancelation with a single call into the native scheduler.
+        Ready-to-run jobs are pushed to the target queue in batches, and are enqueued in the order they appear in `jobs`.
+
+        Parameters
+        ----------
+            jobs        : The identifiers of the jobs to submit.
+            submit      : One of the values of the `JobSubmitType` enumeration, applied to every job in the batch.
+            target      : The `JobQueue` to which the jobs should be submitted, or `None` to submit to the default queue referenced in `JobContext.queue`.
+            dependencies: An optional sequence with one entry per job, each either `None` or a list of job IDs that must complete before that job can run.
+
+        Returns
+        -------
+            `JobSubmitResult.SUCCESS` if every job was submitted successfully; otherwise, a `list` with one `JobSubmitResult` per job, in submission order.
+        """
+        queue : Any = target._internal if target is not None else None
+        result: Any = _submit_jobs(self._internal, jobs, queue, dependencies, submit)
+        if result == _SUBMIT_OK:
+            return JobSubmitResult.SUCCESS
+        return [JobSubmitResult(r) for r in result]
+
+    def submit_batch(self, specs: Sequence[Tuple[Callable[..., int], int, Optional[Dict[str, Any]], JobSubmitType, Optional[List[int]]]], target: Optional[JobQueue]=None) -> Tuple[List[int], Union[JobSubmitResult, List[JobSubmitResult]]]:
+        """
+        Create and submit a batch of jobs with a single call into the native scheduler.
+        This is equivalent to a series of `JobContext.create_job` calls followed by `JobContext.submit_jobs`, but avoids a Python-to-native transition per job.
+        Every spec is validated before any job is created, so a malformed batch raises without creating or submitting any jobs.
+
+        Parameters
+        ----------
+            specs : A sequence of `(callable, parent, kwargs, submit_type, dependencies)` tuples, one per job. `kwargs` is `None` or a `dict` of keyword arguments passed to `callable`. `dependencies` is `None` or a list of indices into `specs` identifying the jobs in the batch that must complete before this job can run.
+            target: The `JobQueue` to which the jobs should be submitted, or `None` to submit to the default queue referenced in `JobContext.queue`.
+
+        Returns
+        -------
+            A tuple `(jobs, result)` where `jobs` is the list of identifiers of the created jobs, in the order of `specs`, and `result` is `JobSubmitResult.SUCCESS` if every job was submitted successfully, or otherwise a `list` with one `JobSubmitResult` per job.
+
+        Raises
+        ------
+            A `ValueError` if a dependency index does not identify another job in the batch.
+            A `ValueError` if the dependencies form a cycle.
+        """
+        queue: Any = target._internal if target is not None else None
+        jobs, result = _submit_batch(self._internal, specs, queue)
+        if result == _SUBMIT_OK:
+            return jobs, JobSubmitResult.SUCCESS
+        return jobs, [JobSubmitResult(r) for r in result]
+
+    def submit_jobs_buf(self, jobs: Sequence[int], submit: JobSubmitType, target: Optional[JobQueue]=None, dependencies: Optional[Sequence[Optional[List[int]]]]=None, out: Any=None) -> Any:
+        """
+        Submit a batch of jobs like `JobContext.submit_jobs`, but return the raw per-job result codes in an int8 buffer instead of a list of `JobSubmitResult`.
+        No Python object is created per job, which makes this the preferred variant for very large batches.
+        Check for failures with `(out < 0).any()` on a `numpy` array, or `min(out) < 0` on an `array.array`.
+
+        Parameters
+        ----------
+            jobs        : The identifiers of the jobs to submit.
+            submit      : One of the values of the `JobSubmitType` enumeration, applied to every job in the batch.
+            target      : The `JobQueue` to which the jobs should be submitted, or `None` to submit to the default queue referenced in `JobContext.queue`.
+            dependencies: An optional sequence with one entry per job, each either `None` or a list of job IDs that must complete before that job can run.
+            out         : An optional writable 1-D int8 buffer (`numpy.int8` array or `array.array('b')`) with at least one entry per job. If `None`, a new buffer is allocated; a `numpy` array if `numpy` is installed, otherwise an `array.array('b')`.
+
+        Returns
+        -------
+            The buffer `out`, where each of the first `len(jobs)` entries holds the `JobSubmitResult` value for the corresponding job.
+        """
+        if out is None:
+            count: int = len(jobs)
+            out = _np.empty(count, dtype=_np.int8) if _np is not None else array('b', bytes(count))
+        queue: Any = target._internal if target is not None else None
+        _submit_jobs_buf(self._internal, jobs, queue, dependencies, submit, out)
+        return out
+
     def cancel_job(self, job: int) -> JobState:
         """
         Attempt to cancel a job that has been previously submitted.
@@ -545,7 +972,9 @@ class JobContext:
         -------
             One of the values of the `JobState` enumeration indicating the state of the job at the time of the call. If the job is successfully canceled, the return value will be `JobState.CANCELED`.
         """
-        result: int = _mc.cancel_job(self._internal, job)
+        result: int = _cancel_job(self._internal, job)
+        if result == _JOB_CANCELED:
+            return JobState.CANCELED
         return JobState(result)
 
     def complete_job(self, job: int) -> None:
@@ -558,24 +987,30 @@ class JobContext:
         ----------
             job: The identifier of the completed job.
         """
-        _mc.complete_job(self._internal, job)
+        _complete_job(self._internal, job)
 
-    def wait_for_job(self, job: int) -> int:
+    def wait_for_job(self, job: int, spin_count: int=_mc.JOB_WAIT_SPIN_COUNT) -> int:
         """
-        Perform a busy wait on the calling thread while waiting for a specific job to complete.
+        Wait on the calling thread for a specific job to complete.
         The calling thread runs available jobs while waiting for the specified job to complete.
+        After `spin_count` consecutive polls find no ready-to-run job, the calling thread sleeps until the specified job completes instead of spinning, waking periodically to poll for work again.
         The Global Interpreter Lock is released during the wait, allowing other threads to run.
         This function must not be called from the main application thread when execution is performed on a pool of worker threads - instead, use a signaling mechanism like `threading.Event`. Otherwise, a deadlock may result.
 
         Parameters
         ----------
-            job: The identifier of the job to wait for.
+            job       : The identifier of the job to wait for.
+            spin_count: The number of consecutive failed polls for ready-to-run work before the calling thread sleeps.
 
         Returns
         -------
             Non-zero if the specified job completed, or zero if the queue became signaled or an error occurred.
+
+        Raises
+        ------
+            Any exception raised by a job executed on the calling thread while waiting. The wait ends as soon as such a job returns.
         """
-        return _mc.wait_for_job(self._internal, job)
+        return _wait_for_job(self._internal, job, spin_count)
 
     def run_next_job(self) -> int:
         """
@@ -586,8 +1021,23 @@ class JobContext:
         Returns
         -------
             The identifier of the job that was executed, or `JobId.NONE` if the call returned because of a signal on the wait queue.
+
+        Raises
+        ------
+            Any exception raised by the executed job. The job is completed before the exception propagates.
         """
-        return _mc.run_next_job(self._internal)
+        return _run_next_job(self._internal)
+
+    def try_run_next_job(self) -> int:
+        """
+        Execute and complete a ready-to-run job if one is available, without blocking.
+        With `JobQueuePolicy.STEALING`, the context's own deque is checked first, then the deques of other contexts waiting on the same `JobQueue`, and then the `JobQueue` itself.
+
+        Returns
+        -------
+            The identifier of the job that was executed, or `JobId.NONE` if no job was available.
+        """
+        return _try_run_next_job(self._internal)
 
     def run_next_job_without_completion(self) -> int:
         """
@@ -599,8 +1049,12 @@ class JobContext:
         Returns
         -------
             The identifier of the job that was executed, or `JobId.NONE` if the call returned because of a signal on the wait queue.
+
+        Raises
+        ------
+            Any exception raised by the executed job. The job must still be completed by a later call to `JobContext.complete_job`.
         """
-        return _mc.run_next_job_no_completion(self._internal)
+        return _run_next_job_only(self._internal)
 
 
 
@@ -616,6 +1070,7 @@ class JobSystemThread(threading.Thread):
         context   : The `JobContext` owned by the thread, which is used to interact with the `JobSystem`. This field is only valid after the thread has started.
         wait_queue: The `JobQueue` on which the thread waits for work to execute.
         exit_code : An integer value indicating the reason for thread termination.
+        cpu       : The index of the logical processor the thread pins itself to when it starts, or `None` to let the thread migrate freely. Assigned by `JobSystem.launch_threads`.
     """
     EXIT_SUCCESS  : int =  0 # The thread exited normally
     EXIT_INTERRUPT: int =  1 # The thread exited due to a SIGINT
@@ -633,6 +1088,7 @@ class JobSystemThread(threading.Thread):
         self.wait_queue  : JobQueue   = wait_queue
         self.system      : JobSystem  = owner
         self.context     : JobContext = None
+        self.cpu         : int        = None
         owner.register_thread(self)
 
     def __str__(self) -> str:
@@ -676,7 +1132,7 @@ class JobSystemThread(threading.Thread):
         -------
             Return `True` to continue thread execution, or `False` to terminate the thread.
         """
-        if signal == JobQueueSignal.TERMINATE:
+        if signal == _SIG_TERMINATE:
             return self._terminate_thread()
         else:
             return True
@@ -705,29 +1161,28 @@ class JobSystemThread(threading.Thread):
         """
         ctx    : JobContext = self.context
         queue  : JobQueue   = self.wait_queue
-        running: bool       = True
-        signal : int        = JobQueueSignal.NONE
-        job_id : int        = JobId.NONE
-        NO_JOB : int        = JobId.NONE
 
         if ctx is None:
             return self._terminate_thread(JobSystemThread.EXIT_FAILURE, f'The thread {self.ident} ({self.name}) has no bound JobContext')
         if queue is None:
             return self._terminate_thread(JobSystemThread.EXIT_FAILURE, f'The thread {self.ident} ({self.name}) has no bound JobQueue to wait on')
 
-        while running:
-            # Release the GIL and wait for a job to become ready on the queue.
-            # If a job is acquired, it is executed and completed and the job exit code is returned.
-            job_id = ctx.run_next_job()
-            if job_id == NO_JOB:
-                signal = queue.get_signal()
-                running = self._handle_signal(signal)
+        # The wait/execute/complete loop runs in native code with the GIL released while waiting.
+        # Python is re-entered only to execute jobs and, if a derived class overrides _handle_signal, to pass each wait queue signal to it.
+        if type(self)._handle_signal is JobSystemThread._handle_signal:
+            _mc.run_default_worker(ctx._internal)
+            self._terminate_thread()
+        else:
+            _mc.run_worker_loop(ctx._internal, self._handle_signal)
 
     def run(self) -> None:
         """
         The entry point for the thread. Override `JobSystemThread._thread_main` to control the thread run loop.
         """
         running: bool = True
+        if self.cpu is not None:
+            # Pin before the JobContext is acquired so the memory the thread touches first is local to its processor.
+            _mc.set_thread_affinity(self.cpu)
         while running: 
             # Acquire a new, fresh JobContext for executing work.
             with self.system.acquire_context(wait_queue=self.wait_queue, thread_id=self.ident) as ctx:
@@ -742,3 +1197,5 @@ class JobSystemThread(threading.Thread):
                 except Exception as other: # Handle other exceptions that might occur.
                     running = self._handle_exception(other)
                     self.context = None
+            # The JobContext has been released; don't keep a reference to it.
+            self.context = None
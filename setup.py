@@ -1,4 +1,5 @@
 import os
+import json
 import setuptools
 
 from   distutils.core import Extension
@@ -46,7 +47,7 @@ MOXIE_CORE_POSIX_DEFINES          = [
     # None
 ]
 MOXIE_CORE_POWER_DEFINES          = [
-    # None
+    ('_GNU_SOURCE'                , '1'                                 )
 ]
 MOXIE_CORE_WINOS_DEFINES          = [
     # None
@@ -72,6 +73,7 @@ MOXIE_CORE_WINOS_INCLUDE_DIRS     = [
 ]
 
 MOXIE_CORE_COMMON_HEADER_FILES    = [
+    'moxie/_moxie_core/include/internal/atomic_fences.h',
     'moxie/_moxie_core/include/internal/memory.h',
     'moxie/_moxie_core/include/internal/platform.h',
     'moxie/_moxie_core/include/internal/rtloader.h',
@@ -150,17 +152,23 @@ MOXIE_CORE_WINOS_LIBRARY_FILES    = [
     # None
 ]
 
-MOXIE_CORE_LINUX_CCFLAGS          = ['-O0', '-g', '-fstrict-aliasing']
-MOXIE_CORE_MACOS_CCFLAGS          = ['-O0', '-g', '-fstrict-aliasing']
+MOXIE_CORE_LINUX_CCFLAGS          = ['-O3', '-fstrict-aliasing', '-fno-plt', '-flto', '-fvisibility=hidden', '-fno-semantic-interposition']
+MOXIE_CORE_MACOS_CCFLAGS          = ['-O3', '-fstrict-aliasing', '-flto', '-fvisibility=hidden']
 MOXIE_CORE_POSIX_CCFLAGS          = ['-pthread']
-MOXIE_CORE_POWER_CCFLAGS          = ['-O0', '-g', '-fstrict-aliasing']
-MOXIE_CORE_WINOS_CCFLAGS          = []
+MOXIE_CORE_POWER_CCFLAGS          = ['-O3', '-fstrict-aliasing', '-fno-plt', '-flto', '-fvisibility=hidden', '-fno-semantic-interposition', '-mcpu=power9']
+MOXIE_CORE_WINOS_CCFLAGS          = ['/O2', '/GL', '/Oi', '/Gy']
+MOXIE_CORE_ARM64_CCFLAGS          = ['-march=armv8-a+lse']
 
-MOXIE_CORE_LINUX_LDFLAGS          = []
-MOXIE_CORE_MACOS_LDFLAGS          = []
+MOXIE_CORE_LINUX_LDFLAGS          = ['-flto', '-Wl,-O1']
+MOXIE_CORE_MACOS_LDFLAGS          = ['-flto']
 MOXIE_CORE_POSIX_LDFLAGS          = []
-MOXIE_CORE_POWER_LDFLAGS          = []
-MOXIE_CORE_WINOS_LDFLAGS          = []
+MOXIE_CORE_POWER_LDFLAGS          = ['-flto', '-Wl,-O1']
+MOXIE_CORE_WINOS_LDFLAGS          = ['/LTCG']
+
+MOXIE_DEBUG_ENV_VAR               = 'MOXIE_DEBUG'
+MOXIE_CORE_DEBUG_CCFLAGS          = ['-O0', '-g', '-fstrict-aliasing']
+MOXIE_CORE_WINOS_DEBUG_CCFLAGS    = ['/Od', '/Zi']
+MOXIE_CORE_WINOS_DEBUG_LDFLAGS    = ['/DEBUG']
 
 MOXIE_CORE_PLATFORM_DEFINES       = []
 MOXIE_CORE_PLATFORM_CCFLAGS       = []
@@ -178,6 +186,22 @@ PLATFORM_NAME_POWER               = 'Power'
 PLATFORM_NAME_WINOS               = 'Windows'
 PLATFORM_NAME                     = PLATFORM_NAME_UNKNOWN
 
+MOXIE_BUILD_MANIFEST_PATH         = os.path.join(MODULE_ROOT, '_build_manifest_{}.json')
+MOXIE_BUILD_MANIFEST_NAMES        = {
+    PLATFORM_NAME_LINUX           : 'linux',
+    PLATFORM_NAME_MACOS           : 'macos',
+    PLATFORM_NAME_POWER           : 'power',
+    PLATFORM_NAME_WINOS           : 'winos'
+}
+
+MOXIE_PGO_ENV_VAR                 = 'MOXIE_PGO'
+MOXIE_PGO_PROFILE_DIR             = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'moxie.pgo')
+
+MOXIE_MYPYC_ENV_VAR               = 'MOXIE_MYPYC'
+MOXIE_MYPYC_MODULES               = [
+    'moxie/memory.py'
+]
+
 
 def detect_platform():
     """
@@ -220,13 +244,107 @@ def detect_platform():
         return False
 
 
-def make_moxie_core_extension():
+def get_pgo_flags():
     """
-    Set up the build environment based on the current target platform and construct the `distutils.core.Extension` object for the _moxie_core extension.
+    Determine the additional compiler and linker flags for a profile-guided optimization (PGO) build of the _moxie_core extension.
+    PGO is enabled by setting the `MOXIE_PGO` environment variable to `generate` (build an instrumented extension that writes profile data to `moxie.pgo` when run) or `use` (rebuild using the recorded profile data).
+    A typical sequence is `MOXIE_PGO=generate python setup.py build_ext --force`, then `python jobsample.py` to record a profile, then `MOXIE_PGO=use python setup.py build_ext --force`.
+    Both builds must use the same build directory so that profile data can be matched to object files.
 
     Returns
     -------
-      A `distutils.core.Extension` object defining the extension.
+      A tuple `(ccflags, ldflags)` of lists of flags, both of which are empty if PGO is not enabled.
+    """
+    global PLATFORM_NAME
+    global PLATFORM_NAME_MACOS
+    global PLATFORM_NAME_WINOS
+    mode: str = os.environ.get(MOXIE_PGO_ENV_VAR, '').lower()
+    if not mode:
+        return [], []
+
+    if mode not in ('generate', 'use'):
+        raise RuntimeError(f'Unsupported value {mode!r} for {MOXIE_PGO_ENV_VAR}; expected generate or use.')
+
+    print(f'STATUS: {MOXIE_PGO_ENV_VAR}={mode}; profile data directory is {MOXIE_PGO_PROFILE_DIR}.')
+    if PLATFORM_NAME == PLATFORM_NAME_WINOS:
+        pgd: str = os.path.join(MOXIE_PGO_PROFILE_DIR, '_moxie_core.pgd')
+        if mode == 'generate':
+            return [], [f'/GENPROFILE:PGD={pgd}']
+        return [], [f'/USEPROFILE:PGD={pgd}']
+
+    if PLATFORM_NAME == PLATFORM_NAME_MACOS:
+        # Clang writes raw .profraw files; merge them with `xcrun llvm-profdata merge -o moxie.pgo/default.profdata moxie.pgo/*.profraw` before the use build.
+        if mode == 'generate':
+            return [f'-fprofile-generate={MOXIE_PGO_PROFILE_DIR}'], [f'-fprofile-generate={MOXIE_PGO_PROFILE_DIR}']
+        profdata: str = os.path.join(MOXIE_PGO_PROFILE_DIR, 'default.profdata')
+        return [f'-fprofile-instr-use={profdata}'], [f'-fprofile-instr-use={profdata}']
+
+    if mode == 'generate':
+        return [f'-fprofile-generate={MOXIE_PGO_PROFILE_DIR}'], [f'-fprofile-generate={MOXIE_PGO_PROFILE_DIR}']
+    return [f'-fprofile-use={MOXIE_PGO_PROFILE_DIR}', '-fprofile-correction', '-Wno-missing-profile'], [f'-fprofile-use={MOXIE_PGO_PROFILE_DIR}']
+
+
+def get_build_manifest_name(arm64: bool=False):
+    """
+    Determine the name of the prebuilt build manifest for the current target platform.
+
+    Parameters
+    ----------
+      arm64: Specify `True` if the target is a 64-bit ARM (aarch64) Linux system.
+
+    Returns
+    -------
+      A `str` such as `linux` or `linux_aarch64`, used to select the file `moxie/_build_manifest_{name}.json`.
+    """
+    global PLATFORM_NAME
+    global PLATFORM_NAME_LINUX
+    name: str = MOXIE_BUILD_MANIFEST_NAMES[PLATFORM_NAME]
+    if PLATFORM_NAME == PLATFORM_NAME_LINUX and arm64:
+        name += '_aarch64'
+    return name
+
+
+def load_build_manifest(arm64: bool=False):
+    """
+    Load the prebuilt `Extension` arguments for the current target platform, as written by `tools/gen_build_manifest.py`.
+    The manifests describe the default optimized build only, so they are not used when `MOXIE_DEBUG` or `MOXIE_PGO` is set.
+
+    Parameters
+    ----------
+      arm64: Specify `True` if the target is a 64-bit ARM (aarch64) Linux system.
+
+    Returns
+    -------
+      A `dict` of keyword arguments for `distutils.core.Extension`, or `None` if the manifest should not or cannot be used.
+    """
+    if os.environ.get(MOXIE_DEBUG_ENV_VAR, '0') == '1' or os.environ.get(MOXIE_PGO_ENV_VAR, ''):
+        return None
+
+    path: str = MOXIE_BUILD_MANIFEST_PATH.format(get_build_manifest_name(arm64))
+    try:
+        with open(path, 'r') as manifest:
+            kwargs: dict = json.load(manifest)
+    except (OSError, ValueError) as _:
+        return None
+
+    # JSON has no tuples; define_macros must be a list of (name, value) tuples.
+    kwargs['define_macros'] = [tuple(macro) for macro in kwargs['define_macros']]
+    print(f'STATUS: Using prebuilt build manifest {path}.')
+    return kwargs
+
+
+def resolve_moxie_core_extension_args(arm64: bool=False):
+    """
+    Set up the build environment based on the current target platform and resolve the arguments for the `distutils.core.Extension` object for the _moxie_core extension.
+    Profile-guided optimization flags are not included; see `get_pgo_flags`.
+
+    Parameters
+    ----------
+      arm64: Specify `True` if the target is a 64-bit ARM (aarch64) Linux system.
+
+    Returns
+    -------
+      A `dict` of keyword arguments for `distutils.core.Extension`.
     """
     global PLATFORM_NAME
     global PLATFORM_NAME_UNKNOWN
@@ -252,9 +370,21 @@ def make_moxie_core_extension():
     global MOXIE_CORE_COMMON_HEADER_FILES , MOXIE_CORE_LINUX_HEADER_FILES , MOXIE_CORE_MACOS_HEADER_FILES , MOXIE_CORE_POSIX_HEADER_FILES , MOXIE_CORE_POWER_HEADER_FILES , MOXIE_CORE_WINOS_HEADER_FILES
     global MOXIE_CORE_COMMON_SOURCE_FILES , MOXIE_CORE_LINUX_SOURCE_FILES , MOXIE_CORE_MACOS_SOURCE_FILES , MOXIE_CORE_POSIX_SOURCE_FILES , MOXIE_CORE_POWER_SOURCE_FILES , MOXIE_CORE_WINOS_SOURCE_FILES
     global MOXIE_CORE_COMMON_LIBRARY_FILES, MOXIE_CORE_LINUX_LIBRARY_FILES, MOXIE_CORE_MACOS_LIBRARY_FILES,                                 MOXIE_CORE_POWER_LIBRARY_FILES, MOXIE_CORE_WINOS_LIBRARY_FILES
-    global                                  MOXIE_CORE_LINUX_CCFLAGS      , MOXIE_CORE_MACOS_CCFLAGS      , MOXIE_CORE_POSIX_CCFLAGS      , MOXIE_CORE_POWER_CCFLAGS      , MOXIE_CORE_WINOS_CCFLAGS
+    global                                  MOXIE_CORE_LINUX_CCFLAGS      , MOXIE_CORE_MACOS_CCFLAGS      , MOXIE_CORE_POSIX_CCFLAGS      , MOXIE_CORE_POWER_CCFLAGS      , MOXIE_CORE_WINOS_CCFLAGS      , MOXIE_CORE_ARM64_CCFLAGS
     global                                  MOXIE_CORE_LINUX_LDFLAGS      , MOXIE_CORE_MACOS_LDFLAGS      , MOXIE_CORE_POSIX_LDFLAGS      , MOXIE_CORE_POWER_LDFLAGS      , MOXIE_CORE_WINOS_LDFLAGS
 
+    if os.environ.get(MOXIE_DEBUG_ENV_VAR, '0') == '1':
+        # Unoptimized build with debug info, for stepping through the extension in a debugger.
+        print(f'STATUS: {MOXIE_DEBUG_ENV_VAR}=1; building _moxie_core without optimization.')
+        MOXIE_CORE_LINUX_CCFLAGS          = MOXIE_CORE_DEBUG_CCFLAGS
+        MOXIE_CORE_MACOS_CCFLAGS          = MOXIE_CORE_DEBUG_CCFLAGS
+        MOXIE_CORE_POWER_CCFLAGS          = MOXIE_CORE_DEBUG_CCFLAGS + ['-mcpu=power9']
+        MOXIE_CORE_WINOS_CCFLAGS          = MOXIE_CORE_WINOS_DEBUG_CCFLAGS
+        MOXIE_CORE_LINUX_LDFLAGS          = []
+        MOXIE_CORE_MACOS_LDFLAGS          = []
+        MOXIE_CORE_POWER_LDFLAGS          = []
+        MOXIE_CORE_WINOS_LDFLAGS          = MOXIE_CORE_WINOS_DEBUG_LDFLAGS
+
     if PLATFORM_NAME == PLATFORM_NAME_LINUX:
         MOXIE_CORE_PLATFORM_DEFINES       = MOXIE_CORE_LINUX_DEFINES      + MOXIE_CORE_POSIX_DEFINES
         MOXIE_CORE_PLATFORM_INCLUDE_DIRS  = MOXIE_CORE_LINUX_INCLUDE_DIRS + MOXIE_CORE_POSIX_INCLUDE_DIRS
@@ -264,6 +394,10 @@ def make_moxie_core_extension():
         MOXIE_CORE_PLATFORM_LIBRARIES     = MOXIE_CORE_LINUX_LIBRARY_FILES
         MOXIE_CORE_PLATFORM_CCFLAGS       = MOXIE_CORE_LINUX_CCFLAGS      + MOXIE_CORE_POSIX_CCFLAGS
         MOXIE_CORE_PLATFORM_LDFLAGS       = MOXIE_CORE_LINUX_LDFLAGS      + MOXIE_CORE_POSIX_LDFLAGS
+        if arm64:
+            # Emit single-instruction LSE atomics (casal, ldadd) rather than LL/SC retry loops. Requires ARMv8.1 or later.
+            # Apple Silicon compilers target an LSE-capable CPU by default, so no flag is needed for macOS.
+            MOXIE_CORE_PLATFORM_CCFLAGS  += MOXIE_CORE_ARM64_CCFLAGS
     
     elif PLATFORM_NAME == PLATFORM_NAME_MACOS:
         MOXIE_CORE_PLATFORM_DEFINES       = MOXIE_CORE_MACOS_DEFINES      + MOXIE_CORE_POSIX_DEFINES
@@ -299,7 +433,7 @@ def make_moxie_core_extension():
     else:
         raise RuntimeError('Unable to set up build environment; unrecognized target platform.')
 
-    return Extension(
+    return dict(
         name               = '_moxie_core',
         sources            = MOXIE_CORE_COMMON_SOURCE_FILES + MOXIE_CORE_PLATFORM_SOURCES, 
         libraries          = MOXIE_CORE_PLATFORM_LIBRARIES,
@@ -312,43 +446,99 @@ def make_moxie_core_extension():
     )
 
 
-if not detect_platform():
-    raise RuntimeError('Failed to determine the target runtime platform.')
-
-setup(
-    name                          = MODULE_NAME,
-    version                       = MODULE_VERSION_STRING,
-    author                        = MODULE_AUTHOR,
-    author_email                  = MODULE_AUTHOR_EMAIL,
-    url                           = MODULE_BASE_URL,
-    project_urls                  = {
-        'Bug Tracker'             : MODULE_ISSUES_URL
-    },
-    description                   = MODULE_DESCRIPTION,
-    long_description              = MODULE_LONG_DESCRIPTION,
-    long_description_content_type = 'text/markdown',
-    classifiers                   = [
-        'Programming Language :: Python :: 3',
-        'Programming Language :: C',
-        'Programming Language :: Python :: Implementation :: CPython',
-        'Development Status :: 3 - Alpha',
-        'Intended Audience :: Developers',
-        'License :: Other/Proprietary License',
-        'Natural Language :: English',
-        'Operating System :: MacOS :: MacOS X',
-        'Operating System :: Microsoft :: Windows',
-        'Operating System :: POSIX :: Linux',
-        'Operating System :: POSIX :: Other',
-        'Topic :: Scientific/Engineering',
-        'Topic :: Software Development :: Libraries'
-    ],
-    python_requires              = '>=3.8',
-    ext_modules                  = [
-        make_moxie_core_extension()
-    ],
-    data_files                   = [
-        ('moxie/_moxie_core/include'         , ['moxie/_moxie_core/include/moxie_core.h']),
-        ('moxie/_moxie_core/include/internal', ['moxie/_moxie_core/include/internal/memory.h', 'moxie/_moxie_core/include/internal/platform.h', 'moxie/_moxie_core/include/internal/rtloader.h', 'moxie/_moxie_core/include/internal/scheduler.h', 'moxie/_moxie_core/include/internal/version.h'])
-    ],
-    packages                     = setuptools.find_namespace_packages(include=['moxie','moxie.*'])
-)
+def make_moxie_core_extension():
+    """
+    Construct the `distutils.core.Extension` object for the _moxie_core extension for the current target platform.
+    The arguments are loaded from the prebuilt build manifest when one is available, and are otherwise resolved by `resolve_moxie_core_extension_args`.
+
+    Returns
+    -------
+      A `distutils.core.Extension` object defining the extension.
+    """
+    global PLATFORM_NAME
+    global PLATFORM_NAME_UNKNOWN
+    if PLATFORM_NAME == PLATFORM_NAME_UNKNOWN:
+        raise RuntimeError('Unable to set up build environment; unrecognized target platform.')
+
+    arm64 : bool = 'aarch64' in get_platform().lower()
+    kwargs: dict = load_build_manifest(arm64)
+    if kwargs is None:
+        kwargs = resolve_moxie_core_extension_args(arm64)
+
+    pgo_ccflags, pgo_ldflags = get_pgo_flags()
+    kwargs['extra_compile_args'] = kwargs['extra_compile_args'] + pgo_ccflags
+    kwargs['extra_link_args'   ] = kwargs['extra_link_args'   ] + pgo_ldflags
+    return Extension(**kwargs)
+
+
+def make_mypyc_extensions():
+    """
+    Optionally compile the pure-Python wrapper modules listed in `MOXIE_MYPYC_MODULES` to C extensions using mypyc.
+    Compilation is enabled by setting the `MOXIE_MYPYC` environment variable to `1`.
+    The compiled extension takes precedence over the `.py` source at import time; if mypyc is not installed, compilation fails, or compilation is not enabled, the pure-Python modules are used.
+
+    Returns
+    -------
+      A list of `distutils.core.Extension` objects for the compiled modules, which may be empty.
+    """
+    if os.environ.get(MOXIE_MYPYC_ENV_VAR, '0') != '1':
+        return []
+
+    try:
+        from mypyc.build import mypycify
+    except ImportError:
+        print(f'WARNING: {MOXIE_MYPYC_ENV_VAR}=1 but mypyc is not installed; using the pure-Python modules.')
+        return []
+
+    print(f'STATUS: Compiling {MOXIE_MYPYC_MODULES} with mypyc.')
+    try:
+        return mypycify(MOXIE_MYPYC_MODULES)
+    except (SystemExit, Exception):
+        print(f'WARNING: {MOXIE_MYPYC_ENV_VAR}=1 but mypyc compilation failed; using the pure-Python modules.')
+        return []
+
+
+if __name__ == '__main__':
+    if not detect_platform():
+        raise RuntimeError('Failed to determine the target runtime platform.')
+
+    setup(
+        name                          = MODULE_NAME,
+        version                       = MODULE_VERSION_STRING,
+        author                        = MODULE_AUTHOR,
+        author_email                  = MODULE_AUTHOR_EMAIL,
+        url                           = MODULE_BASE_URL,
+        project_urls                  = {
+            'Bug Tracker'             : MODULE_ISSUES_URL
+        },
+        description                   = MODULE_DESCRIPTION,
+        long_description              = MODULE_LONG_DESCRIPTION,
+        long_description_content_type = 'text/markdown',
+        classifiers                   = [
+            'Programming Language :: Python :: 3',
+            'Programming Language :: C',
+            'Programming Language :: Python :: Implementation :: CPython',
+            'Development Status :: 3 - Alpha',
+            'Intended Audience :: Developers',
+            'License :: Other/Proprietary License',
+            'Natural Language :: English',
+            'Operating System :: MacOS :: MacOS X',
+            'Operating System :: Microsoft :: Windows',
+            'Operating System :: POSIX :: Linux',
+            'Operating System :: POSIX :: Other',
+            'Topic :: Scientific/Engineering',
+            'Topic :: Software Development :: Libraries'
+        ],
+        python_requires              = '>=3.8',
+        ext_modules                  = [
+            make_moxie_core_extension()
+        ] + make_mypyc_extensions(),
+        data_files                   = [
+            ('moxie/_moxie_core/include'         , ['moxie/_moxie_core/include/moxie_core.h']),
+            ('moxie/_moxie_core/include/internal', ['moxie/_moxie_core/include/internal/atomic_fences.h', 'moxie/_moxie_core/include/internal/memory.h', 'moxie/_moxie_core/include/internal/platform.h', 'moxie/_moxie_core/include/internal/rtloader.h', 'moxie/_moxie_core/include/internal/scheduler.h', 'moxie/_moxie_core/include/internal/version.h'])
+        ],
+        packages                     = setuptools.find_namespace_packages(include=['moxie','moxie.*']),
+        package_data                 = {
+            'moxie'                  : ['_moxie_core.pyi']
+        }
+    )
@@ -0,0 +1,12 @@
+import os
+import sys
+import subprocess
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def test_build_manifests_are_current():
+    script = os.path.join(REPO_ROOT, 'tools', 'gen_build_manifest.py')
+    result = subprocess.run([sys.executable, script, '--check'], cwd=REPO_ROOT, capture_output=True, text=True)
+    assert result.returncode == 0, result.stdout
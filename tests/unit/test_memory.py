@@ -0,0 +1,154 @@
+import os
+from   array import array
+
+import pytest
+
+from   moxie.memory import MemoryAllocator
+
+
+def test_allocate_many_sequence():
+    arena  = MemoryAllocator(4096)
+    allocs = arena.allocate_many([8, 16, 100], 32)
+    assert [a.length for a in allocs] == [8, 16, 100]
+    assert all(a.address % 32 == 0 for a in allocs)
+
+def test_allocate_many_buffer():
+    arena  = MemoryAllocator(4096)
+    allocs = arena.allocate_many(array('q', [64] * 10))
+    assert len(allocs) == 10
+    assert len({a.address for a in allocs}) == 10
+
+def test_allocate_many_invalid_length():
+    arena  = MemoryAllocator(4096)
+    with pytest.raises(ValueError):
+        arena.allocate_many([8, 0])
+
+@pytest.mark.parametrize('chunk_size,alignment', [(4096, -1), (4096, 24), (16, 16), (1 << 20, 1 << 20)])
+def test_create_invalid_arguments(chunk_size, alignment):
+    with pytest.raises(ValueError):
+        MemoryAllocator(chunk_size, alignment)
+
+def test_shared_allocator_per_thread():
+    import threading
+    from   moxie.memory import get_shared_allocator
+
+    arena  = get_shared_allocator(65536)
+    assert get_shared_allocator(65536) is arena
+    other  = []
+    thread = threading.Thread(target=lambda: other.append(get_shared_allocator(65536)))
+    thread.start()
+    thread.join()
+    assert other[0] is not arena
+
+def test_scope_rolls_back():
+    arena = MemoryAllocator(4096)
+    first = arena.allocate(64)
+    with arena.scope():
+        arena.allocate(256)
+    assert arena.allocate(64).address == first.address + 64
+
+def test_allocate_uses_arena_alignment():
+    arena = MemoryAllocator(8192, 64)
+    arena.allocate(1)
+    assert arena.allocate(1).address % 64 == 0
+    assert arena.allocate_aligned(1, 256).address % 256 == 0
+
+def test_name_and_tag_are_canonicalized():
+    arena = MemoryAllocator(4096)
+    assert arena.name is None
+    assert arena.tag.to_bytes(4, 'little') == b'NONE'
+    arena = MemoryAllocator(4096, name='scratch', tag='SCRA')
+    assert arena.name == 'scratch'
+    assert arena.tag.to_bytes(4, 'little') == b'SCRA'
+
+def test_release_reuses_allocation_object():
+    arena = MemoryAllocator(4096)
+    alloc = arena.allocate(64)
+    arena.release(alloc)
+    assert alloc.address == 0 and alloc.length == 0
+    with pytest.raises(BufferError):
+        memoryview(alloc)
+    alloc_id = id(alloc)
+    del alloc
+    again = arena.allocate(32)
+    assert id(again) == alloc_id
+    assert again.length == 32 and again.address != 0
+
+def test_release_does_not_recycle_live_allocation():
+    arena = MemoryAllocator(4096)
+    alloc = arena.allocate(64)
+    arena.release(alloc)
+    again = arena.allocate(32)
+    assert again is not alloc
+    assert alloc.address == 0 and alloc.length == 0
+
+def test_release_checks_arena_identity():
+    first  = MemoryAllocator(4096)
+    second = MemoryAllocator(4096)
+    alloc  = first.allocate(64)
+    with pytest.raises(ValueError):
+        second.release(alloc)
+    assert alloc.length == 64
+
+def test_growth_factor_validation():
+    with pytest.raises(ValueError):
+        MemoryAllocator(4096, growth_factor=1.0)
+    with pytest.raises(ValueError):
+        MemoryAllocator(4096, max_chunk_size=1024)
+    arena = MemoryAllocator(4096, growth_factor=2.0, max_chunk_size=16384)
+    for _ in range(16):
+        assert arena.allocate(4000) is not None
+
+def test_reset_decommits_virtual_memory():
+    arena = MemoryAllocator(1 << 20, virtual_memory=True, growable=False)
+    mark  = arena.mark()
+    alloc = arena.allocate(1 << 19)
+    memoryview(alloc)[:] = b'\xff' * (1 << 19)
+    arena.reset_to(mark, threshold=0)
+    alloc = arena.allocate(1 << 19)
+    assert bytes(memoryview(alloc)[:16]) == b'\x00' * 16
+    arena.reset(threshold=0)
+
+def test_buffer_is_unsigned_bytes():
+    arena = MemoryAllocator(4096)
+    view  = memoryview(arena.allocate(32))
+    assert view.format == 'B' and view.itemsize == 1
+    assert view.shape == (32,) and view.contiguous and not view.readonly
+
+def test_prefault_virtual_arena():
+    arena = MemoryAllocator(1 << 20, virtual_memory=True, prefault=True)
+    assert arena.prefault
+    alloc = arena.allocate(1 << 16)
+    assert bytes(memoryview(alloc)[:8]) == b'\x00' * 8
+
+def test_stats_counters():
+    arena = MemoryAllocator(4096, growable=False)
+    for _ in range(4):
+        arena.allocate(100)
+    arena.reset()
+    arena.allocate(16)
+    stats = arena.stats()
+    assert stats.n_allocations == 5 and stats.n_resets == 1
+    assert stats.bytes_used == 16 and stats.bytes_reserved == 4096
+    assert stats.peak_bytes >= 400
+
+def test_readonly_allocator():
+    from   moxie.memory import ReadOnlyMemoryAllocator
+
+    assert not MemoryAllocator(4096).readonly
+    arena = ReadOnlyMemoryAllocator(4096, virtual_memory=True)
+    assert arena.readonly
+    view  = memoryview(arena.allocate(64))
+    assert view.readonly and bytes(view[:4]) == b'\x00' * 4
+
+def test_memory_module_type_checks():
+    # The MOXIE_MYPYC build compiles moxie/memory.py with mypyc, which fails if mypy reports any errors.
+    api  = pytest.importorskip('mypy.api')
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    cwd  = os.getcwd()
+    os.chdir(root)
+    try:
+        stdout, stderr, status = api.run(['moxie/memory.py'])
+    finally:
+        os.chdir(cwd)
+    assert status == 0, stdout + stderr
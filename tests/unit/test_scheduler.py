@@ -0,0 +1,424 @@
+import ctypes
+import os
+import threading
+import time
+
+from array import array
+
+import pytest
+
+from moxie.scheduler import JobId
+from moxie.scheduler import FastSignal
+from moxie.scheduler import JobQueue
+from moxie.scheduler import JobSystem
+from moxie.scheduler import JobContext
+from moxie.scheduler import JobQueuePolicy
+from moxie.scheduler import JobQueueSignal
+from moxie.scheduler import JobSubmitType
+from moxie.scheduler import JobSubmitResult
+from moxie.scheduler import JobSystemThread
+
+
+POLICIES = [JobQueuePolicy.SHARED, JobQueuePolicy.STEALING]
+
+
+def _run_with_workers(body, worker_count: int=2, policy: JobQueuePolicy=JobQueuePolicy.SHARED):
+    system  = JobSystem(context_count=worker_count + 1, queue_policy=policy)
+    queue   = system.get_queue(queue_id=1)
+    workers = [JobSystemThread(name=f'Worker {i}', wait_queue=queue, owner=system) for i in range(worker_count)]
+    system.launch_threads()
+    try:
+        with system.acquire_context(queue) as ctx:
+            body(system, queue, ctx)
+    finally:
+        system.terminate_threads(timeout=5.0)
+        system.unregister_all_threads()
+    for worker in workers:
+        assert not worker.is_alive()
+        assert worker.exit_code == JobSystemThread.EXIT_SUCCESS
+
+
+@pytest.mark.parametrize('policy', POLICIES)
+def test_submit_job_runs_on_worker(policy):
+    done = threading.Event()
+
+    def job_main(job: int, jobctx: JobContext) -> int:
+        done.set()
+        return 0
+
+    def body(system, queue, ctx):
+        job = ctx.create_job(callable=job_main)
+        assert ctx.submit_job(job, JobSubmitType.RUN) is JobSubmitResult.SUCCESS
+        assert done.wait(timeout=5.0)
+
+    _run_with_workers(body, policy=policy)
+
+
+@pytest.mark.parametrize('policy', POLICIES)
+def test_submit_jobs_batch_with_dependencies(policy):
+    order = []
+    lock  = threading.Lock()
+    done  = threading.Event()
+
+    def job_main(job: int, jobctx: JobContext, name: str) -> int:
+        with lock:
+            order.append(name)
+            if len(order) == 3:
+                done.set()
+        return 0
+
+    def body(system, queue, ctx):
+        a = ctx.create_job(callable=job_main, name='a')
+        b = ctx.create_job(callable=job_main, name='b')
+        c = ctx.create_job(callable=job_main, name='c')
+        assert ctx.submit_jobs([c, a, b], JobSubmitType.RUN, target=queue, dependencies=[[a, b], None, None]) is JobSubmitResult.SUCCESS
+        assert done.wait(timeout=5.0)
+        assert order[-1] == 'c'
+
+    _run_with_workers(body, policy=policy)
+
+
+@pytest.mark.parametrize('policy', POLICIES)
+def test_submit_batch_orders_by_index_dependencies(policy):
+    order = []
+    lock  = threading.Lock()
+    done  = threading.Event()
+
+    def job_main(job: int, jobctx: JobContext, name: str) -> int:
+        with lock:
+            order.append(name)
+            if len(order) == 3:
+                done.set()
+        return 0
+
+    def body(system, queue, ctx):
+        with pytest.raises(ValueError):
+            ctx.submit_batch([(job_main, JobId.NONE, {'name': 'a'}, JobSubmitType.RUN, [0])])
+        with pytest.raises(ValueError):
+            ctx.submit_batch([
+                (job_main, JobId.NONE, {'name': 'a'}, JobSubmitType.RUN, [2]),
+                (job_main, JobId.NONE, {'name': 'b'}, JobSubmitType.RUN, [0]),
+                (job_main, JobId.NONE, {'name': 'c'}, JobSubmitType.RUN, [1]),
+            ])
+        specs = [
+            (job_main, JobId.NONE, {'name': 'c'}, JobSubmitType.RUN, [1, 2]),
+            (job_main, JobId.NONE, {'name': 'a'}, JobSubmitType.RUN, None),
+            (job_main, JobId.NONE, {'name': 'b'}, JobSubmitType.RUN, None),
+        ]
+        jobs, result = ctx.submit_batch(specs, target=queue)
+        assert result is JobSubmitResult.SUCCESS
+        assert len(set(jobs)) == 3
+        assert done.wait(timeout=5.0)
+        assert order[-1] == 'c'
+
+    _run_with_workers(body, policy=policy)
+
+
+@pytest.mark.parametrize('policy', POLICIES)
+def test_submit_jobs_reports_invalid_jobs(policy):
+    done = threading.Event()
+
+    def job_main(job: int, jobctx: JobContext) -> int:
+        done.set()
+        return 0
+
+    def body(system, queue, ctx):
+        a = ctx.create_job(callable=job_main)
+        result = ctx.submit_jobs([0, a], JobSubmitType.RUN)
+        assert result == [JobSubmitResult.INVALID_JOB, JobSubmitResult.SUCCESS]
+        assert done.wait(timeout=5.0)
+
+    _run_with_workers(body, policy=policy)
+
+
+@pytest.mark.parametrize('policy', POLICIES)
+def test_nested_fan_out_completes(policy):
+    count = []
+    lock  = threading.Lock()
+    done  = threading.Event()
+    total = 200
+
+    def leaf_main(job: int, jobctx: JobContext) -> int:
+        with lock:
+            count.append(job)
+        return 0
+
+    def spawn_main(job: int, jobctx: JobContext) -> int:
+        children = [jobctx.create_job(callable=leaf_main, parent=job) for _ in range(total)]
+        assert jobctx.submit_jobs(children, JobSubmitType.RUN) is JobSubmitResult.SUCCESS
+        return 0
+
+    def end_main(job: int, jobctx: JobContext) -> int:
+        done.set()
+        return 0
+
+    def body(system, queue, ctx):
+        spawn = ctx.create_job(callable=spawn_main)
+        end   = ctx.create_job(callable=end_main)
+        assert ctx.submit_job(spawn, JobSubmitType.RUN) is JobSubmitResult.SUCCESS
+        assert ctx.submit_job(end, JobSubmitType.RUN, dependencies=[spawn]) is JobSubmitResult.SUCCESS
+        assert done.wait(timeout=10.0)
+        assert len(count) == total
+
+    _run_with_workers(body, worker_count=4, policy=policy)
+
+
+@pytest.mark.parametrize('count', [2, 3, 5])
+def test_submit_job_waits_for_all_dependencies(count):
+    order = []
+    lock  = threading.Lock()
+    done  = threading.Event()
+
+    def job_main(job: int, jobctx: JobContext, name: str) -> int:
+        with lock:
+            order.append(name)
+        if name == 'last':
+            done.set()
+        return 0
+
+    def body(system, queue, ctx):
+        deps = [ctx.create_job(callable=job_main, name=f'dep{i}') for i in range(count)]
+        last = ctx.create_job(callable=job_main, name='last')
+        assert ctx.submit_job(last, JobSubmitType.RUN, target=queue, dependencies=deps) is JobSubmitResult.SUCCESS
+        assert ctx.submit_jobs(deps, JobSubmitType.RUN) is JobSubmitResult.SUCCESS
+        assert done.wait(timeout=5.0)
+        assert len(order) == count + 1 and order[-1] == 'last'
+
+    _run_with_workers(body)
+
+
+@pytest.mark.parametrize('policy', POLICIES)
+def test_wait_for_job_parks_until_completion(policy):
+    results = []
+    done    = threading.Event()
+
+    def slow_main(job: int, jobctx: JobContext) -> int:
+        time.sleep(0.05)
+        return 0
+
+    def wait_main(job: int, jobctx: JobContext, target: int) -> int:
+        results.append(jobctx.wait_for_job(target, spin_count=0))
+        done.set()
+        return 0
+
+    def body(system, queue, ctx):
+        slow = ctx.create_job(callable=slow_main)
+        wait = ctx.create_job(callable=wait_main, target=slow)
+        assert ctx.submit_jobs([slow, wait], JobSubmitType.RUN) is JobSubmitResult.SUCCESS
+        assert done.wait(timeout=5.0)
+        assert results == [1]
+
+    _run_with_workers(body, policy=policy)
+
+
+def test_create_job_by_registered_entry():
+    values = []
+    done   = threading.Event()
+
+    def job_main(job: int, jobctx: JobContext, value: int) -> int:
+        values.append(value)
+        done.set()
+        return 0
+
+    def body(system, queue, ctx):
+        entry = ctx.register_entry(job_main)
+        assert ctx.register_entry(job_main) == entry
+        with pytest.raises(ValueError):
+            ctx.create_job_by_id(entry + 1)
+        job = ctx.create_job_by_id(entry, value=42)
+        assert ctx.submit_job(job, JobSubmitType.RUN) is JobSubmitResult.SUCCESS
+        assert done.wait(timeout=5.0)
+        assert values == [42]
+
+    _run_with_workers(body)
+
+
+def test_create_job_fast_passes_positional_args():
+    values = []
+    done   = threading.Event()
+
+    def job_main(value: int, job: int, jobctx: JobContext) -> int:
+        values.append(value)
+        done.set()
+        return 0
+
+    def body(system, queue, ctx):
+        with pytest.raises(TypeError):
+            ctx.create_job_fast(job_main, [42])
+        job = ctx.create_job_fast(job_main, (42,))
+        assert ctx.submit_job(job, JobSubmitType.RUN) is JobSubmitResult.SUCCESS
+        assert done.wait(timeout=5.0)
+        assert values == [42]
+
+    _run_with_workers(body)
+
+
+def test_signal_one_sets_and_clears_signal():
+    system = JobSystem(context_count=1)
+    queue  = system.get_queue(queue_id=1)
+    queue.signal_one(JobQueueSignal.USER)
+    queue.signal_one(JobQueueSignal.USER)
+    assert queue.get_signal() == JobQueueSignal.USER
+    queue.clear_signal()
+    assert queue.get_signal() == JobQueueSignal.CLEAR
+
+
+def test_submit_jobs_buf_writes_int8_results():
+    done = threading.Event()
+
+    def job_main(job: int, jobctx: JobContext) -> int:
+        done.set()
+        return 0
+
+    def body(system, queue, ctx):
+        a   = ctx.create_job(callable=job_main)
+        out = ctx.submit_jobs_buf([0, a], JobSubmitType.RUN)
+        assert list(out) == [JobSubmitResult.INVALID_JOB, JobSubmitResult.SUCCESS]
+        assert done.wait(timeout=5.0)
+        with pytest.raises(ValueError):
+            ctx.submit_jobs_buf([0, 0], JobSubmitType.RUN, out=array('b', bytes(1)))
+        with pytest.raises(TypeError):
+            ctx.submit_jobs_buf([0], JobSubmitType.RUN, out=array('i', [0]))
+
+    _run_with_workers(body)
+
+
+def test_overridden_signal_handler_receives_terminate():
+    signals = []
+
+    class RecordingThread(JobSystemThread):
+        def _handle_signal(self, signal: int) -> bool:
+            signals.append(signal)
+            return super()._handle_signal(signal)
+
+    system = JobSystem(context_count=2)
+    queue  = system.get_queue(queue_id=1)
+    worker = RecordingThread(name='Recording', wait_queue=queue, owner=system)
+    system.launch_threads()
+    system.terminate_threads(timeout=5.0)
+    system.unregister_all_threads()
+    assert not worker.is_alive()
+    assert worker.exit_code == JobSystemThread.EXIT_SUCCESS
+    assert signals == [JobQueueSignal.TERMINATE]
+
+
+def test_released_context_is_not_aliased():
+    system = JobSystem(context_count=1)
+    queue  = system.get_queue(queue_id=1)
+    with system.acquire_context(queue) as first:
+        assert system.contexts == [first]
+    assert system.contexts == []
+    assert first.system is None and first.thread_id is None
+    with system.acquire_context(queue) as second:
+        assert second is not first
+        assert second.thread_id == threading.get_ident()
+        assert system.contexts == [second]
+        first.release() # Releasing again has no effect, and must not touch the new context.
+        assert second._internal is not None
+        assert system.contexts == [second]
+
+
+@pytest.mark.parametrize('policy', POLICIES)
+def test_try_run_next_job_does_not_block(policy):
+    ran = []
+
+    def job_main(job: int, jobctx: JobContext) -> int:
+        ran.append(job)
+        return 0
+
+    system = JobSystem(context_count=1, queue_policy=policy)
+    queue  = system.get_queue(queue_id=1)
+    with system.acquire_context(queue) as ctx:
+        assert ctx.try_run_next_job() == JobId.NONE
+        job = ctx.create_job(callable=job_main)
+        assert ctx.submit_job(job, JobSubmitType.RUN) is JobSubmitResult.SUCCESS
+        assert ctx.try_run_next_job() == job
+        assert ctx.try_run_next_job() == JobId.NONE
+    assert ran == [job]
+
+
+@pytest.mark.parametrize('policy', POLICIES)
+def test_job_exceptions_propagate_to_caller(policy):
+    def job_main(job: int, jobctx: JobContext) -> int:
+        raise KeyError(job)
+
+    system = JobSystem(context_count=1, queue_policy=policy)
+    queue  = system.get_queue(queue_id=1)
+    with system.acquire_context(queue) as ctx:
+        job = ctx.create_job(callable=job_main)
+        assert ctx.submit_job(job, JobSubmitType.RUN) is JobSubmitResult.SUCCESS
+        with pytest.raises(KeyError):
+            ctx.run_next_job()
+        job = ctx.create_job(callable=job_main)
+        assert ctx.submit_job(job, JobSubmitType.RUN) is JobSubmitResult.SUCCESS
+        with pytest.raises(KeyError):
+            ctx.wait_for_job(job, spin_count=0)
+        job = ctx.create_job(callable=job_main)
+        assert ctx.submit_job(job, JobSubmitType.RUN) is JobSubmitResult.SUCCESS
+        with pytest.raises(KeyError):
+            ctx.run_next_job_without_completion()
+        ctx.complete_job(job)
+
+
+def test_native_job_runs_with_argument():
+    values = []
+    done   = threading.Event()
+
+    @ctypes.CFUNCTYPE(ctypes.c_int32, ctypes.c_uint32, ctypes.c_size_t)
+    def native_main(job, arg):
+        values.append(arg)
+        done.set()
+        return 0
+
+    def body(system, queue, ctx):
+        with pytest.raises(TypeError):
+            ctx.create_native_job('not a function')
+        with pytest.raises(TypeError):
+            ctx.create_native_job(ctypes.cast(native_main, ctypes.c_void_p).value)
+        with pytest.raises(TypeError):
+            ctx.create_native_job(ctypes.CFUNCTYPE(ctypes.c_int32)(lambda: 0))
+        with pytest.raises(TypeError):
+            ctx.create_native_job(ctypes.CFUNCTYPE(ctypes.c_int32, ctypes.c_double, ctypes.c_char_p)(lambda job, arg: 0))
+        job = ctx.create_native_job(native_main, arg=42)
+        assert ctx.submit_job(job, JobSubmitType.RUN) is JobSubmitResult.SUCCESS
+        assert done.wait(timeout=5.0)
+        assert values == [42]
+
+    _run_with_workers(body)
+
+
+def test_fast_signal_wakes_all_waiters():
+    signal  = FastSignal()
+    results = []
+    assert not signal.is_set()
+    assert not signal.wait(timeout=0.01)
+    waiters = [threading.Thread(target=lambda: results.append(signal.wait(timeout=5.0))) for _ in range(2)]
+    for waiter in waiters:
+        waiter.start()
+    signal.set()
+    signal.set()
+    for waiter in waiters:
+        waiter.join(timeout=5.0)
+    assert results == [True, True]
+    assert signal.is_set()
+    assert signal.wait()
+    signal.close()
+
+
+def test_launch_threads_pins_workers():
+    system  = JobSystem(context_count=2)
+    queue   = system.get_queue(queue_id=1)
+    worker  = JobSystemThread(name='Pinned', wait_queue=queue, owner=system)
+    system.launch_threads(pin_threads=True)
+    try:
+        assert worker.cpu is not None
+        deadline = time.monotonic() + 5.0
+        while worker.context is None and time.monotonic() < deadline:
+            time.sleep(0.001) # The worker pins itself before acquiring its context.
+        if hasattr(os, 'sched_getaffinity'):
+            assert worker.cpu in os.sched_getaffinity(0)
+            assert os.sched_getaffinity(worker.native_id) == {worker.cpu}
+    finally:
+        system.terminate_threads(timeout=5.0)
+        system.unregister_all_threads()
+    assert worker.exit_code == JobSystemThread.EXIT_SUCCESS
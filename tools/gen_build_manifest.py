@@ -0,0 +1,75 @@
+"""
+Generate the prebuilt build manifests loaded by `setup.py`.
+
+Each manifest records the resolved `distutils.core.Extension` arguments for the _moxie_core extension on one target platform, so that `setup.py` does not need to evaluate its per-platform configuration on every build.
+Re-run this script after changing any of the `MOXIE_CORE_*` lists in `setup.py`, and commit the updated manifests:
+
+    python tools/gen_build_manifest.py
+
+Run with `--check` to exit with a non-zero status if any manifest is missing or out of date, without writing anything.
+"""
+import os
+import sys
+import json
+
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+# The manifests describe the default optimized build; debug and PGO builds always resolve their arguments in setup.py.
+os.environ.pop('MOXIE_DEBUG', None)
+os.environ.pop('MOXIE_PGO'  , None)
+
+import setup as moxie_setup # noqa: E402 - setup.py only calls setup() when run as a script
+
+
+def generate_manifests():
+    """
+    Resolve the extension arguments for every supported target platform.
+
+    Returns
+    -------
+      A `dict` mapping manifest file path to the manifest contents as a JSON `str`.
+    """
+    targets  = [
+        (moxie_setup.PLATFORM_NAME_LINUX, False),
+        (moxie_setup.PLATFORM_NAME_LINUX, True ),
+        (moxie_setup.PLATFORM_NAME_MACOS, False),
+        (moxie_setup.PLATFORM_NAME_POWER, False),
+        (moxie_setup.PLATFORM_NAME_WINOS, False)
+    ]
+    manifests = {}
+    for platform_name, arm64 in targets:
+        moxie_setup.PLATFORM_NAME = platform_name
+        kwargs = moxie_setup.resolve_moxie_core_extension_args(arm64)
+        path   = moxie_setup.MOXIE_BUILD_MANIFEST_PATH.format(moxie_setup.get_build_manifest_name(arm64))
+        manifests[path] = json.dumps(kwargs, indent=4) + '\n'
+    return manifests
+
+
+def main(argv):
+    check: bool = '--check' in argv
+    stale: list = []
+    for path, contents in generate_manifests().items():
+        try:
+            with open(path, 'r') as manifest:
+                current = manifest.read()
+        except OSError as _:
+            current = None
+
+        if current == contents:
+            continue
+        if check:
+            stale.append(path)
+        else:
+            with open(path, 'w') as manifest:
+                manifest.write(contents)
+            print(f'STATUS: Wrote {os.path.relpath(path, REPO_ROOT)}.')
+
+    for path in stale:
+        print(f'ERROR: {os.path.relpath(path, REPO_ROOT)} is missing or out of date; run tools/gen_build_manifest.py.')
+    return 1 if stale else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))